@@ -0,0 +1,152 @@
+"""
+Shared headless browser for crawling.
+Crawl4aiTools starts a new browser for every URL and crawls a list of URLs one
+after another. BrowserPool starts one browser on first use and crawls through a
+bounded set of reusable sessions (a browser context and page each), so URLs are
+fetched concurrently and a multi-page answer takes about as long as its slowest
+page. Every URL has its own timeout; a session whose page timed out or failed is
+discarded and recreated on its next use.
+
+Usage (batch crawl from the command line):
+    python browser_pool.py https://blog.hugovalverde.com https://portfolio.hugovalverde.com --contexts 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+
+def result_content(result, max_length: Optional[int] = None) -> str:
+    """Extract markdown from a crawl4ai result the way Crawl4aiTools does."""
+    if not result:
+        return "Error: No content found"
+    content = ""
+    if getattr(result, "fit_markdown", None):
+        content = result.fit_markdown
+    elif getattr(result, "markdown", None):
+        markdown = result.markdown
+        content = getattr(markdown, "fit_markdown", None) or getattr(markdown, "raw_markdown", None) or str(markdown)
+    elif getattr(result, "text", None):
+        content = result.text
+    if not content:
+        return f"Error: No readable content extracted{': ' + result.error_message if getattr(result, 'error_message', None) else ''}"
+    if max_length and len(content) > max_length:
+        content = content[:max_length] + "..."
+    return content
+
+
+class BrowserPool:
+    """One headless browser with at most `contexts` pages crawling at the same time."""
+
+    def __init__(self, toolkit, contexts: int = 4, url_timeout: float = 20.0):
+        """
+        Args:
+            toolkit: Crawl4aiTools supplying the browser and crawl settings (headless,
+                proxy, wait_until, content filters, max_length)
+            contexts: Reusable browser sessions, i.e. pages crawled concurrently
+            url_timeout: Seconds before a single URL's crawl is abandoned
+        """
+        self.toolkit = toolkit
+        self.contexts = contexts
+        self.url_timeout = url_timeout
+        self._crawler = None
+        self._sessions: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self.stats = {"crawls": 0, "timeouts": 0, "errors": 0, "sessions_reset": 0}
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._crawler is not None:
+                return
+            from crawl4ai import AsyncWebCrawler, BrowserConfig
+            crawler = AsyncWebCrawler(config=BrowserConfig(
+                headless=self.toolkit.headless,
+                verbose=False,
+                **self.toolkit.proxy_config,
+            ))
+            await crawler.start()
+            self._sessions = asyncio.Queue()
+            for i in range(self.contexts):
+                self._sessions.put_nowait(f"agent-crawl-{i}")
+            self._crawler = crawler
+
+    async def _reset_session(self, session_id: str) -> None:
+        self.stats["sessions_reset"] += 1
+        try:
+            await self._crawler.crawler_strategy.kill_session(session_id)
+        except Exception:
+            pass
+
+    async def crawl(self, url: str, search_query: Optional[str] = None) -> str:
+        """Crawl one URL in a free session, giving up after `url_timeout` seconds."""
+        from crawl4ai import CrawlerRunConfig
+
+        await self.start()
+        session_id = await self._sessions.get()
+        try:
+            config = CrawlerRunConfig(**self.toolkit._build_config(search_query), session_id=session_id)
+            result = await asyncio.wait_for(self._crawler.arun(url=url, config=config), timeout=self.url_timeout)
+            self.stats["crawls"] += 1
+            return result_content(result, self.toolkit.max_length)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            await self._reset_session(session_id)
+            return f"Error crawling {url}: timed out after {self.url_timeout:.0f}s"
+        except Exception as e:
+            self.stats["errors"] += 1
+            await self._reset_session(session_id)
+            return f"Error crawling {url}: {str(e)}"
+        finally:
+            self._sessions.put_nowait(session_id)
+
+    async def crawl_many(self, urls: List[str], search_query: Optional[str] = None) -> Dict[str, str]:
+        """Crawl `urls` concurrently, at most `contexts` at a time."""
+        results = await asyncio.gather(*(self.crawl(url, search_query) for url in urls))
+        return dict(zip(urls, results))
+
+    async def close(self) -> None:
+        if self._crawler is not None:
+            await self._crawler.close()
+            self._crawler = None
+
+
+def pool_from_env(toolkit) -> BrowserPool:
+    """BrowserPool sized by CRAWL_BROWSER_CONTEXTS (default 4) with CRAWL_URL_TIMEOUT seconds per URL (default 20)."""
+    return BrowserPool(
+        toolkit,
+        contexts=int(os.getenv('CRAWL_BROWSER_CONTEXTS', '4')),
+        url_timeout=float(os.getenv('CRAWL_URL_TIMEOUT', '20')),
+    )
+
+
+async def _batch(urls: List[str], contexts: int, url_timeout: float, search_query: Optional[str]) -> None:
+    from agno.tools.crawl4ai import Crawl4aiTools
+
+    pool = BrowserPool(Crawl4aiTools(), contexts=contexts, url_timeout=url_timeout)
+    started = time.perf_counter()
+    try:
+        await pool.start()
+        print(f"Browser started in {time.perf_counter() - started:.1f}s")
+
+        async def timed(url: str):
+            url_started = time.perf_counter()
+            content = await pool.crawl(url, search_query)
+            print(f"{time.perf_counter() - url_started:6.1f}s  {len(content):7d} chars  {url}"
+                  f"{'  ' + content[:120] if content.startswith('Error') else ''}")
+
+        await asyncio.gather(*(timed(url) for url in urls))
+    finally:
+        await pool.close()
+    print(f"{len(urls)} URLs in {time.perf_counter() - started:.1f}s ({pool.stats})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl several URLs concurrently through one shared browser")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--contexts", type=int, default=4, help="Pages crawled at the same time")
+    parser.add_argument("--timeout", type=float, default=20.0, help="Seconds per URL")
+    parser.add_argument("--search-query", help="Keep only content matching this query (BM25)")
+    args = parser.parse_args()
+    asyncio.run(_batch(args.urls, args.contexts, args.timeout, args.search_query))
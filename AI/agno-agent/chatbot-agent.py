@@ -2,20 +2,83 @@ import asyncio
 import uuid
 import os
 import json
-from agno.agent import Agent
-from agno.models.openrouter import OpenRouter
-from agno.models.lmstudio import LMStudio
-from agno.tools.crawl4ai import Crawl4aiTools
-from agno.tools.mcp import MCPTools
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+import hashlib
+import sys
+import time
+from startup_timing import StartupTimer
+
+# Time the heavy imports; the report is printed once the server is ready
+startup = StartupTimer()
+with startup.measure("import agno"):
+    from agno.agent import Agent
+    from agno.run.agent import RunContentEvent, RunErrorEvent, RunOutput
+    from agno.models.openrouter import OpenRouter
+    from agno.models.lmstudio import LMStudio
+    from agno.tools.mcp import MCPTools
+with startup.measure("import fastapi"):
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import StreamingResponse
+    from pydantic import BaseModel
 from dotenv import load_dotenv
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Dict, Any, List, Optional
+
+# Modules shared with the MCP server live in AI/portfolio_common
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from portfolio_common import tracing
+from lazy_tools import LazyCrawl4aiTools
+from crawl_cache import cache_from_env, prefetch_urls_from_env
+from mcp_pool import CallMetaMCPTools, MCPSessionPool
+from run_memo import RunToolMemo
+from sse_replay import RunStreams
+from portfolio_common.deadline import deadline_meta, deadline_scope
+from contextlib import nullcontext
+from portfolio_common.profiling import get_profiler
 
 load_dotenv()
 
+# Endpoints default to the home lab hosts; override them to point the agent at a stub model or local MCP server
+MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://192.168.0.3:8017").rstrip("/")
+if not MCP_SERVER_URL.endswith("/mcp"):
+    MCP_SERVER_URL += "/mcp"
+LMSTUDIO_BASE_URL = os.getenv("LMSTUDIO_BASE_URL", "http://192.168.0.103:1234/v1")
+LMSTUDIO_MODEL = os.getenv("LMSTUDIO_MODEL", "openai/gpt-oss-20b")
+AGENT_PORT = int(os.getenv("AGENT_PORT", "8025"))
+# Concurrent runs each check out their own MCP session
+MCP_POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", "4"))
+MCP_HEALTH_CHECK_INTERVAL = float(os.getenv("MCP_HEALTH_CHECK_INTERVAL", "30"))
+# Longest a chat run may take; a request's deadline_seconds can only shorten it
+CHAT_DEADLINE_SECONDS = float(os.getenv("CHAT_DEADLINE_SECONDS", "120"))
+# How often a quiet stream checks whether its client is still connected
+DISCONNECT_POLL_SECONDS = float(os.getenv("DISCONNECT_POLL_SECONDS", "0.5"))
+# Runs stay resumable (Last-Event-ID) for SSE_RESUME_GRACE_SECONDS after their last client left,
+# then are cancelled; finished runs stay replayable for SSE_REPLAY_TTL seconds
+SSE_REPLAY_BYTES = int(os.getenv("SSE_REPLAY_BYTES", str(2 * 1024 * 1024)))
+SSE_REPLAY_TTL = float(os.getenv("SSE_REPLAY_TTL", "300"))
+SSE_RESUME_GRACE_SECONDS = float(os.getenv("SSE_RESUME_GRACE_SECONDS", "15"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+tracing.configure("chatbot-agent")
+
+# Output tokens are "delivered" when the run's answer reached the client and "wasted" when the
+# client left first; usage reported by the model, else one token per streamed chunk
+run_stats = {
+    "completed": 0,
+    "deadline_exceeded": 0,
+    "client_disconnected": 0,
+    "delivered_tokens": 0,
+    "wasted_tokens": 0,
+}
+
+async def trace_tool_call(function_name: str, function_call, arguments: Dict[str, Any]):
+    """Agent tool hook recording a span per tool call."""
+    with tracing.start_span(f"tool_call {function_name}", tool=function_name, arguments=arguments):
+        return await function_call(**arguments)
+
+# Repeated identical MCP tool calls within a run are answered from the run's memo
+tool_memo = RunToolMemo()
+
 # AG-UI Event Types
 class EventType:
     RUN_STARTED = "run_started"
@@ -34,6 +97,7 @@ class RunAgentInput(BaseModel):
     run_id: str
     messages: list
     tools: list = []
+    deadline_seconds: Optional[float] = None
 
 class BaseEvent(BaseModel):
     type: str
@@ -49,6 +113,7 @@ class RunFinishedEvent(BaseEvent):
 class RunErrorEvent(BaseEvent):
     type: str = EventType.RUN_ERROR
     message: str
+    code: Optional[str] = None
 
 class TextMessageStartEvent(BaseEvent):
     type: str = EventType.TEXT_MESSAGE_START
@@ -64,15 +129,29 @@ class TextMessageEndEvent(BaseEvent):
     type: str = EventType.TEXT_MESSAGE_END
     message_id: str
 
-async def create_portfolio_agent():
+def create_mcp_tools() -> MCPTools:
+    """Create an unconnected MCP toolkit; the session pool connects it."""
+    return CallMetaMCPTools(
+        transport="streamable-http",
+        url=MCP_SERVER_URL,
+        meta_providers=(deadline_meta, tracing.trace_meta),
+    )
+
+run_streams = RunStreams(max_bytes=SSE_REPLAY_BYTES, ttl=SSE_REPLAY_TTL, grace=SSE_RESUME_GRACE_SECONDS)
+mcp_pool = MCPSessionPool(create_mcp_tools, size=MCP_POOL_SIZE, health_check_interval=MCP_HEALTH_CHECK_INTERVAL)
+crawl_tools = LazyCrawl4aiTools(cache=cache_from_env())
+
+# One agent per pooled MCP session, built on its first checkout
+agents: Dict[int, Agent] = {}
+
+def agent_for(mcp_tools: MCPTools) -> Agent:
+    if id(mcp_tools) not in agents:
+        agents[id(mcp_tools)] = create_portfolio_agent(mcp_tools)
+    return agents[id(mcp_tools)]
+
+def create_portfolio_agent(mcp_tools: MCPTools) -> Agent:
     """Create and configure the portfolio agent with MCP tools."""
     
-    # Initialize MCP tools
-    mcp_tools = MCPTools(transport="streamable-http", url="http://192.168.0.3:8017/mcp")
-    
-    # Connect to MCP server
-    await mcp_tools.connect()
-    
     # Create agent with all tools
     agent = Agent(
         name="Portfolio Agent",
@@ -83,13 +162,14 @@ async def create_portfolio_agent():
         #     max_tokens=40000,
         # ),
         model=LMStudio(
-            id="openai/gpt-oss-20b",
-            base_url="http://192.168.0.103:1234/v1",
-            api_key="none",
+            id=LMSTUDIO_MODEL,
+            base_url=LMSTUDIO_BASE_URL,
+            api_key=os.getenv("LMSTUDIO_API_KEY", "none"),
             temperature=0.7,
             max_tokens=69900,
         ),
-        tools=[Crawl4aiTools(), mcp_tools],
+        tools=[crawl_tools, mcp_tools],
+        tool_hooks=[tool_memo.hook] + ([trace_tool_call] if tracing.enabled() else []),
         instructions="""
         You are Hugo's AI assistant, representing his portfolio and expertise. 
         You have access to Hugo's project data through the MCP server, which contains:
@@ -98,15 +178,17 @@ async def create_portfolio_agent():
         - Detailed project information, descriptions, and impact
         - The official portfolio page is located at https://portfolio.hugovalverde.com
         - Hugo has a blog located at https://blog.hugovalverde.com
-        - Riot Games related projects might be referred to as VCT, LTA, Valorant, League of Legends, LCS or MSI and they might be stored that way in the data accessible via MCP.
+        - Riot Games related projects might be referred to as VCT, LTA, Valorant, League of Legends, LCS or MSI; get_projects_by_client resolves these aliases for you.
         
         When answering questions about Hugo's work:
         - Use the MCP tools to get accurate, up-to-date information
+        - For broad questions, start with get_portfolio_digest for an overview of every project, then use get_project_by_id for details
         - Speak in first person as Hugo
         - Be specific about technologies, clients, and project outcomes
         - Highlight Hugo's expertise in AI engineering and real-time graphics
-        - When you pull technologies via MCP, make sure that despite the count number, you account for overly similar technologies listed, as the incoming data might be dirty.
-        - When you are asked about client work, make sure you're reading through all the projects, not just one page, to make sure you are accounting for everything.
+        - When you need technologies or technology counts, use get_canonical_technologies; duplicate spellings are already merged there, so do not deduplicate them yourself.
+        - When you are asked about client work, use get_projects_by_client; it returns every matching project in one call, so there is no need to page through all projects.
+        - For questions about blog posts or site content, use search_site_content first; crawl pages only if it finds nothing relevant.
 
         For other tasks, use the available tools as needed.
         Focus on retaining credibility and accuracy in your responses.
@@ -123,8 +205,68 @@ def encode_sse_event(event: BaseEvent) -> str:
     data = event.model_dump_json()
     return f"data: {data}\n\n"
 
-async def event_generator(agent: Agent, input_data: RunAgentInput) -> AsyncGenerator[str, None]:
-    """Generate AG-UI events from agent responses."""
+async def event_generator(input_data: RunAgentInput) -> AsyncGenerator[str, None]:
+    """Generate AG-UI events from agent responses, traced as one "chat.run" span per run_id."""
+    with tracing.start_span(
+        "chat.run",
+        trace_id=tracing.trace_id_for_run(input_data.run_id),
+        run_id=input_data.run_id,
+        thread_id=input_data.thread_id,
+    ) as run_span:
+        async for event in _run_events(input_data):
+            yield event
+        if run_span is not None:
+            run_span.set_attribute("messages", len(input_data.messages))
+
+def run_budget(input_data: RunAgentInput) -> float:
+    """Seconds the run may take: the request's deadline_seconds, capped at CHAT_DEADLINE_SECONDS."""
+    if input_data.deadline_seconds and input_data.deadline_seconds > 0:
+        return min(input_data.deadline_seconds, CHAT_DEADLINE_SECONDS)
+    return CHAT_DEADLINE_SECONDS
+
+def partial_answer(parts: List[str]) -> str:
+    """Answer for a run that hit its deadline: the text generated so far, or an apology."""
+    text = "".join(parts).strip()
+    if not text:
+        return "Sorry, I couldn't finish looking that up in time. Please try again, or ask a narrower question."
+    return f"{text}\n\n_(I ran out of time before finishing this answer.)_"
+
+def output_tokens(response, parts: List[str]) -> int:
+    """Output tokens of a run: the model's reported usage, else the number of streamed chunks."""
+    metrics = getattr(response, "metrics", None)
+    return getattr(metrics, "output_tokens", None) or len(parts)
+
+async def _run_agent(agent: Agent, prompt: str, run_id: str, parts: List[str]):
+    """
+    Run the agent under an "agent.run" span and release the run's MCP session afterwards.
+    Answer text is appended to `parts` as it is generated, so a run cut off by its deadline
+    still has its partial answer.
+    """
+    with tracing.start_span("agent.run", run_id=run_id) as span:
+        try:
+            response = None
+            async for event in agent.arun(prompt, run_id=run_id, stream=True, yield_run_output=True):
+                if isinstance(event, RunOutput):
+                    response = event
+                elif isinstance(event, RunContentEvent) and isinstance(event.content, str):
+                    parts.append(event.content)
+                elif isinstance(event, RunErrorEvent):
+                    raise RuntimeError(event.content or "Agent run failed")
+            metrics = getattr(response, "metrics", None)
+            if span is not None and metrics is not None:
+                span.set_attribute("input_tokens", getattr(metrics, "input_tokens", None))
+                span.set_attribute("output_tokens", getattr(metrics, "output_tokens", None))
+                span.set_attribute("time_to_first_token", getattr(metrics, "time_to_first_token", None))
+            return response
+        finally:
+            for toolkit in agent.tools or []:
+                if isinstance(toolkit, MCPTools):
+                    await toolkit.cleanup_run_session(run_id)
+
+async def _run_events(input_data: RunAgentInput) -> AsyncGenerator[str, None]:
+    response = None
+    answer_parts: List[str] = []
+    client_gone = False
     try:
         # Send run started event
         yield encode_sse_event(RunStartedEvent(
@@ -177,21 +319,51 @@ Please respond to the current user message while being aware of the conversation
             context_prompt = current_user_message
         
         # Get response from agent with conversation context
-        response = await agent.arun(context_prompt)
-        response_text = response.content if hasattr(response, 'content') else str(response)
+        # Opt-in: keep a profile of runs slower than PROFILE_SLOW_CALLS_MS
+        profiler = get_profiler()
+        profiled = profiler.profile("chat_run", input_data.run_id, {
+            "run_id": input_data.run_id,
+            "thread_id": input_data.thread_id,
+            "messages": len(input_data.messages),
+            "prompt": current_user_message[:500],
+        }) if profiler else nullcontext()
+        deadline = time.time() + run_budget(input_data)
+
+        async def run():
+            async with profiled, mcp_pool.checkout() as mcp_tools:
+                return await _run_agent(agent_for(mcp_tools), context_prompt, input_data.run_id, answer_parts)
+
+        # The deadline covers waiting for an MCP session, the model and every tool call;
+        # when it passes they are all cancelled and the visitor gets what was generated so far.
+        # Cancelling the run (its clients left, see RunStreams) cancels them too.
+        # The run's tool calls send the deadline to the MCP server (deadline.py).
+        try:
+            with deadline_scope(deadline):
+                response = await asyncio.wait_for(run(), timeout=deadline - time.time())
+            response_text = response.content if hasattr(response, 'content') else str(response)
+        except asyncio.TimeoutError:
+            if time.time() < deadline:
+                raise
+            run_stats["deadline_exceeded"] += 1
+            print(f"⏰ Run {input_data.run_id} hit its {run_budget(input_data):.0f}s deadline")
+            span = tracing.current_span()
+            if span is not None:
+                span.set_attribute("deadline_exceeded", True)
+            response_text = partial_answer(answer_parts)
         
         # Stream the response in chunks
         chunk_size = 10  # Characters per chunk for streaming effect
-        for i in range(0, len(response_text), chunk_size):
-            chunk = response_text[i:i + chunk_size]
-            yield encode_sse_event(TextMessageContentEvent(
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id,
-                message_id=message_id,
-                delta=chunk
-            ))
-            # Small delay for streaming effect
-            await asyncio.sleep(0.05)
+        with tracing.start_span("stream", characters=len(response_text)):
+            for i in range(0, len(response_text), chunk_size):
+                chunk = response_text[i:i + chunk_size]
+                yield encode_sse_event(TextMessageContentEvent(
+                    thread_id=input_data.thread_id,
+                    run_id=input_data.run_id,
+                    message_id=message_id,
+                    delta=chunk
+                ))
+                # Small delay for streaming effect
+                await asyncio.sleep(0.05)
         
         # Send text message end event
         yield encode_sse_event(TextMessageEndEvent(
@@ -205,14 +377,111 @@ Please respond to the current user message while being aware of the conversation
             thread_id=input_data.thread_id,
             run_id=input_data.run_id
         ))
+        run_stats["completed"] += 1
+        run_stats["delivered_tokens"] += output_tokens(response, answer_parts)
         
+    except (asyncio.CancelledError, GeneratorExit):
+        # Every client went away and none came back in time
+        client_gone = True
+        raise
     except Exception as error:
+        span = tracing.current_span()
+        if span is not None:
+            span.set_error(str(error))
         # Send error event
         yield encode_sse_event(RunErrorEvent(
             thread_id=input_data.thread_id,
             run_id=input_data.run_id,
             message=str(error)
         ))
+    finally:
+        # The run is over (finished, failed or abandoned by the client): drop its tool memo
+        if client_gone:
+            wasted = output_tokens(response, answer_parts)
+            run_stats["client_disconnected"] += 1
+            run_stats["wasted_tokens"] += wasted
+            print(f"🔌 Client left run {input_data.run_id}; stopped it after {wasted} output tokens")
+            span = tracing.current_span()
+            if span is not None:
+                span.set_attribute("client_disconnected", True)
+                span.set_attribute("wasted_tokens", wasted)
+        counts = tool_memo.finish(input_data.run_id)
+        if counts and counts["hits"]:
+            print(f"♻️  Run {input_data.run_id}: {counts['hits']} of {counts['calls']} tool calls answered from the run memo")
+            span = tracing.current_span()
+            if span is not None:
+                span.set_attribute("tool_memo_hits", counts["hits"])
+
+# RunErrorEvent code telling the client to start the run again under a new run_id
+RESUME_UNAVAILABLE = "resume_unavailable"
+
+def resume_error_event(input_data: RunAgentInput, last_event_id: int) -> str:
+    return encode_sse_event(RunErrorEvent(
+        thread_id=input_data.thread_id,
+        run_id=input_data.run_id,
+        message=f"Cannot resume run {input_data.run_id} after event {last_event_id}; please send the message again",
+        code=RESUME_UNAVAILABLE,
+    ))
+
+async def resume_error(input_data: RunAgentInput, last_event_id: int) -> AsyncGenerator[str, None]:
+    yield resume_error_event(input_data, last_event_id)
+
+def request_fingerprint(input_data: RunAgentInput) -> str:
+    """Digest of a chat request, so only a resend of the request that started a run can follow it."""
+    body = json.dumps([input_data.messages, input_data.tools, input_data.deadline_seconds], sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+async def run_id_in_use(input_data: RunAgentInput) -> AsyncGenerator[str, None]:
+    yield encode_sse_event(RunErrorEvent(
+        thread_id=input_data.thread_id,
+        run_id=input_data.run_id,
+        message=f"Run {input_data.run_id} already exists; send a new run_id to start another run",
+    ))
+
+def run_event_stream(input_data: RunAgentInput, request: Request) -> AsyncGenerator[str, None]:
+    """
+    SSE events for a chat request. A new (thread_id, run_id) starts a run in the background. A
+    request with a `Last-Event-ID` header that repeats one still running or finished recently
+    follows it from that event instead; any other request for a known run is refused.
+    """
+    header = request.headers.get("last-event-id")
+    try:
+        last_event_id = int(header) if header is not None else None
+    except ValueError:
+        last_event_id = 0
+    fingerprint = request_fingerprint(input_data)
+    stream = run_streams.get(input_data.thread_id, input_data.run_id)
+    if stream is None:
+        if last_event_id:
+            # The run is gone (finished too long ago, or the agent restarted)
+            return resume_error(input_data, last_event_id)
+        # A new run, or a resend before any event arrived (Last-Event-ID: 0) that never reached us
+        stream = run_streams.start(input_data.thread_id, input_data.run_id, fingerprint, event_generator(input_data))
+        last_event_id = 0
+    elif last_event_id is None or stream.fingerprint != fingerprint:
+        return run_id_in_use(input_data)
+    else:
+        run_streams.stats["resumed"] += 1
+        if not stream.can_resume(last_event_id):
+            return resume_error(input_data, last_event_id)
+    return stream.subscribe(
+        last_event_id,
+        heartbeat=SSE_HEARTBEAT_SECONDS,
+        poll=DISCONNECT_POLL_SECONDS,
+        is_disconnected=request.is_disconnected,
+        evicted_event=resume_error_event(input_data, last_event_id),
+    )
+
+async def connect_mcp_pool():
+    """Connect the MCP session pool in the background so the server can answer health checks meanwhile."""
+    started = asyncio.get_running_loop().time()
+    try:
+        await mcp_pool.start()
+        elapsed_ms = (asyncio.get_running_loop().time() - started) * 1000
+        print(f"✅ MCP session pool connected in {elapsed_ms:.0f} ms ({mcp_pool.status()['connected']}/{mcp_pool.size} sessions)")
+    except Exception as e:
+        # Sessions that failed connect again when a run checks them out
+        print(f"⚠️  MCP connect failed, retrying on the next request: {e}")
 
 async def run_agui_server():
     """Run the AG-UI compatible server."""
@@ -220,9 +489,6 @@ async def run_agui_server():
     print("🚀 Starting Hugo's Portfolio AI AG-UI Server...")
     print("=" * 50)
     
-    # Create the agent
-    agent = await create_portfolio_agent()
-    
     # Create FastAPI app
     app = FastAPI(title="Hugo's Portfolio AI Assistant - AG-UI Compatible")
     
@@ -239,7 +505,7 @@ async def run_agui_server():
     async def agentic_chat_endpoint(input_data: RunAgentInput, request: Request):
         """AG-UI compatible agentic chat endpoint."""
         return StreamingResponse(
-            event_generator(agent, input_data),
+            run_event_stream(input_data, request),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -258,19 +524,37 @@ async def run_agui_server():
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "agent_ready": agent is not None}
+        return {
+            "status": "healthy",
+            "agent_ready": mcp_pool.ready(),
+            "mcp_pool": mcp_pool.status(),
+            "tool_memo": tool_memo.totals,
+            "runs": run_stats,
+            "streams": run_streams.status(),
+        }
+    
+    @app.on_event("startup")
+    async def startup_event():
+        """Connect MCP in the background and report startup timings."""
+        asyncio.create_task(connect_mcp_pool())
+        # Warm the crawl cache in the background
+        prefetch_urls = prefetch_urls_from_env()
+        if prefetch_urls and crawl_tools.cache:
+            asyncio.create_task(crawl_tools.prefetch(prefetch_urls))
+        print("⏱️  Startup timings:")
+        print(startup.report())
     
     @app.on_event("shutdown")
     async def shutdown_event():
         """Clean up MCP connection on shutdown."""
-        if mcp_tools:
-            await mcp_tools.close()
+        await run_streams.close()
+        await mcp_pool.close()
+        await crawl_tools.close()
     
-    print("✅ Agent created successfully!")
-    print("✅ MCP tools initialized!")
     print("✅ AG-UI compatible server configured!")
+    print("🔌 Connecting to MCP in the background; web crawling loads on first use")
     print()
-    print("🌐 AG-UI server running at: http://192.168.0.3:8025")
+    print(f"🌐 AG-UI server running at: http://192.168.0.3:{AGENT_PORT}")
     print("🔗 Your Next.js portfolio can connect to this endpoint")
     print("📡 Server ready to receive AG-UI protocol requests")
     print("=" * 50)
@@ -278,7 +562,7 @@ async def run_agui_server():
     
     # Run the server
     import uvicorn
-    config = uvicorn.Config(app, host="0.0.0.0", port=8025)
+    config = uvicorn.Config(app, host="0.0.0.0", port=AGENT_PORT)
     server = uvicorn.Server(config)
     await server.serve()
 
@@ -0,0 +1,140 @@
+"""
+On-disk cache for crawled pages.
+A crawl loads the page in a headless browser, which often takes seconds, while the
+portfolio and blog pages change rarely. Entries are keyed by URL (and the BM25
+search query, which changes the extracted text) and stored as one JSON file each.
+
+Fresh entries (younger than the TTL) are served directly. Expired entries are
+revalidated with a plain conditional GET (If-None-Match / If-Modified-Since, or a
+hash of the page body when the server sends no validators); only a changed page
+is crawled again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+
+class CrawlCache:
+    """Disk-backed crawl results with TTL and conditional revalidation."""
+
+    def __init__(self, directory: str, ttl: float = 86400.0, revalidate_timeout: float = 5.0):
+        """
+        Args:
+            directory: Where entries are stored; created if missing
+            ttl: Seconds an entry is served without revalidation
+            revalidate_timeout: Timeout of the conditional GET
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.revalidate_timeout = revalidate_timeout
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "changed": 0}
+        self._lock = threading.Lock()
+        # Validators of changed pages seen by get(), reused by the put() that follows the crawl
+        self._probes: Dict[str, Dict[str, Any]] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, search_query: Optional[str]) -> str:
+        key = hashlib.sha256(f"{url}\n{search_query or ''}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: str, entry: Dict[str, Any]) -> None:
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def _probe(self, url: str, entry: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Conditional GET of the raw page. Returns its validators, or None if the server can't be reached."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            response = httpx.get(url, headers=headers, timeout=self.revalidate_timeout, follow_redirects=True)
+        except httpx.HTTPError:
+            return None
+        if response.status_code == 304:
+            return {"not_modified": True}
+        if response.status_code >= 400:
+            return None
+        return {
+            "not_modified": False,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "body_sha256": hashlib.sha256(response.content).hexdigest(),
+        }
+
+    def get(self, url: str, search_query: Optional[str] = None) -> Optional[str]:
+        """Return cached content that is fresh or still valid, or None if the page must be crawled."""
+        path = self._path(url, search_query)
+        entry = self._read(path)
+        if entry is None:
+            self._count("misses")
+            return None
+        if time.time() - entry["fetched_at"] < self.ttl:
+            self._count("hits")
+            return entry["content"]
+
+        probe = self._probe(url, entry)
+        unchanged = probe is not None and (
+            probe["not_modified"] or
+            (entry.get("body_sha256") is not None and probe["body_sha256"] == entry["body_sha256"])
+        )
+        if not unchanged:
+            self._count("changed")
+            if probe is not None:
+                self._probes[path] = probe
+            return None
+        entry["fetched_at"] = time.time()
+        self._write(path, entry)
+        self._count("revalidated")
+        return entry["content"]
+
+    def put(self, url: str, search_query: Optional[str], content: str) -> None:
+        """Store crawled content with the page's current validators."""
+        path = self._path(url, search_query)
+        probe = self._probes.pop(path, None)
+        if not isinstance(content, str) or content.startswith("Error"):
+            return
+        probe = probe or self._probe(url) or {}
+        self._write(path, {
+            "url": url,
+            "search_query": search_query,
+            "fetched_at": time.time(),
+            "etag": probe.get("etag"),
+            "last_modified": probe.get("last_modified"),
+            "body_sha256": probe.get("body_sha256"),
+            "content": content,
+        })
+
+
+def cache_from_env() -> Optional[CrawlCache]:
+    """CrawlCache in CRAWL_CACHE_DIR (default ./crawl_cache, empty to disable) with CRAWL_CACHE_TTL seconds."""
+    directory = os.getenv('CRAWL_CACHE_DIR', 'crawl_cache')
+    if not directory:
+        return None
+    return CrawlCache(directory, ttl=float(os.getenv('CRAWL_CACHE_TTL', '3600')))
+
+
+def prefetch_urls_from_env() -> List[str]:
+    """Comma-separated CRAWL_PREFETCH_URLS, crawled into the cache at startup."""
+    return [url.strip() for url in os.getenv('CRAWL_PREFETCH_URLS', '').split(',') if url.strip()]
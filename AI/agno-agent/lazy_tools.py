@@ -0,0 +1,95 @@
+"""
+Lazily loaded agent tools.
+Crawl4aiTools pulls in crawl4ai and Playwright at import time although most
+questions never crawl anything. LazyCrawl4aiTools exposes the same `crawl` tool
+to the model but imports crawl4ai on first use, crawls through a shared
+BrowserPool, and serves pages from a CrawlCache when one is given.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from agno.tools import Toolkit
+
+from browser_pool import BrowserPool, pool_from_env
+from crawl_cache import CrawlCache
+
+
+class LazyCrawl4aiTools(Toolkit):
+    """Crawl4aiTools stand-in that defers importing crawl4ai until the first crawl."""
+
+    def __init__(self, cache: Optional[CrawlCache] = None, **crawl4ai_kwargs: Any):
+        """
+        Args:
+            cache: Serve and store crawled pages on disk
+            crawl4ai_kwargs: Passed to Crawl4aiTools when it is first needed
+        """
+        super().__init__(name="crawl4ai_tools", tools=[self.crawl])
+        self.cache = cache
+        self._kwargs = crawl4ai_kwargs
+        self.pool: Optional[BrowserPool] = None
+        self._lock = asyncio.Lock()
+        self.load_ms: Optional[float] = None
+
+    async def _load(self) -> BrowserPool:
+        async with self._lock:
+            if self.pool is None:
+                started = time.perf_counter()
+                # Importing crawl4ai takes seconds; keep it off the event loop
+                toolkit = await asyncio.to_thread(self._create_toolkit)
+                self.pool = pool_from_env(toolkit)
+                self.load_ms = (time.perf_counter() - started) * 1000
+                print(f"🕷️  Loaded crawl4ai in {self.load_ms:.0f} ms")
+        return self.pool
+
+    def _create_toolkit(self):
+        from agno.tools.crawl4ai import Crawl4aiTools
+        return Crawl4aiTools(**self._kwargs)
+
+    async def crawl(self, url: Union[str, List[str]], search_query: Optional[str] = None) -> Union[str, Dict[str, str]]:
+        """
+        Crawl URLs and extract their text content. Several URLs are crawled in parallel.
+
+        Args:
+            url: Single URL string or list of URLs to crawl
+            search_query: Optional query string to filter content using BM25 algorithm
+
+        Returns:
+            The extracted text content from the URL(s)
+        """
+        if not url:
+            return "Error: No URL provided"
+        urls = [url] if isinstance(url, str) else list(url)
+        results: Dict[str, str] = {}
+        missing = []
+        for single_url in urls:
+            cached = await asyncio.to_thread(self.cache.get, single_url, search_query) if self.cache else None
+            if cached is None:
+                missing.append(single_url)
+            else:
+                results[single_url] = cached
+
+        if missing:
+            try:
+                pool = await self._load()
+            except ImportError as e:
+                return f"Error: Web crawling is unavailable: {e}"
+            crawled = await pool.crawl_many(missing, search_query)
+            for single_url, content in crawled.items():
+                results[single_url] = content
+                if self.cache:
+                    await asyncio.to_thread(self.cache.put, single_url, search_query, content)
+
+        return results[url] if isinstance(url, str) else {u: results[u] for u in urls}
+
+    async def prefetch(self, urls: List[str]) -> None:
+        """Crawl `urls` into the cache unless they are already cached and still valid."""
+        try:
+            await self.crawl(urls)
+        except Exception as e:
+            print(f"⚠️  Prefetch failed: {e}")
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            await self.pool.close()
@@ -0,0 +1,150 @@
+"""
+Pool of MCP client sessions for concurrent chat runs.
+Each run checks out its own MCPTools connection instead of sharing one session,
+and dead connections are found by health checks (MCP ping) and reconnected,
+so an MCP server restart no longer breaks every request until the agent restarts.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Any, List, Sequence
+
+from agno.tools.mcp import MCPTools
+
+from portfolio_common.mcp_meta import MetaProvider, send_call_meta
+
+
+class CallMetaMCPTools(MCPTools):
+    """
+    MCPTools whose tool calls carry per-call `_meta` (the calling run's deadline, its trace),
+    so runs with different deadlines and traces can share one pooled session.
+    """
+
+    def __init__(self, *args, meta_providers: Sequence[MetaProvider] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.meta_providers = tuple(meta_providers)
+
+    async def get_session_for_run(self, run_context=None, agent=None, team=None):
+        # Every tool call asks for its session here, so this covers the shared session,
+        # clients from reconnects and per-run sessions alike
+        session = await super().get_session_for_run(run_context=run_context, agent=agent, team=team)
+        send_call_meta(session, *self.meta_providers)
+        return session
+
+
+class MCPSessionPool:
+    """Fixed-size pool of MCPTools connections, checked out for one run at a time."""
+
+    def __init__(self, factory: Callable[[], MCPTools], size: int = 4, health_check_interval: float = 30.0,
+                 verify_after: float = 2.0, checkout_timeout: float = 30.0):
+        """
+        Args:
+            factory: Creates an unconnected MCPTools without a header_provider
+            size: Number of sessions, i.e. runs that can use MCP at the same time
+            health_check_interval: Seconds between pings of idle sessions
+            verify_after: A session not checked for this many seconds is pinged before it is
+                handed out; a ping costs one round trip, far less than a run on a dead session
+            checkout_timeout: Seconds to wait for a free session before failing the run
+        """
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.verify_after = verify_after
+        self.checkout_timeout = checkout_timeout
+        self.sessions: List[MCPTools] = [factory() for _ in range(size)]
+        if any(session.header_provider for session in self.sessions):
+            # MCPTools then opens a new session for every run, bypassing the pool and its health checks
+            raise ValueError("MCPSessionPool needs MCPTools without a header_provider; "
+                             "send per-run data in the tool call's _meta (CallMetaMCPTools)")
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for session in self.sessions:
+            self._idle.put_nowait(session)
+        self._last_checked: Dict[int, float] = {}
+        self._connected_once = set()
+        self._health_task = None
+        self.stats = {"checkouts": 0, "waits": 0, "connects": 0, "reconnects": 0,
+                      "failed_connects": 0, "failed_health_checks": 0}
+
+    async def start(self) -> None:
+        """Connect every session and start the health checks; sessions that fail connect on checkout."""
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+        results = await asyncio.gather(*(self._connect(s) for s in self.sessions if not s.initialized),
+                                       return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+    def ready(self) -> bool:
+        return any(session.initialized for session in self.sessions)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "connected": sum(1 for s in self.sessions if s.initialized),
+            "idle": self._idle.qsize(),
+            **self.stats,
+        }
+
+    async def _connect(self, session: MCPTools) -> None:
+        reconnect = id(session) in self._connected_once
+        # MCPTools.connect logs and swallows connection errors, so check the result
+        await session.connect(force=True)
+        if not session.initialized:
+            self.stats["failed_connects"] += 1
+            raise ConnectionError(f"Could not connect to MCP server at {session.url}")
+        self.stats["reconnects" if reconnect else "connects"] += 1
+        self._connected_once.add(id(session))
+        self._last_checked[id(session)] = time.monotonic()
+
+    async def _check(self, session: MCPTools) -> None:
+        """Reconnect the session if it is disconnected or does not answer a ping."""
+        if session.initialized:
+            if await session.is_alive():
+                self._last_checked[id(session)] = time.monotonic()
+                return
+            self.stats["failed_health_checks"] += 1
+            await session.close()
+        await self._connect(session)
+
+    @asynccontextmanager
+    async def checkout(self):
+        """Yield a connected MCPTools for the duration of one run."""
+        if self._idle.empty():
+            self.stats["waits"] += 1
+        session = await asyncio.wait_for(self._idle.get(), timeout=self.checkout_timeout)
+        failed = False
+        try:
+            last_checked = self._last_checked.get(id(session), 0.0)
+            if not session.initialized or time.monotonic() - last_checked > self.verify_after:
+                await self._check(session)
+            self.stats["checkouts"] += 1
+            yield session
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed:
+                # Check on the next checkout whether the run failed because of the connection
+                self._last_checked.pop(id(session), None)
+            self._idle.put_nowait(session)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            # Only idle sessions are checked; sessions in use are checked when returned and checked out again
+            for _ in range(self._idle.qsize()):
+                session = self._idle.get_nowait()
+                try:
+                    await self._check(session)
+                except Exception:
+                    pass
+                finally:
+                    self._idle.put_nowait(session)
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+        for session in self.sessions:
+            if session.initialized:
+                await session.close()
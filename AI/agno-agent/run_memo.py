@@ -0,0 +1,73 @@
+"""
+Per-run memoization of MCP tool calls.
+Models often repeat a tool call with the same arguments within one run (the same
+page of get_all_projects, get_project_statistics again and again). RunToolMemo is
+an agent tool hook: the first call of a tool with given arguments in a run goes
+to the MCP server, and repeats in the same run get that result back at once.
+Concurrent identical calls share one request. A run's memo is dropped when the
+run finishes, so results never leak between runs or go stale.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class RunToolMemo:
+    """Tool results keyed by run_id, tool name and arguments."""
+
+    def __init__(self, skip_prefixes: Iterable[str] = ("create_", "update_", "delete_", "set_", "bulk_"),
+                 skip: Iterable[str] = ("crawl",)):
+        """
+        Args:
+            skip_prefixes: Tools starting with these are never memoized (writes)
+            skip: Tool names never memoized (crawl has its own cache)
+        """
+        self.skip_prefixes = tuple(skip_prefixes)
+        self.skip = frozenset(skip)
+        self._runs: Dict[str, Dict[Tuple[str, str], asyncio.Future]] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self.totals = {"runs": 0, "calls": 0, "hits": 0}
+
+    def memoizable(self, function_name: str) -> bool:
+        return function_name not in self.skip and not function_name.startswith(self.skip_prefixes)
+
+    async def hook(self, function_name: str, function_call: Callable, arguments: Dict[str, Any], run_context):
+        """Agent tool hook; pass as `tool_hooks=[memo.hook]`."""
+        run_id = getattr(run_context, "run_id", None)
+        if run_id is None or not self.memoizable(function_name):
+            return await function_call(**arguments)
+
+        memo = self._runs.setdefault(run_id, {})
+        counts = self._counts.setdefault(run_id, {"calls": 0, "hits": 0})
+        counts["calls"] += 1
+        self.totals["calls"] += 1
+        key = (function_name, json.dumps(arguments, sort_keys=True, default=str))
+        if key in memo:
+            counts["hits"] += 1
+            self.totals["hits"] += 1
+            return await asyncio.shield(memo[key])
+
+        future = asyncio.get_running_loop().create_future()
+        memo[key] = future
+        try:
+            result = await function_call(**arguments)
+        except BaseException as e:
+            # Failed calls are not memoized; callers already waiting get the same error
+            memo.pop(key, None)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        future.set_result(result)
+        return result
+
+    def finish(self, run_id: str) -> Optional[Dict[str, int]]:
+        """Drop the run's memo and return its {"calls", "hits"} counts (None if it made no memoizable calls)."""
+        self._runs.pop(run_id, None)
+        counts = self._counts.pop(run_id, None)
+        if counts is not None:
+            self.totals["runs"] += 1
+        return counts
@@ -1,66 +1,197 @@
-import asyncio
-from agno.agent import Agent
-from agno.models.openrouter import OpenRouter
-from agno.tools.crawl4ai import Crawl4aiTools
-from agno.tools.mcp import MCPTools
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-
-async def run_agent(message: str) -> None:
-    """Run the portfolio agent with the given message."""
-    
-    # Initialize and connect to the MCP server
-    mcp_tools = MCPTools(transport="streamable-http", url="http://localhost:8017/mcp")
-    await mcp_tools.connect()
-    
-    try:
-        # Create agent with all tools
-        agent = Agent(
-            name="Portfolio Agent",
-            model=OpenRouter(
-                id="x-ai/grok-4-fast:free",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-                temperature=0.7,
-                max_tokens=40000,
-            ),
-            tools=[Crawl4aiTools(), mcp_tools],
-            instructions="""
-            You are Hugo's AI assistant, representing his portfolio and expertise. 
-            You have access to Hugo's project data through the MCP server, which contains:
-            - All projects across AI and real-time graphics
-            - Many different technologies
-            - Detailed project information, descriptions, and impact
-            - The official portfolio page is located at https://portfolio.hugovalverde.com
-            - Hugo has a blog located at https://blog.hugovalverde.com
-            - Riot Games related projects might be referred to as VCT, LTA, Valorant, League of Legends, LCS or MSI and they might be stored that way in the data accessible via MCP.
-            
-            When answering questions about Hugo's work:
-            - Use the MCP tools to get accurate, up-to-date information
-            - Speak in first person as Hugo
-            - Be specific about technologies, clients, and project outcomes
-            - Highlight Hugo's expertise in AI engineering and real-time graphics
-            - When you pull technologies via MCP, make sure that despite the count number, you account for overly similar technologies listed, as the incoming data might be dirty.
-            - When you are asked about client work, make sure you're reading through all the projects, not just one page, to make sure you are accounting for everything.
-
-            For other tasks, use the available tools as needed.
-            Focus on retaining credibility and accuracy in your responses.
-            Do not make up information.
-            Do not provide claims that you are not sure about.
-            Do not confirm or extend claims that are not backed up by the data accessible via MCP.
-            """,
-            markdown=True,
-        )
-        
-        # Run the agent
-        await agent.aprint_response(message, stream=True)
-        
-    finally:
-        # Always close the connection when done
-        await mcp_tools.close()
-
-# Example usage
-if __name__ == "__main__":
-    # Test with a portfolio-related question
-    asyncio.run(run_agent("Tell me about Hugo's AI projects and his full experience with Riot Games."))
\ No newline at end of file
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from startup_timing import StartupTimer
+
+startup = StartupTimer()
+with startup.measure("import agno"):
+    from agno.agent import Agent
+    from agno.models.openrouter import OpenRouter
+    from agno.tools.mcp import MCPTools
+from dotenv import load_dotenv
+import os
+from typing import Dict, Any, List
+from lazy_tools import LazyCrawl4aiTools
+from crawl_cache import cache_from_env
+from run_memo import RunToolMemo
+
+load_dotenv()
+
+MCP_SERVER_URL = "http://localhost:8017/mcp"
+
+# Shared by every agent in the process, so crawls reuse one browser
+crawl_tools = LazyCrawl4aiTools(cache=cache_from_env())
+# Repeated identical MCP tool calls within a run are answered from the run's memo
+tool_memo = RunToolMemo()
+
+async def connect_mcp(url: str = MCP_SERVER_URL) -> MCPTools:
+    """Connect to the MCP server, timed as a startup phase."""
+    mcp_tools = MCPTools(transport="streamable-http", url=url)
+    with startup.measure("connect MCP"):
+        await mcp_tools.connect()
+    if not mcp_tools.initialized:
+        raise ConnectionError(f"Could not connect to MCP server at {url}")
+    return mcp_tools
+
+def create_agent(mcp_tools: MCPTools, markdown: bool = True) -> Agent:
+    """Create the portfolio agent with web crawling and the given MCP tools."""
+    return Agent(
+        name="Portfolio Agent",
+        model=OpenRouter(
+            id=os.getenv("OPENROUTER_MODEL", "x-ai/grok-4-fast:free"),
+            api_key=os.getenv("OPENROUTER_API_KEY"),
+            base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+            temperature=0.7,
+            max_tokens=40000,
+        ),
+        tools=[crawl_tools, mcp_tools],
+        tool_hooks=[tool_memo.hook],
+        instructions="""
+        You are Hugo's AI assistant, representing his portfolio and expertise. 
+        You have access to Hugo's project data through the MCP server, which contains:
+        - All projects across AI and real-time graphics
+        - Many different technologies
+        - Detailed project information, descriptions, and impact
+        - The official portfolio page is located at https://portfolio.hugovalverde.com
+        - Hugo has a blog located at https://blog.hugovalverde.com
+        - Riot Games related projects might be referred to as VCT, LTA, Valorant, League of Legends, LCS or MSI; get_projects_by_client resolves these aliases for you.
+        
+        When answering questions about Hugo's work:
+        - Use the MCP tools to get accurate, up-to-date information
+        - For broad questions, start with get_portfolio_digest for an overview of every project, then use get_project_by_id for details
+        - Speak in first person as Hugo
+        - Be specific about technologies, clients, and project outcomes
+        - Highlight Hugo's expertise in AI engineering and real-time graphics
+        - When you need technologies or technology counts, use get_canonical_technologies; duplicate spellings are already merged there, so do not deduplicate them yourself.
+        - When you are asked about client work, use get_projects_by_client; it returns every matching project in one call, so there is no need to page through all projects.
+        - For questions about blog posts or site content, use search_site_content first; crawl pages only if it finds nothing relevant.
+
+        For other tasks, use the available tools as needed.
+        Focus on retaining credibility and accuracy in your responses.
+        Do not make up information.
+        Do not provide claims that you are not sure about.
+        Do not confirm or extend claims that are not backed up by the data accessible via MCP.
+        """,
+        markdown=markdown,
+    )
+
+async def run_agent(message: str, mcp_url: str = MCP_SERVER_URL) -> None:
+    """Run the portfolio agent with the given message."""
+    
+    # Initialize and connect to the MCP server
+    mcp_tools = await connect_mcp(mcp_url)
+    print("⏱️  Startup timings:")
+    print(startup.report())
+    
+    try:
+        # Create agent with all tools
+        agent = create_agent(mcp_tools)
+        
+        # Run the agent
+        await agent.aprint_response(message, stream=True)
+        
+    finally:
+        # Always close the connection when done
+        await mcp_tools.close()
+        await crawl_tools.close()
+
+def read_prompts(path: str) -> List[Dict[str, Any]]:
+    """Read JSONL prompts from a file or stdin ("-"): {"id": ..., "prompt": ...} objects or bare strings."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        prompts = []
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if isinstance(item, str):
+                item = {"prompt": item}
+            item.setdefault("id", line_number)
+            prompts.append(item)
+        return prompts
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+async def answer(agent: Agent, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer one prompt and record its timing, tool calls and token counts."""
+    started = time.perf_counter()
+    result = {"id": item["id"], "prompt": item["prompt"]}
+    run_id = str(uuid.uuid4())
+    try:
+        response = await agent.arun(item["prompt"], run_id=run_id)
+        tools = response.tools or []
+        tool_counts: Dict[str, int] = {}
+        for tool in tools:
+            tool_counts[tool.tool_name] = tool_counts.get(tool.tool_name, 0) + 1
+        metrics = response.metrics
+        result.update({
+            "answer": response.content,
+            "tool_calls": len(tools),
+            "tools": tool_counts,
+            "tool_errors": sum(1 for tool in tools if tool.tool_call_error),
+            "input_tokens": getattr(metrics, "input_tokens", None),
+            "output_tokens": getattr(metrics, "output_tokens", None),
+            "error": None,
+        })
+    except Exception as e:
+        result.update({"answer": None, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        counts = tool_memo.finish(run_id)
+    result["memo_hits"] = counts["hits"] if counts else 0
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+async def run_batch(input_path: str, output_path: str, concurrency: int = 4, mcp_url: str = MCP_SERVER_URL) -> None:
+    """
+    Answer every prompt in a JSONL file with one MCP connection and one agent,
+    `concurrency` prompts at a time, writing one JSON result per line as each finishes.
+    """
+    prompts = read_prompts(input_path)
+    mcp_tools = await connect_mcp(mcp_url)
+    print("⏱️  Startup timings:", file=sys.stderr)
+    print(startup.report(), file=sys.stderr)
+
+    out = sys.stdout if output_path == "-" else open(output_path, "w", encoding="utf-8")
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+    errors = 0
+    try:
+        agent = create_agent(mcp_tools, markdown=False)
+
+        async def bounded(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await answer(agent, item)
+
+        for done, task in enumerate(asyncio.as_completed([bounded(item) for item in prompts]), 1):
+            result = await task
+            errors += result["error"] is not None
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            print(f"[{done}/{len(prompts)}] {result['id']}: {result['duration_ms']:.0f} ms, "
+                  f"{result.get('tool_calls', 0)} tool calls{' ERROR ' + result['error'] if result['error'] else ''}",
+                  file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        await mcp_tools.close()
+        await crawl_tools.close()
+    print(f"✅ {len(prompts)} prompts in {time.perf_counter() - started:.1f}s, {errors} errors", file=sys.stderr)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ask the portfolio agent one question, or a batch of them")
+    parser.add_argument("message", nargs="?", default="Tell me about Hugo's AI projects and his full experience with Riot Games.")
+    parser.add_argument("--batch", metavar="PROMPTS", help="JSONL file of prompts, or - for stdin")
+    parser.add_argument("--output", default="-", help="JSONL results file (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Prompts answered at the same time")
+    parser.add_argument("--mcp-url", default=MCP_SERVER_URL)
+    args = parser.parse_args()
+
+    if args.batch:
+        asyncio.run(run_batch(args.batch, args.output, args.concurrency, args.mcp_url))
+    else:
+        # Test with a portfolio-related question
+        asyncio.run(run_agent(args.message, args.mcp_url))
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Resumable Server-Sent Event streams.
+A chat run produces its events in a background task instead of inside one HTTP
+response, and every event gets an increasing `id:`. The latest events of each run
+are kept in a buffer bounded in bytes, so a client whose connection dropped (at
+the cloudflared tunnel, say) resends the same request with a `Last-Event-ID`
+header and gets the events it missed instead of starting the run again. Runs are
+keyed by (thread_id, run_id) and only a request identical to the one that
+started the run can follow it. A client that falls further behind than the
+buffer reaches gets an error event, so it can start the run again rather than
+show a truncated answer. Quiet streams get heartbeat comments so proxies don't
+cut them. A run whose clients have all left is cancelled if none comes back
+within the grace period.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class RunStream:
+    """The numbered events of one run and the clients following it."""
+
+    def __init__(self, run_id: str, fingerprint: str = "", max_bytes: int = 2 * 1024 * 1024, grace: float = 15.0):
+        """
+        Args:
+            run_id: Run the events belong to
+            fingerprint: Identifies the request that started the run; only that request may follow it
+            max_bytes: Encoded event bytes kept for replay; older events are dropped
+            grace: Seconds a run without clients keeps going before it is cancelled
+        """
+        self.run_id = run_id
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self.grace = grace
+        self.task: Optional[asyncio.Task] = None
+        self.done = False
+        self.finished_at: Optional[float] = None
+        self.subscribers = 0
+        self._events: deque = deque()
+        self._bytes = 0
+        self._first_id = 1
+        self._next_id = 1
+        self._wake = asyncio.Event()
+        self._orphan_timer: Optional[asyncio.TimerHandle] = None
+
+    def publish(self, event: str) -> None:
+        """Append an encoded SSE event (`data: ...\\n\\n`) and wake the clients."""
+        self._events.append(event)
+        self._bytes += len(event.encode())
+        # Always keep the newest event, however large
+        while self._bytes > self.max_bytes and len(self._events) > 1:
+            self._bytes -= len(self._events.popleft().encode())
+            self._first_id += 1
+        self._next_id += 1
+        self._wake.set()
+        self._wake = asyncio.Event()
+
+    def close(self) -> None:
+        self.done = True
+        self.finished_at = time.monotonic()
+        self._wake.set()
+        if self._orphan_timer is not None:
+            self._orphan_timer.cancel()
+
+    def can_resume(self, last_event_id: int) -> bool:
+        """Whether every event after `last_event_id` is still buffered."""
+        return last_event_id >= self._first_id - 1
+
+    def _attach(self) -> None:
+        self.subscribers += 1
+        if self._orphan_timer is not None:
+            self._orphan_timer.cancel()
+            self._orphan_timer = None
+
+    def _detach(self) -> None:
+        self.subscribers -= 1
+        if self.subscribers == 0:
+            self.watch_orphan()
+
+    def watch_orphan(self) -> None:
+        """Cancel the run unless a client (re)connects within `grace` seconds."""
+        if not self.done and self._orphan_timer is None:
+            self._orphan_timer = asyncio.get_running_loop().call_later(self.grace, self._cancel_orphan)
+
+    def _cancel_orphan(self) -> None:
+        self._orphan_timer = None
+        if self.subscribers == 0 and self.task is not None and not self.task.done():
+            self.task.cancel()
+
+    async def subscribe(self, last_event_id: int = 0, heartbeat: float = 15.0, poll: float = 0.5,
+                        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+                        evicted_event: str = "") -> AsyncIterator[str]:
+        """
+        Yield the events after `last_event_id` with their ids, then follow the run until it ends.
+
+        Args:
+            last_event_id: Last event the client received (0 for all)
+            heartbeat: Seconds of silence after which a comment line is sent
+            poll: How often a quiet stream checks `is_disconnected`
+            is_disconnected: Returns True once the client has gone away
+            evicted_event: Encoded event sent, without an id, in place of events that were
+                dropped from the buffer before this client got them; the stream then ends
+        """
+        self._attach()
+        sent = last_event_id
+        last_write = time.monotonic()
+        try:
+            while True:
+                wake = self._wake
+                while sent + 1 < self._next_id:
+                    if sent + 1 < self._first_id:
+                        # This client fell further behind than the buffer reaches
+                        if evicted_event:
+                            yield evicted_event
+                        return
+                    event = self._events[sent + 1 - self._first_id]
+                    sent += 1
+                    yield f"id: {sent}\n{event}"
+                    last_write = time.monotonic()
+                if self.done:
+                    return
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=poll)
+                except asyncio.TimeoutError:
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    if time.monotonic() - last_write >= heartbeat:
+                        yield ": heartbeat\n\n"
+                        last_write = time.monotonic()
+        finally:
+            self._detach()
+
+
+class RunStreams:
+    """Runs that are in progress or finished recently, by (thread_id, run_id)."""
+
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024, ttl: float = 300.0, grace: float = 15.0):
+        """
+        Args:
+            max_bytes: Encoded event bytes kept per run
+            ttl: Seconds a finished run stays available for replay
+            grace: Seconds a run without clients keeps going before it is cancelled
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.grace = grace
+        self._streams: Dict[Tuple[str, str], RunStream] = {}
+        self.stats = {"runs": 0, "resumed": 0, "cancelled": 0}
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for key, stream in list(self._streams.items()):
+            if stream.done and now - stream.finished_at > self.ttl:
+                del self._streams[key]
+
+    def get(self, thread_id: str, run_id: str) -> Optional[RunStream]:
+        self._prune()
+        return self._streams.get((thread_id, run_id))
+
+    def start(self, thread_id: str, run_id: str, fingerprint: str, events: AsyncIterator[str]) -> RunStream:
+        """Produce `events` in the background into a new stream for (`thread_id`, `run_id`)."""
+        self._prune()
+        stream = RunStream(run_id, fingerprint, self.max_bytes, self.grace)
+        stream.task = asyncio.create_task(self._pump(stream, events))
+        # Covers a client that disappears before its response starts
+        stream.watch_orphan()
+        self._streams[(thread_id, run_id)] = stream
+        self.stats["runs"] += 1
+        return stream
+
+    async def _pump(self, stream: RunStream, events: AsyncIterator[str]) -> None:
+        try:
+            async for event in events:
+                stream.publish(event)
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+        finally:
+            stream.close()
+
+    def status(self) -> Dict[str, int]:
+        return {
+            "active": sum(1 for s in self._streams.values() if not s.done),
+            "buffered": len(self._streams),
+            **self.stats,
+        }
+
+    async def close(self) -> None:
+        tasks = [s.task for s in self._streams.values() if s.task is not None and not s.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,48 @@
+"""
+Startup timing for the agents.
+Wrap each startup phase (imports, MCP connect) in `startup.measure(...)` and
+print `startup.report()` once the process is ready. Each phase records its wall
+time and how many modules it imported, grouped by top-level package, much like
+a summarized `python -X importtime`. For per-module detail run the agent with
+`python -X importtime chatbot-agent.py 2> importtime.log`.
+
+Only the standard library is imported here, so it can be timed before the heavy imports.
+"""
+
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Records how long each startup phase takes and which packages it imported."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float, Counter]] = []
+
+    @contextmanager
+    def measure(self, phase: str):
+        before = set(sys.modules)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            packages = Counter(name.split(".")[0] for name in set(sys.modules) - before)
+            self.phases.append((phase, elapsed_ms, packages))
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def report(self, top: int = 3) -> str:
+        """One line per phase: wall time, modules imported and the packages that imported the most."""
+        lines = []
+        for phase, elapsed_ms, packages in self.phases:
+            heaviest = ", ".join(f"{name} {count}" for name, count in packages.most_common(top))
+            detail = f"  {sum(packages.values())} modules ({heaviest})" if packages else ""
+            lines.append(f"   {phase:<24} {elapsed_ms:8.1f} ms{detail}")
+        lines.append(f"   {'ready after':<24} {self.elapsed_ms():8.1f} ms")
+        return "\n".join(lines)
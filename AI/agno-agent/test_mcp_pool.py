@@ -0,0 +1,86 @@
+"""
+Tool calls made through CallMetaMCPTools reach the MCP server with the run's deadline and
+trace in `_meta`, on the shared session and on per-run (header_provider) sessions alike;
+the session pool refuses toolkits that would open per-run sessions.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+import uvicorn
+from agno.run import RunContext
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_pool import CallMetaMCPTools, MCPSessionPool
+from portfolio_common import tracing
+from portfolio_common.deadline import DEADLINE_META, deadline_meta, deadline_scope
+from portfolio_common.mcp_meta import request_meta
+
+
+@pytest.fixture(scope="module")
+def server():
+    """A streamable-HTTP MCP server whose `probe` tool records the `_meta` of each call."""
+    seen = []
+    mcp = FastMCP("probe")
+
+    class RecordMeta(Middleware):
+        async def on_call_tool(self, context, call_next):
+            seen.append(request_meta(context))
+            return await call_next(context)
+
+    mcp.add_middleware(RecordMeta())
+
+    @mcp.tool
+    def probe() -> str:
+        return "ok"
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    app = uvicorn.Server(uvicorn.Config(mcp.http_app(), host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=app.run, daemon=True)
+    thread.start()
+    while not app.started:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}/mcp", seen
+    app.should_exit = True
+    thread.join(5)
+
+
+@pytest.mark.parametrize("header_provider", [None, lambda run_context: {"x-run": run_context.run_id}])
+def test_tool_calls_carry_deadline_and_trace(server, header_provider, tmp_path, monkeypatch):
+    url, seen = server
+    seen.clear()
+    monkeypatch.setenv("TRACE_EXPORT_FILE", str(tmp_path / "spans.jsonl"))
+
+    async def run():
+        tools = CallMetaMCPTools(transport="streamable-http", url=url, header_provider=header_provider,
+                                 meta_providers=(deadline_meta, tracing.trace_meta))
+        await tools.connect()
+        try:
+            run_context = RunContext(run_id="run-1", session_id="session-1")
+            with deadline_scope(time.time() + 20), tracing.start_span("agent.run") as span:
+                await tools.functions["probe"].entrypoint(_agno_run_context=run_context)
+            await tools.cleanup_run_session("run-1")
+            return span
+        finally:
+            await tools.close()
+
+    span = asyncio.run(run())
+    assert len(seen) == 1
+    assert 0 < seen[0][DEADLINE_META] <= 20
+    assert seen[0][tracing.TRACEPARENT_META] == span.traceparent
+
+
+def test_pool_refuses_per_run_sessions():
+    with pytest.raises(ValueError):
+        MCPSessionPool(lambda: CallMetaMCPTools(transport="streamable-http", url="http://127.0.0.1:1/mcp",
+                                                header_provider=lambda run_context: {}), size=1)
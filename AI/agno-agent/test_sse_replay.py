@@ -0,0 +1,69 @@
+"""
+RunStream replays buffered events to a client resuming with Last-Event-ID, and tells a
+client whose missing events were already evicted from the byte-bounded buffer.
+"""
+
+import asyncio
+
+from sse_replay import RunStream, RunStreams
+
+EVICTED = "data: evicted\n\n"
+
+
+def event(i: int) -> str:
+    return f"data: {i:04d}\n\n"
+
+
+async def collect(stream: RunStream, last_event_id: int):
+    return [e async for e in stream.subscribe(last_event_id, evicted_event=EVICTED)]
+
+
+def test_resume_replays_missed_events():
+    async def run():
+        stream = RunStream("run", max_bytes=1024)
+        for i in range(1, 6):
+            stream.publish(event(i))
+        stream.close()
+        return stream.can_resume(3), await collect(stream, 3)
+
+    can_resume, events = asyncio.run(run())
+    assert can_resume
+    assert events == [f"id: 4\n{event(4)}", f"id: 5\n{event(5)}"]
+
+
+def test_resume_after_eviction_gets_error_event():
+    async def run():
+        # Room for three events
+        stream = RunStream("run", max_bytes=3 * len(event(0)))
+        for i in range(1, 11):
+            stream.publish(event(i))
+        stream.close()
+        return stream.can_resume(6), stream.can_resume(7), await collect(stream, 2), await collect(stream, 7)
+
+    can_resume_6, can_resume_7, evicted, replayed = asyncio.run(run())
+    assert not can_resume_6 and can_resume_7
+    assert evicted == [EVICTED]
+    assert replayed == [f"id: {i}\n{event(i)}" for i in (8, 9, 10)]
+
+
+def test_client_falling_behind_mid_stream_gets_error_event():
+    async def run():
+        streams = RunStreams(max_bytes=2 * len(event(0)))
+
+        async def events():
+            for i in range(1, 21):
+                yield event(i)
+                await asyncio.sleep(0)
+
+        stream = streams.start("thread", "run", "", events())
+        received = []
+        async for item in stream.subscribe(0, evicted_event=EVICTED):
+            received.append(item)
+            # A slow reader: the run publishes several events per event read
+            await asyncio.sleep(0.01)
+        await stream.task
+        return received
+
+    received = asyncio.run(run())
+    assert received[-1] == EVICTED
+    assert all(item.startswith("id: ") for item in received[:-1])
@@ -7,20 +7,119 @@ import httpx
 import os
 from typing import List, Dict, Any, Optional
 import asyncio
+from snapshot import ProjectSnapshot
+from portfolio_stats import PortfolioStatistics
+from tech_normalization import TechnologyNormalizer
+from similarity import RelatedProjectsIndex
+from date_index import ActiveProjectsIndex, parse_period
+from client_matcher import ClientIndex
+from digest import PortfolioDigest
+from metrics import InstrumentedTransport, CACHE_LOOKUPS, CACHE_EVICTIONS
+from portfolio_common.tracing import TracingTransport
+from portfolio_common.deadline import DeadlineTransport
 
 
 class PortfolioAPIClient:
     """Client for interacting with Hugo's Portfolio API."""
     
-    def __init__(self, base_url: str = None):
-        """Initialize the API client."""
+    def __init__(self, base_url: str = None, transport: httpx.AsyncBaseTransport = None):
+        """
+        Initialize the API client.
+
+        Args:
+            base_url: Portfolio API base URL (defaults to PORTFOLIO_API_URL)
+            transport: Innermost transport under the deadline, tracing and metrics layers
+        """
         self.base_url = base_url or os.getenv('PORTFOLIO_API_URL', 'http://localhost:3017/api')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Requests made during a tool call are also capped to the caller's remaining deadline
+        self.client = httpx.AsyncClient(
+            timeout=float(os.getenv('PORTFOLIO_API_TIMEOUT', '30')),
+            transport=DeadlineTransport(TracingTransport(InstrumentedTransport(transport))),
+        )
+        self.snapshot = ProjectSnapshot(ttl=float(os.getenv('PORTFOLIO_SNAPSHOT_TTL', '300')))
+        self._snapshot_lock = asyncio.Lock()
+        self.statistics = PortfolioStatistics(self._categorize_technology_entry)
+        self.snapshot.add_listener(self.statistics)
+        self.technologies = TechnologyNormalizer()
+        self.related_projects = RelatedProjectsIndex()
+        self.snapshot.add_listener(self.related_projects)
+        self.active_projects = ActiveProjectsIndex()
+        self.clients = ClientIndex()
+        self.digest = PortfolioDigest()
     
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
     
+    async def _fetch_all_projects(self) -> List[Dict[str, Any]]:
+        """Fetch every project from the API, following pagination."""
+        projects = []
+        page = 1
+        while True:
+            response = await self.client.get(f"{self.base_url}/projects", params={"limit": 1000, "page": page})
+            response.raise_for_status()
+            data = response.json()
+            projects.extend(data.get("projects", []))
+            if page >= data.get("totalPages", 1):
+                return projects
+            page += 1
+    
+    async def get_snapshot(self) -> ProjectSnapshot:
+        """Return the project snapshot, loading it from the API if it is missing or expired."""
+        if self.snapshot.is_stale:
+            async with self._snapshot_lock:
+                # Another caller may have refreshed it while we were waiting
+                if self.snapshot.is_stale:
+                    CACHE_LOOKUPS.labels("snapshot", "miss").inc()
+                    if self.snapshot.is_loaded:
+                        CACHE_EVICTIONS.labels("snapshot", "expired").inc()
+                    self.snapshot.begin_reload()
+                    try:
+                        projects = await self._fetch_all_projects()
+                    except BaseException:
+                        self.snapshot.abort_reload()
+                        raise
+                    self.snapshot.replace(projects)
+                    return self.snapshot
+        CACHE_LOOKUPS.labels("snapshot", "hit").inc()
+        return self.snapshot
+    
+    def invalidate_snapshot(self) -> None:
+        """Drop the whole snapshot; the next read reloads it."""
+        if self.snapshot.is_loaded:
+            CACHE_EVICTIONS.labels("snapshot", "invalidated").inc()
+        self.snapshot.invalidate()
+    
+    def _evict(self, project_id: str, reason: str) -> None:
+        if self.snapshot.evict(project_id):
+            CACHE_EVICTIONS.labels("snapshot", reason).inc()
+    
+    async def refresh_projects(self, project_ids: List[str]) -> Dict[str, Any]:
+        """
+        Re-fetch the given projects and patch them into the snapshot.
+        Projects that no longer exist are evicted. If the snapshot has not
+        been loaded yet (and no load is in flight) there is nothing to patch
+        and the IDs are skipped.
+        """
+        patched, evicted, failed = [], [], []
+        if not self.snapshot.accepts_patches:
+            return {"patched": patched, "evicted": evicted, "failed": failed, "version": self.snapshot.version}
+        for project_id in dict.fromkeys(project_ids):
+            try:
+                response = await self.client.get(f"{self.base_url}/projects/{project_id}")
+                if response.status_code == 404:
+                    self._evict(project_id, "deleted")
+                    evicted.append(project_id)
+                    continue
+                response.raise_for_status()
+                self.snapshot.upsert(response.json())
+                patched.append(project_id)
+            except Exception:
+                # Drop the entry rather than keep serving something we know is stale
+                self._evict(project_id, "refresh_failed")
+                failed.append(project_id)
+        return {"patched": patched, "evicted": evicted, "failed": failed, "version": self.snapshot.version}
+    
     async def get_all_projects(self, **params) -> Dict[str, Any]:
         """Get all projects with optional filtering."""
         try:
@@ -30,6 +129,15 @@ class PortfolioAPIClient:
         except Exception as e:
             return {"error": f"Failed to fetch projects: {str(e)}"}
     
+    async def get_portfolio_digest(self) -> Dict[str, Any]:
+        """Get one compact line per project, rendered once per snapshot version."""
+        try:
+            snapshot = await self.get_snapshot()
+            normalizer = self.technologies.ensure(snapshot)
+            return self.digest.ensure(snapshot, normalizer.canonical)
+        except Exception as e:
+            return {"error": f"Failed to build portfolio digest: {str(e)}"}
+    
     async def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific project by ID."""
         try:
@@ -103,6 +211,45 @@ class PortfolioAPIClient:
         except Exception as e:
             return [{"error": f"Failed to fetch projects by year: {str(e)}"}]
     
+    async def get_related_projects(self, project_id: str, k: int = 5) -> Dict[str, Any]:
+        """Get the k projects most similar to the given one by technologies and description."""
+        if k < 1:
+            return {"error": "k must be at least 1"}
+        try:
+            snapshot = await self.get_snapshot()
+            normalizer = self.technologies.ensure(snapshot)
+            index = await self.related_projects.ensure(snapshot, normalizer.canonical)
+            related = index.related(project_id, k)
+            if related is None:
+                return {"error": f"Project {project_id} not found"}
+            return {"project_id": project_id, "related": related}
+        except Exception as e:
+            return {"error": f"Failed to find related projects: {str(e)}"}
+    
+    async def get_projects_active_between(self, start: str, end: Optional[str] = None) -> Dict[str, Any]:
+        """Get projects whose date range overlaps [start, end], including ongoing projects."""
+        try:
+            start_day = parse_period(start)
+            end_day = parse_period(end or start, end_of_period=True)
+        except ValueError:
+            return {"error": "Dates must be YYYY, YYYY-MM or YYYY-MM-DD"}
+        if end_day < start_day:
+            return {"error": "end must not be before start"}
+        try:
+            snapshot = await self.get_snapshot()
+            projects = self.active_projects.ensure(snapshot).overlapping(start_day, end_day)
+            return {"start": start, "end": end or start, "total": len(projects), "projects": projects}
+        except Exception as e:
+            return {"error": f"Failed to fetch active projects: {str(e)}"}
+    
+    async def get_projects_by_client(self, name: str) -> Dict[str, Any]:
+        """Get every project for a client, matching its aliases in client, title and description."""
+        try:
+            snapshot = await self.get_snapshot()
+            return self.clients.ensure(snapshot).lookup(name)
+        except Exception as e:
+            return {"error": f"Failed to fetch projects by client: {str(e)}"}
+    
     async def get_recent_projects(self, limit: int = 5) -> Dict[str, Any]:
         """Get the most recent projects based on end date, with ongoing projects first."""
         try:
@@ -112,13 +259,20 @@ class PortfolioAPIClient:
         except Exception as e:
             return {"error": f"Failed to fetch recent projects: {str(e)}"}
     
+    def _patch_snapshot(self, project: Dict[str, Any]) -> None:
+        """Apply a project returned by a write to the snapshot so reads see it immediately."""
+        if self.snapshot.accepts_patches and isinstance(project, dict) and project.get("id"):
+            self.snapshot.upsert(project)
+    
     # CRUD Operations
     async def create_project(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new project."""
         try:
             response = await self.client.post(f"{self.base_url}/projects", json=project_data)
             response.raise_for_status()
-            return response.json()
+            project = response.json()
+            self._patch_snapshot(project)
+            return project
         except Exception as e:
             return {"error": f"Failed to create project: {str(e)}"}
     
@@ -127,7 +281,9 @@ class PortfolioAPIClient:
         try:
             response = await self.client.put(f"{self.base_url}/projects/{project_id}", json=updates)
             response.raise_for_status()
-            return response.json()
+            project = response.json()
+            self._patch_snapshot(project)
+            return project
         except Exception as e:
             return {"error": f"Failed to update project: {str(e)}"}
     
@@ -136,6 +292,7 @@ class PortfolioAPIClient:
         try:
             response = await self.client.delete(f"{self.base_url}/projects/{project_id}")
             response.raise_for_status()
+            self._evict(project_id, "deleted")
             return {"success": True, "message": f"Project {project_id} deleted successfully"}
         except Exception as e:
             return {"error": f"Failed to delete project: {str(e)}"}
@@ -146,7 +303,9 @@ class PortfolioAPIClient:
             updates = {field: value}
             response = await self.client.put(f"{self.base_url}/projects/{project_id}", json=updates)
             response.raise_for_status()
-            return response.json()
+            project = response.json()
+            self._patch_snapshot(project)
+            return project
         except Exception as e:
             return {"error": f"Failed to update project {field}: {str(e)}"}
     
@@ -271,11 +430,8 @@ class PortfolioAPIClient:
             filter_type: 'all', 'technology', 'tool', 'skill', 'responsibility', 'process', 'hardware', 'other'
         """
         try:
-            # Get all projects and extract technologies
-            response = await self.client.get(f"{self.base_url}/projects", params={"limit": 1000})
-            response.raise_for_status()
-            data = response.json()
-            projects = data.get("projects", [])
+            snapshot = await self.get_snapshot()
+            projects = snapshot.ordered()
             
             all_entries = set()
             for project in projects:
@@ -288,7 +444,7 @@ class PortfolioAPIClient:
             # Filter by category
             filtered_entries = []
             for entry in all_entries:
-                category = self._categorize_technology_entry(entry)
+                category = self.statistics.entry_type(entry)
                 if category == filter_type:
                     filtered_entries.append(entry)
             
@@ -296,14 +452,25 @@ class PortfolioAPIClient:
         except Exception as e:
             return [f"Error: {str(e)}"]
 
+    async def get_canonical_technologies(self, filter_type: str = 'all') -> List[Dict[str, Any]]:
+        """
+        Get technologies with near-duplicate spellings merged.
+        
+        Args:
+            filter_type: 'all', 'technology', 'tool', 'skill', 'responsibility', 'process', 'hardware', 'other'
+        """
+        try:
+            snapshot = await self.get_snapshot()
+            normalizer = self.technologies.ensure(snapshot)
+            return normalizer.canonical_technologies(self.statistics.entry_type, filter_type)
+        except Exception as e:
+            return [{"error": f"Failed to normalize technologies: {str(e)}"}]
+
     async def get_technology_categories(self) -> Dict[str, List[str]]:
         """Get all technologies categorized by type."""
         try:
-            # Get all projects and extract technologies
-            response = await self.client.get(f"{self.base_url}/projects", params={"limit": 1000})
-            response.raise_for_status()
-            data = response.json()
-            projects = data.get("projects", [])
+            snapshot = await self.get_snapshot()
+            projects = snapshot.ordered()
             
             all_entries = set()
             for project in projects:
@@ -322,7 +489,7 @@ class PortfolioAPIClient:
             }
             
             for entry in all_entries:
-                category = self._categorize_technology_entry(entry)
+                category = self.statistics.entry_type(entry)
                 categories[category].append(entry)
             
             # Sort each category
@@ -336,11 +503,8 @@ class PortfolioAPIClient:
     async def get_all_categories(self) -> List[str]:
         """Get all unique categories from projects."""
         try:
-            # Get all projects and extract categories
-            response = await self.client.get(f"{self.base_url}/projects", params={"limit": 1000})
-            response.raise_for_status()
-            data = response.json()
-            projects = data.get("projects", [])
+            snapshot = await self.get_snapshot()
+            projects = snapshot.ordered()
             
             categories = set()
             for project in projects:
@@ -354,48 +518,32 @@ class PortfolioAPIClient:
     async def get_project_statistics(self) -> Dict[str, Any]:
         """Get portfolio statistics."""
         try:
-            # Get all projects for analysis
-            response = await self.client.get(f"{self.base_url}/projects", params={"limit": 1000})
-            response.raise_for_status()
-            data = response.json()
-            projects = data.get("projects", [])
-            
-            # Calculate statistics
-            total_projects = len(projects)
-            featured_projects = len([p for p in projects if p.get("featured", False)])
-            completed_projects = len([p for p in projects if p.get("status") == "completed"])
-            ongoing_projects = len([p for p in projects if p.get("status") == "ongoing"])
-            planned_projects = len([p for p in projects if p.get("status") == "planned"])
-            
-            # Technology usage (filtered to actual technologies only)
-            technology_count = {}
-            for project in projects:
-                if "technologies" in project and project["technologies"]:
-                    for tech in project["technologies"]:
-                        # Only count actual technologies, not responsibilities/skills
-                        if self._categorize_technology_entry(tech) == 'technology':
-                            technology_count[tech] = technology_count.get(tech, 0) + 1
-            
-            top_technologies = sorted(technology_count.items(), key=lambda x: x[1], reverse=True)[:10]
-            
-            # Category breakdown
-            category_count = {}
-            for project in projects:
-                if "category" in project and project["category"]:
-                    category = project["category"]
-                    category_count[category] = category_count.get(category, 0) + 1
-            
+            await self.get_snapshot()
+            return self.statistics.as_dict()
+        except Exception as e:
+            return {"error": f"Failed to calculate statistics: {str(e)}"}
+    
+    async def get_expertise_summary(self) -> Dict[str, Any]:
+        """Get the aggregates behind Hugo's expertise summary, read from the maintained statistics."""
+        try:
+            snapshot = await self.get_snapshot()
+            stats = self.statistics
+            # The snapshot is ordered featured-first, so the highlights are a prefix
+            featured_projects = []
+            for project in snapshot.ordered():
+                if not project.get("featured", False) or len(featured_projects) == 3:
+                    break
+                featured_projects.append(project)
             return {
-                "total_projects": total_projects,
-                "featured_projects": featured_projects,
-                "completed_projects": completed_projects,
-                "ongoing_projects": ongoing_projects,
-                "planned_projects": planned_projects,
-                "top_technologies": [{"technology": tech, "usage_count": count} for tech, count in top_technologies],
-                "categories": [{"category": cat, "project_count": count} for cat, count in category_count.items()]
+                "total_projects": stats.total,
+                "featured_projects": stats.featured,
+                "technologies_count": len(stats.technology_counts),
+                "top_technologies": stats.top_technologies(5),
+                "categories": dict(stats.category_counts),
+                "featured_highlights": featured_projects
             }
         except Exception as e:
-            return {"error": f"Failed to calculate statistics: {str(e)}"}
+            return {"error": f"Failed to summarize expertise: {str(e)}"}
 
 
 # Global API client instance
@@ -408,6 +556,13 @@ async def get_api_client() -> PortfolioAPIClient:
         _api_client = PortfolioAPIClient()
     return _api_client
 
+def snapshot_state() -> Dict[str, Any]:
+    """Snapshot version and size of the global client, for diagnostics."""
+    if _api_client is None:
+        return {"snapshot_version": None}
+    snapshot = _api_client.snapshot
+    return {"snapshot_version": snapshot.version, "snapshot_projects": len(snapshot.projects)}
+
 async def close_api_client():
     """Close the global API client."""
     global _api_client
@@ -0,0 +1,182 @@
+"""
+Client and brand alias matching.
+Client work is often stored under a product or event name rather than the client
+("VCT" or "MSI" for Riot Games). A configurable alias dictionary is compiled into an
+Aho-Corasick automaton that scans each project's client, title and description once
+per snapshot version, so every project for a client is found in one lookup.
+"""
+
+import json
+import os
+from collections import defaultdict, deque
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+
+# Canonical client -> aliases. Extend with CLIENT_ALIASES_FILE (same JSON shape).
+DEFAULT_CLIENT_ALIASES: Dict[str, List[str]] = {
+    "Riot Games": [
+        "VCT", "Valorant", "Valorant Champions Tour", "LTA", "League of Legends",
+        "LCS", "MSI", "Mid-Season Invitational", "LEC",
+    ],
+    "NHL": ["National Hockey League"],
+}
+
+# Aliases that are also everyday words ("a riot of color", "virtual worlds"). They only
+# resolve a project's client field and lookup names, never free-text title/description.
+DEFAULT_CLIENT_FIELD_ALIASES: Dict[str, List[str]] = {
+    "Riot Games": ["Riot", "Worlds"],
+}
+
+MATCHED_FIELDS = ("client", "title", "description")
+
+
+def load_client_aliases() -> Dict[str, List[str]]:
+    """Return the default client aliases merged with the optional CLIENT_ALIASES_FILE."""
+    aliases = {client: list(names) for client, names in DEFAULT_CLIENT_ALIASES.items()}
+    path = os.getenv('CLIENT_ALIASES_FILE')
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for client, names in json.load(f).items():
+                aliases.setdefault(client, []).extend(names)
+    return aliases
+
+
+class AhoCorasick:
+    """Multi-pattern matcher reporting whole-word, case-insensitive occurrences."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        """
+        Args:
+            patterns: (pattern, value) pairs; a match reports the pattern's value
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        for pattern, value in patterns:
+            self._add(pattern.casefold(), value)
+        self._link()
+
+    def _add(self, pattern: str, value: Any) -> None:
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), value))
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first; depth-1 states fail back to the root."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[Tuple[Any, str]]:
+        """Return (value, matched text) for every whole-word match in `text`."""
+        folded = text.casefold()
+        matches = []
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, value in self._out[state]:
+                start = i - length + 1
+                before = folded[start - 1] if start > 0 else " "
+                after = folded[i + 1] if i + 1 < len(folded) else " "
+                if not before.isalnum() and not after.isalnum():
+                    # Case folding can change lengths (e.g. "ß"), in which case report the folded text
+                    source = text if len(text) == len(folded) else folded
+                    matches.append((value, source[start:i + 1]))
+        return matches
+
+
+class ClientIndex:
+    """Maps canonical clients to the projects that mention them."""
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None,
+                 field_aliases: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            aliases: Canonical client -> aliases matched anywhere in MATCHED_FIELDS
+            field_aliases: Canonical client -> aliases matched only as the whole client field
+        """
+        self.aliases = aliases if aliases is not None else load_client_aliases()
+        self.field_aliases = field_aliases if field_aliases is not None else DEFAULT_CLIENT_FIELD_ALIASES
+        # Any spelling (canonical or alias), case-folded -> canonical client
+        self._names = {}
+        for table in (self.field_aliases, self.aliases):
+            for client, names in table.items():
+                for name in [client, *names]:
+                    self._names[name.casefold()] = client
+        self._matcher = AhoCorasick((name, client) for client, names in self.aliases.items() for name in [client, *names])
+        self._built_version: Optional[int] = None
+        # Case-folded client -> {"client": display name, "projects": {project ID: matched terms}}
+        self._matches: Dict[str, Dict[str, Any]] = {}
+        self._projects: Dict[str, Dict[str, Any]] = {}
+
+    def ensure(self, snapshot) -> "ClientIndex":
+        """Rescan the projects if the snapshot changed since the last build."""
+        if self._built_version != snapshot.version:
+            self.build(snapshot.ordered())
+            self._built_version = snapshot.version
+        return self
+
+    def build(self, projects: Iterable[Dict[str, Any]]) -> None:
+        matches: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
+        self._projects = {}
+        for project in projects:
+            project_id = project.get("id")
+            if not project_id:
+                continue
+            self._projects[project_id] = project
+            # Projects are always indexed under their own client field, aliased or not
+            client_field = (project.get("client") or "").strip()
+            if client_field:
+                client = self._names.get(client_field.casefold(), client_field)
+                matches[client].setdefault(project_id, []).append(client_field)
+            for field in MATCHED_FIELDS:
+                value = project.get(field)
+                if not value:
+                    continue
+                for client, term in self._matcher.find(value):
+                    terms = matches[client].setdefault(project_id, [])
+                    if term not in terms:
+                        terms.append(term)
+        # Key clients case-insensitively so free-text client names can be looked up
+        self._matches = {client.casefold(): {"client": client, "projects": found} for client, found in matches.items()}
+
+    def lookup(self, name: str) -> Dict[str, Any]:
+        """All projects for a client given by its canonical name or any alias."""
+        folded = name.strip().casefold()
+        client = self._names.get(folded, name.strip())
+        entry = self._matches.get(client.casefold())
+        found = entry["projects"] if entry else {}
+        result = {
+            "client": entry["client"] if entry else client,
+            "aliases": self.aliases.get(client, []) + self.field_aliases.get(client, []),
+            "total": len(found),
+            "projects": [self._projects[project_id] for project_id in found],
+            "matched_terms": found,
+        }
+        if not found:
+            result["known_clients"] = [c["client"] for c in self.clients()]
+        return result
+
+    def clients(self) -> List[Dict[str, Any]]:
+        """Every client with at least one project, most projects first."""
+        result = [{"client": entry["client"], "project_count": len(entry["projects"])} for entry in self._matches.values()]
+        return sorted(result, key=lambda c: (-c["project_count"], c["client"].casefold()))
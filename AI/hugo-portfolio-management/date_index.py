@@ -0,0 +1,135 @@
+"""
+Interval index over project date ranges.
+Start and end dates are parsed to ordinals once per snapshot version. Projects
+without an end date are treated as ongoing. Overlap queries are answered as
+(projects active on the query start) + (projects starting inside the query),
+which are disjoint: the first comes from a centered interval tree and the
+second from a bisect over sorted start dates, for O(log n + k) per query.
+"""
+
+import calendar
+from bisect import bisect_right
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+
+
+OPEN_END = date.max.toordinal()
+
+
+def parse_date(value: Optional[str]) -> Optional[int]:
+    """Parse an ISO date (or datetime) string to an ordinal, or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def parse_period(value: str, end_of_period: bool = False) -> int:
+    """
+    Parse "YYYY", "YYYY-MM" or "YYYY-MM-DD" to an ordinal.
+    Partial dates resolve to the first day of the period, or the last day
+    when `end_of_period` is set. Raises ValueError for anything else.
+    """
+    parts = value.strip().split("-")
+    if len(parts) == 1:
+        year = int(parts[0])
+        return date(year, 12, 31).toordinal() if end_of_period else date(year, 1, 1).toordinal()
+    if len(parts) == 2:
+        year, month = int(parts[0]), int(parts[1])
+        day = calendar.monthrange(year, month)[1] if end_of_period else 1
+        return date(year, month, day).toordinal()
+    return date.fromisoformat(value.strip()).toordinal()
+
+
+class _Node:
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+
+def _build_tree(intervals: List[Tuple[int, int, int]]) -> Optional[_Node]:
+    """Build a centered interval tree over (start, end, position) tuples."""
+    if not intervals:
+        return None
+    endpoints = sorted(p for start, end, _ in intervals for p in (start, end))
+    node = _Node()
+    node.center = endpoints[len(endpoints) // 2]
+    here, left, right = [], [], []
+    for interval in intervals:
+        if interval[1] < node.center:
+            left.append(interval)
+        elif interval[0] > node.center:
+            right.append(interval)
+        else:
+            here.append(interval)
+    node.by_start = sorted(here, key=lambda i: i[0])
+    node.by_end = sorted(here, key=lambda i: i[1], reverse=True)
+    node.left = _build_tree(left)
+    node.right = _build_tree(right)
+    return node
+
+
+class ActiveProjectsIndex:
+    """Answers "which projects were active between two dates" for the current snapshot."""
+
+    def __init__(self):
+        self._built_version: Optional[int] = None
+        self.projects: List[Dict[str, Any]] = []
+        self._tree: Optional[_Node] = None
+        self._starts: List[int] = []
+        self._start_order: List[int] = []
+
+    def ensure(self, snapshot) -> "ActiveProjectsIndex":
+        """Rebuild the index if the snapshot changed since the last build."""
+        if self._built_version != snapshot.version:
+            self.build(snapshot.ordered())
+            self._built_version = snapshot.version
+        return self
+
+    def build(self, projects: Iterable[Dict[str, Any]]) -> None:
+        self.projects = []
+        intervals = []
+        for project in projects:
+            start = parse_date(project.get("startDate"))
+            if start is None:
+                continue
+            end = parse_date(project.get("endDate"))
+            # Ongoing projects (no end date) stay active indefinitely
+            end = OPEN_END if end is None else max(end, start)
+            intervals.append((start, end, len(self.projects)))
+            self.projects.append(project)
+
+        by_start = sorted(intervals, key=lambda i: i[0])
+        self._starts = [i[0] for i in by_start]
+        self._start_order = [i[2] for i in by_start]
+        self._tree = _build_tree(intervals)
+
+    def _active_on(self, day: int) -> List[int]:
+        """Positions of projects whose interval contains `day`."""
+        found = []
+        node = self._tree
+        while node is not None:
+            if day < node.center:
+                for start, _, position in node.by_start:
+                    if start > day:
+                        break
+                    found.append(position)
+                node = node.left
+            elif day > node.center:
+                for _, end, position in node.by_end:
+                    if end < day:
+                        break
+                    found.append(position)
+                node = node.right
+            else:
+                found.extend(i[2] for i in node.by_start)
+                break
+        return found
+
+    def overlapping(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Projects active at any point in [start, end], ordered by start date."""
+        positions = self._active_on(start)
+        lo = bisect_right(self._starts, start)
+        hi = bisect_right(self._starts, end)
+        positions.extend(self._start_order[lo:hi])
+        return sorted((self.projects[p] for p in positions), key=lambda p: p.get("startDate") or "")
@@ -0,0 +1,60 @@
+"""
+Compact one-line-per-project digest of the whole portfolio.
+Rendered once per snapshot version so broad questions can be answered from a
+single small tool result, drilling into individual projects by ID afterwards.
+"""
+
+from typing import Dict, Any, Optional, Callable, Iterable
+
+
+DIGEST_FORMAT = "id | title | client | years | category | technologies"
+
+
+def _years(project: Dict[str, Any]) -> str:
+    start = (project.get("startDate") or "")[:4] or "?"
+    end = (project.get("endDate") or "")[:4]
+    if not end:
+        return f"{start}-present"
+    return start if start == end else f"{start}-{end}"
+
+
+def _clean(value: Optional[str]) -> str:
+    """Keep fields on one line and free of the column separator."""
+    return " ".join((value or "").replace("|", "/").split()) or "-"
+
+
+def render_line(project: Dict[str, Any], canonical: Callable[[str], str]) -> str:
+    technologies = list(dict.fromkeys(canonical(t) for t in project.get("technologies") or []))
+    return " | ".join([
+        _clean(project.get("id")),
+        _clean(project.get("title")),
+        _clean(project.get("client")),
+        _years(project),
+        _clean(project.get("category")),
+        _clean(", ".join(technologies)),
+    ])
+
+
+class PortfolioDigest:
+    """Caches the rendered digest for the current snapshot version."""
+
+    def __init__(self):
+        self._built_version: Optional[int] = None
+        self.result: Dict[str, Any] = {}
+
+    def ensure(self, snapshot, canonical: Callable[[str], str]) -> Dict[str, Any]:
+        """Return the digest, re-rendering it only if the snapshot changed."""
+        if self._built_version != snapshot.version:
+            self.result = self.render(snapshot.ordered(), canonical, snapshot.version)
+            self._built_version = snapshot.version
+        return self.result
+
+    @staticmethod
+    def render(projects: Iterable[Dict[str, Any]], canonical: Callable[[str], str], version: int) -> Dict[str, Any]:
+        lines = [render_line(project, canonical) for project in projects]
+        return {
+            "version": version,
+            "total": len(lines),
+            "format": DIGEST_FORMAT,
+            "digest": "\n".join(lines),
+        }
@@ -0,0 +1,99 @@
+"""
+Read-only and read/write MCP endpoints served by one process.
+Both endpoints are HTTP apps of the same FastMCP server, so they share the API
+client: one connection pool, one snapshot cache and one set of derived indexes.
+A write made through the read/write endpoint patches the snapshot, and readers
+see it on their next call. This replaces running AI/mcp-server next to this
+server, where each kept its own cache and fetched the portfolio separately.
+AI/mcp-server itself is this server with MCP_READ_ONLY set, which makes every
+endpoint read-only.
+
+The read-only endpoint hides write tools from tool listings and rejects calls
+to them. Serve it under a path prefix on the main port (MCP_READONLY_PATH,
+e.g. /readonly -> /readonly/mcp), on its own port (MCP_READONLY_PORT), or both.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Iterable, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+
+READ_ONLY_SCOPE_KEY = "portfolio.read_only"
+
+
+def read_only_app(app):
+    """ASGI wrapper marking every request to `app` as read-only."""
+    async def wrapped(scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            scope = {**scope, READ_ONLY_SCOPE_KEY: True}
+        await app(scope, receive, send)
+    return wrapped
+
+
+def is_read_only_request() -> bool:
+    from fastmcp.server.dependencies import get_http_request
+    try:
+        return bool(get_http_request().scope.get(READ_ONLY_SCOPE_KEY))
+    except RuntimeError:
+        # Not an HTTP request (e.g. in-memory or stdio clients): full access
+        return False
+
+
+def read_only_middleware(write_tools: Iterable[str], always: bool = False):
+    """FastMCP middleware hiding and refusing `write_tools` on read-only endpoints, or everywhere with `always`."""
+    from fastmcp.exceptions import ToolError
+    from fastmcp.server.middleware import Middleware
+
+    write_tools = frozenset(write_tools)
+
+    class ReadOnlyMiddleware(Middleware):
+        async def on_list_tools(self, context, call_next):
+            tools = await call_next(context)
+            if not (always or is_read_only_request()):
+                return tools
+            return [tool for tool in tools if tool.name not in write_tools]
+
+        async def on_call_tool(self, context, call_next):
+            if context.message.name in write_tools and (always or is_read_only_request()):
+                raise ToolError(f"{context.message.name} is not available on the read-only endpoint")
+            return await call_next(context)
+
+    return ReadOnlyMiddleware()
+
+
+def build_app(mcp, read_only_path: Optional[str] = None) -> Starlette:
+    """
+    Read/write app at /mcp, plus the read-only app at `read_only_path`/mcp when given.
+    Mounted apps' lifespans are not run by Starlette, so the parent runs both.
+    """
+    read_write = mcp.http_app(path="/mcp")
+    if not read_only_path:
+        return read_write
+    read_only = mcp.http_app(path="/mcp")
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with read_write.router.lifespan_context(read_write), read_only.router.lifespan_context(read_only):
+            yield
+
+    return Starlette(
+        routes=[
+            Mount("/" + read_only_path.strip("/"), app=read_only_app(read_only)),
+            Mount("/", app=read_write),
+        ],
+        lifespan=lifespan,
+    )
+
+
+async def serve(mcp, host: str, port: int, read_only_path: Optional[str] = None,
+                read_only_port: Optional[int] = None) -> None:
+    """Serve the endpoints; with `read_only_port`, a second server in this process serves the read-only app."""
+    servers = [uvicorn.Server(uvicorn.Config(build_app(mcp, read_only_path), host=host, port=port))]
+    if read_only_port:
+        read_only = read_only_app(mcp.http_app(path="/mcp"))
+        servers.append(uvicorn.Server(uvicorn.Config(read_only, host=host, port=read_only_port)))
+    await asyncio.gather(*(server.serve() for server in servers))
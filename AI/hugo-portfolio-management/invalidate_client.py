@@ -0,0 +1,43 @@
+"""
+Stub caller for the MCP server's cache invalidation webhook.
+This script sends the same request the portfolio admin API sends after a write,
+so the snapshot patching can be exercised without running the Next.js app.
+"""
+
+import asyncio
+import os
+import sys
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+async def send_invalidation(project_ids, url: str = None, token: str = None, invalidate_all: bool = False):
+    """POST an invalidation request and return the server's JSON response."""
+    url = url or os.getenv('MCP_INVALIDATION_URL', 'http://127.0.0.1:8017/invalidate')
+    token = token or os.getenv('MCP_INVALIDATION_TOKEN', '')
+    body = {"all": True} if invalidate_all else {"project_ids": list(project_ids)}
+    
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.post(url, json=body, headers={"Authorization": f"Bearer {token}"})
+        return response.status_code, response.json()
+
+
+async def main():
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python invalidate_client.py <project_id> [<project_id> ...]")
+        print("       python invalidate_client.py --all")
+        sys.exit(1)
+    
+    if args == ["--all"]:
+        status, result = await send_invalidation([], invalidate_all=True)
+    else:
+        status, result = await send_invalidation(args)
+    
+    print(f"HTTP {status}: {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Prometheus metrics for the MCP server.
+Tool calls are measured by a FastMCP middleware, upstream API requests by an
+httpx transport wrapper, and snapshot cache activity by the API client. The
+server exposes everything at `/metrics`.
+"""
+
+import time
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import Middleware, MiddlewareContext, CallNext
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+
+
+REGISTRY = CollectorRegistry()
+
+# Tool calls range from sub-millisecond snapshot reads to multi-second upstream fetches
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+TOOL_CALLS = Counter(
+    "mcp_tool_calls_total", "MCP tool calls", ["tool"], registry=REGISTRY)
+TOOL_ERRORS = Counter(
+    "mcp_tool_errors_total", "MCP tool calls that raised or returned an error payload", ["tool"], registry=REGISTRY)
+TOOL_DURATION = Histogram(
+    "mcp_tool_duration_seconds", "MCP tool call duration", ["tool"], buckets=LATENCY_BUCKETS, registry=REGISTRY)
+TOOL_IN_FLIGHT = Gauge(
+    "mcp_tool_calls_in_flight", "MCP tool calls currently executing", ["tool"], registry=REGISTRY)
+
+UPSTREAM_REQUESTS = Counter(
+    "portfolio_api_requests_total", "Requests to the portfolio API", ["method", "route", "status"], registry=REGISTRY)
+UPSTREAM_DURATION = Histogram(
+    "portfolio_api_request_duration_seconds", "Portfolio API request duration until response headers",
+    ["method", "route"], buckets=LATENCY_BUCKETS, registry=REGISTRY)
+
+CACHE_LOOKUPS = Counter(
+    "portfolio_cache_lookups_total", "Snapshot cache lookups", ["cache", "result"], registry=REGISTRY)
+CACHE_EVICTIONS = Counter(
+    "portfolio_cache_evictions_total", "Snapshot cache evictions", ["cache", "reason"], registry=REGISTRY)
+
+
+def render_metrics() -> tuple:
+    """Return (body, content type) for the /metrics endpoint."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def is_error_payload(value: Any) -> bool:
+    """
+    True for the error shapes the tools return instead of raising:
+    {"error": ...}, or a list holding a single {"error": ...}.
+    Non-object results arrive wrapped as {"result": ...}.
+    """
+    if isinstance(value, dict):
+        if "error" in value:
+            return True
+        if set(value) == {"result"}:
+            return is_error_payload(value["result"])
+        return False
+    if isinstance(value, list) and len(value) == 1:
+        return isinstance(value[0], dict) and "error" in value[0]
+    return False
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Counts, times and tracks in-flight MCP tool calls."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext):
+        tool = context.message.name
+        in_flight = TOOL_IN_FLIGHT.labels(tool)
+        in_flight.inc()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await call_next(context)
+            failed = is_error_payload(getattr(result, "structured_content", None))
+            return result
+        finally:
+            TOOL_DURATION.labels(tool).observe(time.perf_counter() - started)
+            TOOL_CALLS.labels(tool).inc()
+            if failed:
+                TOOL_ERRORS.labels(tool).inc()
+            in_flight.dec()
+
+
+def api_route(path: str) -> str:
+    """Collapse a request path to its portfolio API route template."""
+    parts = [p for p in path.split("/") if p]
+    if "api" in parts:
+        parts = parts[parts.index("api") + 1:]
+    if parts == ["projects"]:
+        return "/projects"
+    if parts == ["projects", "recent"]:
+        return "/projects/recent"
+    if len(parts) == 2 and parts[0] == "projects":
+        return "/projects/{id}"
+    return "other"
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records request counts and durations per API route."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        route = api_route(request.url.path)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            UPSTREAM_DURATION.labels(request.method, route).observe(time.perf_counter() - started)
+            UPSTREAM_REQUESTS.labels(request.method, route, status).inc()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,102 @@
+"""
+Incrementally maintained portfolio statistics.
+Counters are updated per changed project as the snapshot changes, so reading the
+statistics never rescans the portfolio.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+
+class PortfolioStatistics:
+    """Snapshot listener that keeps project counts and technology usage up to date."""
+
+    TOP_TECHNOLOGIES = 10
+
+    def __init__(self, categorize: Callable[[str], str]):
+        """
+        Args:
+            categorize: Function mapping a technology entry to its type
+                ('technology', 'tool', 'skill', ...). Only 'technology' entries
+                are counted towards technology usage.
+        """
+        self._categorize = categorize
+        self._entry_types: Dict[str, str] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.total = 0
+        self.featured = 0
+        self.status_counts: Counter = Counter()
+        self.category_counts: Counter = Counter()
+        self.technology_counts: Counter = Counter()
+        # (-usage_count, technology) kept sorted so the top technologies are a prefix
+        self._ranking: List[tuple] = []
+        self._cached: Optional[Dict[str, Any]] = None
+
+    def entry_type(self, entry: str) -> str:
+        """Categorize a technology entry, memoized because the classifier is regex-heavy."""
+        entry_type = self._entry_types.get(entry)
+        if entry_type is None:
+            entry_type = self._entry_types[entry] = self._categorize(entry)
+        return entry_type
+
+    # Snapshot listener interface
+    def reset(self, projects: Iterable[Dict[str, Any]]) -> None:
+        self._reset_counters()
+        for project in projects:
+            self._apply(project, 1)
+
+    def update(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        if old is not None:
+            self._apply(old, -1)
+        if new is not None:
+            self._apply(new, 1)
+
+    def _apply(self, project: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a project's contribution to every counter."""
+        self._cached = None
+        self.total += sign
+        if project.get("featured", False):
+            self.featured += sign
+        if project.get("status"):
+            self._adjust(self.status_counts, project["status"], sign)
+        if project.get("category"):
+            self._adjust(self.category_counts, project["category"], sign)
+        for tech in project.get("technologies") or []:
+            if self.entry_type(tech) == 'technology':
+                self._adjust_technology(tech, sign)
+
+    @staticmethod
+    def _adjust(counter: Counter, key: str, sign: int) -> None:
+        counter[key] += sign
+        if counter[key] <= 0:
+            del counter[key]
+
+    def _adjust_technology(self, tech: str, sign: int) -> None:
+        old_count = self.technology_counts.get(tech, 0)
+        if old_count:
+            del self._ranking[bisect_left(self._ranking, (-old_count, tech))]
+        self._adjust(self.technology_counts, tech, sign)
+        new_count = self.technology_counts.get(tech, 0)
+        if new_count:
+            insort(self._ranking, (-new_count, tech))
+
+    def top_technologies(self, k: int = TOP_TECHNOLOGIES) -> List[Dict[str, Any]]:
+        """Most used technologies, highest usage first (ties broken alphabetically)."""
+        return [{"technology": tech, "usage_count": -count} for count, tech in self._ranking[:k]]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Statistics in the shape returned by the get_project_statistics tool, cached until the next change."""
+        if self._cached is None:
+            self._cached = {
+                "total_projects": self.total,
+                "featured_projects": self.featured,
+                "completed_projects": self.status_counts.get("completed", 0),
+                "ongoing_projects": self.status_counts.get("ongoing", 0),
+                "planned_projects": self.status_counts.get("planned", 0),
+                "top_technologies": self.top_technologies(),
+                "categories": [{"category": cat, "project_count": count} for cat, count in self.category_counts.items()]
+            }
+        return self._cached
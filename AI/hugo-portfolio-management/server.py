@@ -2,38 +2,76 @@
 Hugo Portfolio Management MCP Server
 Provides full CRUD access to Hugo's portfolio via the existing API for AI agents.
 This server allows complete management of portfolio data including creating, updating, and deleting projects.
+With MCP_READ_ONLY set it serves only the read tools; AI/mcp-server runs it that way.
 """
 
 import os
+import sys
+import hmac
+import asyncio
 from typing import List, Dict, Any, Optional
 from fastmcp import FastMCP
-from api_client import get_api_client, close_api_client
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+# Modules shared with the chat agent live in AI/portfolio_common
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_client import get_api_client, close_api_client, snapshot_state
+from metrics import ToolMetricsMiddleware, render_metrics
+from portfolio_common.tracing import configure as configure_tracing, tool_tracing_middleware
+from portfolio_common.profiling import slow_tool_call_middleware
+from portfolio_common.deadline import deadline_middleware
+from site_search import get_site_index
+from endpoints import read_only_middleware, serve
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize the MCP server
-mcp = FastMCP(
-    name=os.getenv('MCP_SERVER_NAME', 'Hugo Portfolio Management Server'),
-    instructions="""
-    This MCP server provides full CRUD (Create, Read, Update, Delete) access to Hugo's portfolio.
-    It allows AI agents to completely manage portfolio data including projects, technologies, and metadata.
-    
-    READ OPERATIONS:
+# Serve only the read tools, on every endpoint
+READ_ONLY = os.getenv('MCP_READ_ONLY', '').lower() in ('1', 'true', 'yes')
+
+READ_INSTRUCTIONS = """
+    - get_portfolio_digest: One compact line per project covering the whole portfolio
     - get_all_projects: Retrieve all projects (supports API filtering)
     - get_project_by_id: Get a specific project by ID
     - get_projects_by_category: Filter projects by category (ai, real-time-graphics, web, mobile, other)
     - get_projects_by_technology: Find projects using specific technologies
+    - get_projects_by_client: Get all projects for a client, resolving aliases (e.g. VCT -> Riot Games)
     - get_featured_projects: Get featured/highlighted projects
     - search_projects: Search projects by title, description, or technologies
     - get_projects_by_status: Filter by status (completed, ongoing, planned)
     - get_projects_by_year: Filter by project year
+    - get_projects_active_between: Projects active during a period (overlapping and ongoing)
     - get_recent_projects: Get most recent projects by end date (ongoing projects first)
+    - get_related_projects: Find projects similar to a given project
+    - search_site_content: Search the pre-crawled text of the portfolio site and blog
     - get_all_technologies: List all technologies used across projects
+    - get_canonical_technologies: Technologies with duplicate spellings merged, with counts and variants
     - get_all_categories: List all project categories
     - get_project_statistics: Get portfolio statistics and metrics
+    """
+
+# Initialize the MCP server
+if READ_ONLY:
+    mcp = FastMCP(
+        name=os.getenv('MCP_SERVER_NAME', 'Hugo Portfolio API Server'),
+        instructions="""
+    This MCP server provides read-only access to Hugo's portfolio via the existing API.
+    It allows AI agents to query project information, technologies, categories,
+    and statistics to help answer questions about Hugo's work and expertise.
+    
+    Available tools:""" + READ_INSTRUCTIONS
+    )
+else:
+    mcp = FastMCP(
+        name=os.getenv('MCP_SERVER_NAME', 'Hugo Portfolio Management Server'),
+        instructions="""
+    This MCP server provides full CRUD (Create, Read, Update, Delete) access to Hugo's portfolio.
+    It allows AI agents to completely manage portfolio data including projects, technologies, and metadata.
     
+    READ OPERATIONS:""" + READ_INSTRUCTIONS + """
     WRITE OPERATIONS:
     - create_project: Create a new project
     - update_project: Update an existing project
@@ -46,7 +84,20 @@ mcp = FastMCP(
     - set_project_featured: Set project featured status
     - bulk_update_roles: Update roles for multiple projects
     """
-)
+    )
+mcp.add_middleware(ToolMetricsMiddleware())
+mcp.add_middleware(tool_tracing_middleware())
+mcp.add_middleware(slow_tool_call_middleware(snapshot_state))
+mcp.add_middleware(deadline_middleware())
+configure_tracing('portfolio-mcp' if READ_ONLY else 'portfolio-management-mcp')
+
+# Hidden from, and refused on, the read-only endpoints (see endpoints.py)
+WRITE_TOOLS = {
+    "create_project", "update_project", "delete_project", "update_project_role",
+    "update_project_status", "update_project_technologies", "update_project_description",
+    "update_project_impact", "set_project_featured", "bulk_update_roles",
+}
+mcp.add_middleware(read_only_middleware(WRITE_TOOLS, always=READ_ONLY))
 
 
 @mcp.tool()()
@@ -94,6 +145,25 @@ async def get_all_projects(featured: Optional[bool] = None, category: Optional[s
         return {"error": f"Failed to retrieve projects: {str(e)}"}
 
 
+@mcp.tool()
+async def get_portfolio_digest() -> Dict[str, Any]:
+    """
+    Get a compact overview of every project in Hugo's portfolio in one call.
+    Start here for broad questions, then use get_project_by_id for details.
+    
+    Returns:
+        Dictionary containing the total project count, the line format
+        ("id | title | client | years | category | technologies") and the
+        digest itself, one line per project with canonical technology names
+    """
+    try:
+        client = await get_api_client()
+        result = await client.get_portfolio_digest()
+        return result
+    except Exception as e:
+        return {"error": f"Failed to retrieve portfolio digest: {str(e)}"}
+
+
 @mcp.tool()()
 async def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -151,6 +221,27 @@ async def get_projects_by_technology(technology: str) -> List[Dict[str, Any]]:
         return [{"error": f"Failed to retrieve projects by technology: {str(e)}"}]
 
 
+@mcp.tool()
+async def get_projects_by_client(name: str) -> Dict[str, Any]:
+    """
+    Get every project Hugo did for a client in one call. Aliases are resolved, so
+    "Riot Games", "Riot", "VCT", "Valorant", "LCS" or "MSI" all return Riot Games work.
+    
+    Args:
+        name: Client name or any known alias
+        
+    Returns:
+        Dictionary containing the canonical client, its aliases, all matching
+        projects and the terms each project matched on
+    """
+    try:
+        client = await get_api_client()
+        result = await client.get_projects_by_client(name)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to retrieve projects by client: {str(e)}"}
+
+
 @mcp.tool()
 async def get_featured_projects() -> List[Dict[str, Any]]:
     """
@@ -224,6 +315,27 @@ async def get_projects_by_year(year: int) -> List[Dict[str, Any]]:
         return [{"error": f"Failed to retrieve projects by year: {str(e)}"}]
 
 
+@mcp.tool()
+async def get_projects_active_between(start: str, end: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get projects Hugo was working on at any point during a period, including
+    projects that started earlier and ongoing projects.
+    
+    Args:
+        start: Period start as YYYY, YYYY-MM or YYYY-MM-DD (e.g. "2023")
+        end: Period end in the same formats; defaults to the end of the start period
+        
+    Returns:
+        Dictionary containing the overlapping projects ordered by start date
+    """
+    try:
+        client = await get_api_client()
+        result = await client.get_projects_active_between(start, end)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to retrieve active projects: {str(e)}"}
+
+
 @mcp.tool()
 async def get_all_technologies(filter_type: str = 'all') -> List[str]:
     """
@@ -243,6 +355,30 @@ async def get_all_technologies(filter_type: str = 'all') -> List[str]:
         return [f"Error: {str(e)}"]
 
 
+@mcp.tool()
+async def get_canonical_technologies(filter_type: str = 'all') -> List[Dict[str, Any]]:
+    """
+    Get the technologies used across Hugo's projects with duplicate spellings merged.
+    Variants such as "UE5", "Unreal Engine 5" and "unreal engine" are folded into one
+    canonical technology. Prefer this over get_all_technologies when counting technologies.
+    
+    Args:
+        filter_type: 'all', 'technology', 'tool', 'skill', 'responsibility', 'process', 'hardware', 'other'
+    
+    Returns:
+        List of canonical technologies, most used first, each with:
+        - technology: Canonical name
+        - count: Number of projects using any of its variants
+        - variants: Spellings found in the project data
+    """
+    try:
+        client = await get_api_client()
+        technologies = await client.get_canonical_technologies(filter_type=filter_type)
+        return technologies
+    except Exception as e:
+        return [{"error": f"Failed to normalize technologies: {str(e)}"}]
+
+
 @mcp.tool()
 async def get_technology_categories() -> Dict[str, List[str]]:
     """
@@ -315,6 +451,54 @@ async def get_recent_projects(limit: int = 5) -> Dict[str, Any]:
         return {"error": f"Failed to retrieve recent projects: {str(e)}"}
 
 
+@mcp.tool()
+async def get_related_projects(project_id: str, k: int = 5) -> Dict[str, Any]:
+    """
+    Find the projects most similar to a given project, based on shared
+    technologies and description text.
+    
+    Args:
+        project_id: The unique identifier of the project to compare against
+        k: Number of related projects to return (default: 5)
+        
+    Returns:
+        Dictionary with the related projects, most similar first, each with its
+        id, title, similarity score (0-1) and shared technologies
+    """
+    try:
+        client = await get_api_client()
+        result = await client.get_related_projects(project_id, k)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to retrieve related projects: {str(e)}"}
+
+
+@mcp.tool()
+async def search_site_content(query: str, k: int = 5) -> Dict[str, Any]:
+    """
+    Search the text of Hugo's portfolio site and blog posts.
+    
+    Uses a local index built offline from the sites, so it is much faster than
+    crawling them. Use it for questions about blog posts or site content that
+    is not in the project data.
+    
+    Args:
+        query: Words to search for
+        k: Number of passages to return (default: 5)
+        
+    Returns:
+        Dictionary with the best matching passages, each with its page URL,
+        page title, relevance score and text, and when the index was built
+    """
+    try:
+        index = get_site_index()
+        return {"results": index.search(query, k), "index_built_at": index.built_at}
+    except FileNotFoundError:
+        return {"error": "Failed to search site content: the site index has not been built yet"}
+    except Exception as e:
+        return {"error": f"Failed to search site content: {str(e)}"}
+
+
 @mcp.tool()
 async def get_hugo_expertise_summary() -> Dict[str, Any]:
     """
@@ -329,29 +513,17 @@ async def get_hugo_expertise_summary() -> Dict[str, Any]:
     """
     try:
         client = await get_api_client()
+        summary = await client.get_expertise_summary()
+        if "error" in summary:
+            return summary
         
-        # Get basic statistics
-        stats = await client.get_project_statistics()
-        
-        # Get filtered technologies (actual technologies only)
-        technologies = await client.get_all_technologies(filter_type='technology')
-        
-        # Get featured projects for highlights
-        featured_projects = await client.get_featured_projects()
-        
-        # Get projects by category for specialization analysis
-        categories = await client.get_all_categories()
-        category_breakdown = {}
-        for category in categories:
-            category_projects = await client.get_projects_by_category(category)
-            category_breakdown[category] = len(category_projects)
-        
+        categories = summary["categories"]
         return {
-            "total_projects": stats.get("total_projects", 0),
-            "featured_projects": stats.get("featured_projects", 0),
-            "technologies_count": len(technologies),
-            "top_technologies": stats.get("top_technologies", [])[:5],  # Top 5
-            "categories": category_breakdown,
+            "total_projects": summary["total_projects"],
+            "featured_projects": summary["featured_projects"],
+            "technologies_count": summary["technologies_count"],
+            "top_technologies": summary["top_technologies"],  # Top 5
+            "categories": categories,
             "featured_highlights": [
                 {
                     "title": project.get("title", "Unknown"),
@@ -359,9 +531,9 @@ async def get_hugo_expertise_summary() -> Dict[str, Any]:
                     "technologies": project.get("technologies", [])[:3],  # Top 3 technologies
                     "description": (project.get("description", "")[:100] + "...") if len(project.get("description", "")) > 100 else project.get("description", "")
                 }
-                for project in featured_projects[:3]  # Top 3 featured projects
+                for project in summary["featured_highlights"]  # Top 3 featured projects
             ],
-            "experience_summary": f"Hugo has {stats.get('total_projects', 0)} projects across {len(categories)} categories, with expertise in {len(technologies)} different technologies."
+            "experience_summary": f"Hugo has {summary['total_projects']} projects across {len(categories)} categories, with expertise in {summary['technologies_count']} different technologies."
         }
     except Exception as e:
         return {"error": f"Failed to generate expertise summary: {str(e)}"}
@@ -592,41 +764,110 @@ async def bulk_update_roles(role_updates: Dict[str, str]) -> Dict[str, Any]:
         return {"error": f"Failed to bulk update roles: {str(e)}"}
 
 
+# Cache invalidation webhook
+@mcp.custom_route("/invalidate", methods=["POST"])
+async def invalidate_projects(request: Request) -> JSONResponse:
+    """
+    Patch or evict changed projects in the snapshot cache.
+    
+    Called by the portfolio admin API after a write. Requires
+    `Authorization: Bearer <MCP_INVALIDATION_TOKEN>` and a JSON body of the form
+    {"project_ids": ["..."]}, or {"all": true} to drop the whole snapshot.
+    """
+    token = os.getenv('MCP_INVALIDATION_TOKEN')
+    if not token:
+        return JSONResponse({"error": "Invalidation is not configured"}, status_code=503)
+    
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return JSONResponse({"error": "Unauthorized"}, status_code=401)
+    
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        return JSONResponse({"error": "Request body must be a JSON object"}, status_code=400)
+    
+    client = await get_api_client()
+    if body.get("all"):
+        client.invalidate_snapshot()
+        return JSONResponse({"invalidated": "all", "version": client.snapshot.version})
+    
+    project_ids = body.get("project_ids")
+    if not isinstance(project_ids, list) or not all(isinstance(i, str) for i in project_ids):
+        return JSONResponse({"error": "project_ids must be a list of strings"}, status_code=400)
+    
+    result = await client.refresh_projects(project_ids)
+    return JSONResponse(result)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus metrics: tool calls, upstream API requests and snapshot cache activity."""
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
 if __name__ == "__main__":
     # Run the server with HTTP transport for easy testing
     port = int(os.getenv('MCP_SERVER_PORT', '8017'))
     host = os.getenv('MCP_SERVER_HOST', '0.0.0.0')
     
-    print(f"Starting Hugo Portfolio Management MCP Server on {host}:{port}")
+    if READ_ONLY:
+        print(f"Starting Hugo Portfolio MCP Server (read-only) on {host}:{port}")
+    else:
+        print(f"Starting Hugo Portfolio Management MCP Server on {host}:{port}")
     print("Available READ tools:")
+    print("- get_portfolio_digest")
     print("- get_all_projects (with filtering)")
     print("- get_project_by_id")
     print("- get_projects_by_category")
     print("- get_projects_by_technology")
+    print("- get_projects_by_client")
     print("- get_featured_projects")
     print("- search_projects")
     print("- get_projects_by_status")
     print("- get_projects_by_year")
+    print("- get_projects_active_between")
     print("- get_recent_projects (most recent by end date)")
+    print("- get_related_projects")
+    print("- search_site_content")
     print("- get_all_technologies")
+    print("- get_canonical_technologies")
     print("- get_all_categories")
     print("- get_project_statistics")
     print("- get_hugo_expertise_summary")
     print()
-    print("Available WRITE tools:")
-    print("- create_project")
-    print("- update_project")
-    print("- delete_project")
-    print("- update_project_role")
-    print("- update_project_status")
-    print("- update_project_technologies")
-    print("- update_project_description")
-    print("- update_project_impact")
-    print("- set_project_featured")
-    print("- bulk_update_roles")
-    print()
+    if not READ_ONLY:
+        print("Available WRITE tools:")
+        print("- create_project")
+        print("- update_project")
+        print("- delete_project")
+        print("- update_project_role")
+        print("- update_project_status")
+        print("- update_project_technologies")
+        print("- update_project_description")
+        print("- update_project_impact")
+        print("- set_project_featured")
+        print("- bulk_update_roles")
+        print()
     print("This server connects to your existing portfolio API at:")
     print(f"  {os.getenv('PORTFOLIO_API_URL', 'http://localhost:3017/api')}")
     print()
     
-    mcp.run(transport="http", host=host, port=port)
\ No newline at end of file
+    # Optionally serve a read-only endpoint from this process, sharing its snapshot cache
+    read_only_path = os.getenv('MCP_READONLY_PATH')
+    read_only_port = int(os.getenv('MCP_READONLY_PORT', '0')) or None
+    if not READ_ONLY and (read_only_path or read_only_port):
+        print("Read/write endpoint:")
+        print(f"  http://{host}:{port}/mcp")
+        print("Read-only endpoint (write tools hidden):")
+        if read_only_path:
+            print(f"  http://{host}:{port}/{read_only_path.strip('/')}/mcp")
+        if read_only_port:
+            print(f"  http://{host}:{read_only_port}/mcp")
+        print()
+        asyncio.run(serve(mcp, host, port, read_only_path, read_only_port))
+    else:
+        mcp.run(transport="http", host=host, port=port)
\ No newline at end of file
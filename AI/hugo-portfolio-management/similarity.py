@@ -0,0 +1,309 @@
+"""
+Related-project search over precomputed project vectors.
+Each project is represented by a canonical-technology one-hot vector and a TF-IDF
+vector of its text, combined into one row-normalized feature matrix. A query
+computes exact cosine similarities against every project plus an argpartition
+for the top k. The matrix is dense while it fits RELATED_DENSE_BUDGET entries
+(one matrix-vector product); larger portfolios keep it sparse and score through
+per-feature postings.
+
+The index listens to the snapshot. A single-project change only re-encodes that
+project, in the vocabulary and IDF weights of the last full build. Full builds
+(first use, full reloads, and every RELATED_REBUILD_AFTER changes) run in a
+worker thread, so they never block other tools on the event loop.
+"""
+
+import asyncio
+import math
+import os
+import re
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+
+import numpy as np
+
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the
+this to was were with using used use via all our their we i my me he his
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _project_text(project: Dict[str, Any]) -> str:
+    parts = [project.get("title"), project.get("description"), project.get("longDescription"),
+             project.get("client"), project.get("role"), project.get("impact")]
+    parts.extend(project.get("responsibilities") or [])
+    return " ".join(p for p in parts if p)
+
+
+class FeatureSpace:
+    """Technology and text vocabularies (with IDF weights) that project vectors are encoded in."""
+
+    def __init__(self, technologies: List[frozenset], documents: List[List[str]], technology_weight: float):
+        self.technology_vocabulary: Dict[str, int] = {}
+        for techs in technologies:
+            for tech in techs:
+                self.technology_vocabulary.setdefault(tech, len(self.technology_vocabulary))
+        n = len(documents)
+        df = Counter(term for tokens in documents for term in set(tokens))
+        # Terms in a single document or in most documents cannot separate projects
+        self.text_vocabulary: Dict[str, int] = {}
+        for term, freq in df.items():
+            if 2 <= freq <= max(2, n // 2):
+                self.text_vocabulary[term] = len(self.text_vocabulary)
+        self.idf = {term: math.log((1 + n) / (1 + df[term])) + 1.0 for term in self.text_vocabulary}
+        self.dims = max(len(self.technology_vocabulary) + len(self.text_vocabulary), 1)
+        self._technology_scale = math.sqrt(technology_weight)
+        self._text_scale = math.sqrt(1.0 - technology_weight)
+
+    def encode(self, technologies: frozenset, tokens: List[str]) -> Tuple[List[int], List[float]]:
+        """Unit-length (features, weights) of one project; entries outside the vocabularies are dropped."""
+        tech_features = [self.technology_vocabulary[t] for t in technologies if t in self.technology_vocabulary]
+        tech_weight = self._technology_scale / math.sqrt(len(tech_features)) if tech_features else 0.0
+        counts = Counter(t for t in tokens if t in self.text_vocabulary)
+        text = [(self.text_vocabulary[t], (1.0 + math.log(tf)) * self.idf[t]) for t, tf in counts.items()]
+        text_norm = math.sqrt(sum(w * w for _, w in text)) or 1.0
+
+        offset = len(self.technology_vocabulary)
+        features = tech_features + [offset + f for f, _ in text]
+        weights = [tech_weight] * len(tech_features) + [w / text_norm * self._text_scale for _, w in text]
+        norm = math.sqrt(sum(w * w for w in weights)) or 1.0
+        return features, [w / norm for w in weights]
+
+
+class RelatedProjectsIndex:
+    """
+    Snapshot listener with cosine similarity over technology and text features of every project.
+    Call ensure() before querying, so that any pending full build has run.
+    """
+
+    def __init__(self, technology_weight: float = None, dense_budget: int = None, rebuild_after: int = None):
+        """
+        Args:
+            technology_weight: Share of the similarity taken from technologies (the rest from text)
+            dense_budget: Largest projects x features matrix kept dense; bigger ones stay sparse
+            rebuild_after: Single-project changes applied before the next query rebuilds from scratch,
+                picking up new vocabulary and IDF weights
+        """
+        self.technology_weight = technology_weight if technology_weight is not None else float(os.getenv('RELATED_TECHNOLOGY_WEIGHT', '0.6'))
+        self.dense_budget = dense_budget or int(os.getenv('RELATED_DENSE_BUDGET', '16000000'))
+        self.rebuild_after = rebuild_after if rebuild_after is not None else int(os.getenv('RELATED_REBUILD_AFTER', '500'))
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.technologies: List[frozenset] = []
+        self.position: Dict[str, int] = {}
+        self.space: Optional[FeatureSpace] = None
+        self.vectors: Optional[np.ndarray] = None
+        # Sparse layout: row-major (CSR) for a project's features, column-major (CSC) postings to score them
+        self._row_ptr = self._row_cols = self._row_data = None
+        self._col_ptr = self._col_rows = self._col_data = None
+        self._built_rows = 0
+        # Rows re-encoded since the last full build (replacing the built row, or appended), and removed rows
+        self._changed: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._removed: set = set()
+        self._changed_entries = None
+        self._canonical: Callable[[str], str] = lambda tech: tech
+        self._stale = True
+        # Changes reported while a full build is running, by ID (None for deletions)
+        self._pending: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+        self._lock = asyncio.Lock()
+        self._results: Dict[tuple, List[Dict[str, Any]]] = {}
+
+    # Snapshot listener interface
+    def reset(self, projects: Iterable[Dict[str, Any]]) -> None:
+        # Rebuilt by the next ensure(), off the event loop
+        self._stale = True
+        self._results = {}
+
+    def update(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        project_id = (new or old).get("id")
+        if not project_id:
+            return
+        if self._pending is not None:
+            self._pending[project_id] = new
+        elif not self._stale:
+            self._apply(project_id, new)
+
+    async def ensure(self, snapshot, canonical: Callable[[str], str]) -> "RelatedProjectsIndex":
+        """Run the pending full build, if any, in a worker thread; concurrent callers wait for it."""
+        self._canonical = canonical
+        async with self._lock:
+            while self._stale:
+                self._stale = False
+                self._pending = {}
+                try:
+                    built = await asyncio.to_thread(self.build, snapshot.ordered(), canonical)
+                except BaseException:
+                    self._stale = True
+                    self._pending = None
+                    raise
+                pending, self._pending = self._pending, None
+                self.__dict__.update(built)
+                # Changes made while the build read the snapshot
+                for project_id, project in pending.items():
+                    self._apply(project_id, project)
+        return self
+
+    def build(self, projects: Iterable[Dict[str, Any]], canonical: Callable[[str], str]) -> Dict[str, Any]:
+        """Index state for the given projects, to install on the index; touches nothing shared."""
+        projects = [p for p in projects if p.get("id")]
+        ids = [p["id"] for p in projects]
+        technologies = [frozenset(canonical(t) for t in p.get("technologies") or []) for p in projects]
+        documents = [tokenize(_project_text(p)) for p in projects]
+        space = FeatureSpace(technologies, documents, self.technology_weight)
+
+        n = len(projects)
+        rows, cols, data = [], [], []
+        for i in range(n):
+            features, weights = space.encode(technologies[i], documents[i])
+            rows.extend([i] * len(features))
+            cols.extend(features)
+            data.extend(weights)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        data = np.asarray(data, dtype=np.float32)
+
+        built = {
+            "ids": ids,
+            "titles": [p.get("title", "") for p in projects],
+            "technologies": technologies,
+            "position": {project_id: i for i, project_id in enumerate(ids)},
+            "space": space,
+            "_built_rows": n,
+            "_changed": {},
+            "_removed": set(),
+            "_changed_entries": None,
+            "_results": {},
+            "vectors": None,
+            "_row_ptr": None,
+            "_col_ptr": None,
+        }
+        if n * space.dims <= self.dense_budget:
+            vectors = np.zeros((n, space.dims), dtype=np.float32)
+            vectors[rows, cols] = data
+            built["vectors"] = vectors
+        else:
+            # Rows are already in order; postings are the same entries sorted by feature
+            order = np.argsort(cols, kind="stable")
+            built.update({
+                "_row_ptr": np.searchsorted(rows, np.arange(n + 1)),
+                "_row_cols": cols,
+                "_row_data": data,
+                "_col_ptr": np.searchsorted(cols[order], np.arange(space.dims + 1)),
+                "_col_rows": rows[order],
+                "_col_data": data[order],
+            })
+        return built
+
+    def _apply(self, project_id: str, project: Optional[Dict[str, Any]]) -> None:
+        """Re-encode, add or (project None) remove one project in the built feature space."""
+        self._results = {}
+        self._changed_entries = None
+        i = self.position.get(project_id)
+        if project is None:
+            if i is not None:
+                del self.position[project_id]
+                self._changed.pop(i, None)
+                self._removed.add(i)
+        else:
+            if i is None:
+                i = self.position[project_id] = len(self.ids)
+                self.ids.append(project_id)
+                self.titles.append("")
+                self.technologies.append(frozenset())
+            self.titles[i] = project.get("title", "")
+            self.technologies[i] = frozenset(self._canonical(t) for t in project.get("technologies") or [])
+            features, weights = self.space.encode(self.technologies[i], tokenize(_project_text(project)))
+            self._changed[i] = (np.asarray(features, dtype=np.int64), np.asarray(weights, dtype=np.float32))
+        if len(self._changed) + len(self._removed) > self.rebuild_after:
+            self._stale = True
+
+    def _query(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(features, weights) of project i."""
+        if i in self._changed:
+            return self._changed[i]
+        if self.vectors is not None:
+            features = np.flatnonzero(self.vectors[i])
+            return features, self.vectors[i, features]
+        lo, hi = self._row_ptr[i], self._row_ptr[i + 1]
+        return self._row_cols[lo:hi], self._row_data[lo:hi]
+
+    def _scores(self, i: int) -> np.ndarray:
+        """Cosine similarity of project i to every row (-inf for removed rows)."""
+        scores = np.full(len(self.ids), -np.inf)
+        if self.vectors is not None and i < self._built_rows and i not in self._changed:
+            scores[:self._built_rows] = self.vectors @ self.vectors[i]
+        else:
+            features, weights = self._query(i)
+            if self.vectors is not None:
+                scores[:self._built_rows] = self.vectors[:, features] @ weights
+            else:
+                starts, stops = self._col_ptr[features], self._col_ptr[features + 1]
+                lengths = stops - starts
+                # Indices of every posting of the query's features, without a Python loop
+                offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+                contributions = self._col_data[offsets] * np.repeat(weights, lengths)
+                scores[:self._built_rows] = np.bincount(self._col_rows[offsets], weights=contributions,
+                                                        minlength=self._built_rows)
+        if self._changed:
+            rows, entry_rows, entry_cols, entry_data = self._changed_arrays()
+            query = np.zeros(self.space.dims, dtype=np.float32)
+            features, weights = self._query(i)
+            query[features] = weights
+            scores[rows] = np.bincount(entry_rows, weights=entry_data * query[entry_cols], minlength=len(rows))
+        if self._removed:
+            scores[list(self._removed)] = -np.inf
+        return scores
+
+    def _changed_arrays(self) -> tuple:
+        """Re-encoded rows as flat (rows, entry slot, feature, weight) arrays, cached until the next change."""
+        if self._changed_entries is None:
+            rows = np.fromiter(self._changed, dtype=np.int64, count=len(self._changed))
+            vectors = [self._changed[i] for i in rows]
+            lengths = [len(features) for features, _ in vectors]
+            self._changed_entries = (
+                rows,
+                np.repeat(np.arange(len(rows)), lengths),
+                np.concatenate([features for features, _ in vectors]),
+                np.concatenate([weights for _, weights in vectors]),
+            )
+        return self._changed_entries
+
+    def related(self, project_id: str, k: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """Top-k most similar projects, or None if the project is not in the index."""
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        i = self.position.get(project_id)
+        if i is None:
+            return None
+        k = min(k, len(self.position) - 1)
+        cached = self._results.get((i, k))
+        if cached is not None:
+            return cached
+
+        scores = self._scores(i)
+        scores[i] = -np.inf
+        if k < 1:
+            top = np.arange(0)
+        elif k < len(scores):
+            top = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")][:k]
+
+        result = [
+            {
+                "id": self.ids[j],
+                "title": self.titles[j],
+                "similarity": round(float(scores[j]), 4),
+                "shared_technologies": sorted(self.technologies[i] & self.technologies[j]),
+            }
+            for j in top
+        ]
+        self._results[(i, k)] = result
+        return result
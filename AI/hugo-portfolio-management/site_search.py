@@ -0,0 +1,302 @@
+"""
+Local search over pre-crawled portfolio and blog pages.
+An offline ingestion run (`python site_search.py ingest`, e.g. from cron) fetches
+the sites, extracts and chunks their text and writes the chunks to
+SITE_INDEX_FILE. The server loads that file into a BM25 index, reloading it when
+the file changes, so `search_site_content` is an in-memory lookup instead of a
+browser session inside the agent's loop.
+
+Pages are fetched over plain HTTP and parsed with the standard library, which
+covers server-rendered sites; pages are discovered from sitemap.xml and links
+within the same host.
+
+Usage:
+    python site_search.py ingest --url https://blog.hugovalverde.com --url https://portfolio.hugovalverde.com
+    python site_search.py ingest --url https://blog.hugovalverde.com --every 21600
+    python site_search.py search "unreal engine virtual production"
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urldefrag, urlparse
+
+import httpx
+
+from similarity import tokenize
+
+
+DEFAULT_INDEX_FILE = "site_index.json"
+
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "svg", "nav", "footer", "form", "template"})
+_BLOCK_TAGS = frozenset({"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6",
+                         "pre", "blockquote", "tr", "br", "main"})
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the title, visible text (one block per line) and links of a page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.links: List[str] = []
+        self._blocks: List[str] = []
+        self._current: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href)
+        if tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        if tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data.strip()
+        elif not self._skip_depth:
+            self._current.append(data)
+
+    def _flush(self):
+        text = re.sub(r"\s+", " ", "".join(self._current)).strip()
+        if text:
+            self._blocks.append(text)
+        self._current = []
+
+    def text(self) -> str:
+        self._flush()
+        return "\n".join(self._blocks)
+
+
+def extract_page(html: str) -> Tuple[str, str, List[str]]:
+    """Return (title, text, links) of an HTML page."""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.title, parser.text(), parser.links
+
+
+def chunk_text(text: str, size: int = 800, overlap: int = 1) -> List[str]:
+    """Split text into chunks of about `size` characters at block boundaries, repeating `overlap` blocks."""
+    blocks = [b for b in text.split("\n") if b.strip()]
+    chunks, current, length = [], [], 0
+    for block in blocks:
+        if current and length + len(block) > size:
+            chunks.append(" ".join(current))
+            current = current[-overlap:] if overlap else []
+            length = sum(len(b) for b in current)
+        current.append(block)
+        length += len(block)
+    if current and (not chunks or len(current) > overlap):
+        chunks.append(" ".join(current))
+    return chunks
+
+
+async def crawl_sites(start_urls: List[str], max_pages: int = 200, concurrency: int = 4,
+                      timeout: float = 15.0) -> List[Dict[str, Any]]:
+    """
+    Fetch pages reachable from `start_urls` (and their hosts' sitemap.xml) without leaving those hosts.
+    Returns one {"url", "title", "text"} per HTML page.
+    """
+    hosts = {urlparse(url).netloc for url in start_urls}
+    queue: List[str] = list(start_urls)
+    seen = set(queue)
+    pages: List[Dict[str, Any]] = []
+
+    def enqueue(link: str, base: str) -> None:
+        url = urldefrag(urljoin(base, link))[0]
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https") and parsed.netloc in hosts and url not in seen:
+            seen.add(url)
+            queue.append(url)
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": "portfolio-site-ingest"}) as client:
+        for start in start_urls:
+            sitemap = urljoin(start, "/sitemap.xml")
+            try:
+                response = await client.get(sitemap)
+                if response.status_code == 200:
+                    for loc in re.findall(r"<loc>\s*([^<\s]+)\s*</loc>", response.text):
+                        enqueue(loc, sitemap)
+            except httpx.HTTPError:
+                pass
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> None:
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                except httpx.HTTPError as e:
+                    print(f"  skip {url}: {e}")
+                    return
+            if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+                return
+            title, text, links = extract_page(response.text)
+            if text:
+                pages.append({"url": str(response.url), "title": title, "text": text})
+            for link in links:
+                enqueue(link, str(response.url))
+
+        while queue and len(pages) < max_pages:
+            batch, queue[:] = queue[:max_pages - len(pages)], queue[max_pages - len(pages):]
+            await asyncio.gather(*(fetch(url) for url in batch))
+
+    return pages[:max_pages]
+
+
+def build_chunks(pages: List[Dict[str, Any]], chunk_size: int = 800) -> List[Dict[str, Any]]:
+    chunks = []
+    for page in pages:
+        for i, text in enumerate(chunk_text(page["text"], chunk_size)):
+            chunks.append({"url": page["url"], "title": page["title"], "chunk": i, "text": text})
+    return chunks
+
+
+def write_index(chunks: List[Dict[str, Any]], path: str, sources: List[str]) -> None:
+    # Write then rename, so a server reloading the file never reads a partial one
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "sources": sources,
+            "pages": len({c["url"] for c in chunks}),
+            "chunks": chunks,
+        }, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+class SiteSearchIndex:
+    """BM25 index over the chunks in SITE_INDEX_FILE, reloaded when the file changes."""
+
+    def __init__(self, path: Optional[str] = None, k1: float = 1.5, b: float = 0.75):
+        self.path = path or os.getenv('SITE_INDEX_FILE', DEFAULT_INDEX_FILE)
+        self.k1 = k1
+        self.b = b
+        self.chunks: List[Dict[str, Any]] = []
+        self.built_at: Optional[str] = None
+        self._mtime: Optional[float] = None
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+        self._average_length = 0.0
+
+    def ensure(self) -> "SiteSearchIndex":
+        """Load or reload the index file if it changed; raises FileNotFoundError if it was never built."""
+        mtime = os.stat(self.path).st_mtime
+        if mtime != self._mtime:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.build(data.get("chunks", []))
+            self.built_at = data.get("built_at")
+            self._mtime = mtime
+        return self
+
+    def build(self, chunks: List[Dict[str, Any]]) -> None:
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        lengths = []
+        for i, chunk in enumerate(chunks):
+            tokens = tokenize(f"{chunk.get('title', '')} {chunk['text']}")
+            lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                postings[term].append((i, count))
+        self.chunks = chunks
+        self._postings = dict(postings)
+        self._lengths = lengths
+        self._average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        n = len(self.chunks)
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for i, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[i] / (self._average_length or 1))
+                scores[i] += idf * tf * (self.k1 + 1) / (tf + norm)
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [
+            {"url": self.chunks[i]["url"], "title": self.chunks[i].get("title", ""),
+             "score": round(score, 3), "text": self.chunks[i]["text"]}
+            for i, score in best
+        ]
+
+
+_index: Optional[SiteSearchIndex] = None
+
+
+def get_site_index() -> SiteSearchIndex:
+    global _index
+    if _index is None:
+        _index = SiteSearchIndex()
+    return _index.ensure()
+
+
+async def ingest(urls: List[str], output: str, max_pages: int, chunk_size: int) -> None:
+    started = time.perf_counter()
+    pages = await crawl_sites(urls, max_pages=max_pages)
+    chunks = build_chunks(pages, chunk_size)
+    write_index(chunks, output, urls)
+    print(f"Indexed {len(pages)} pages as {len(chunks)} chunks into {output} "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the local site content index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = sub.add_parser("ingest", help="Crawl sites and write the index")
+    ingest_parser.add_argument("--url", action="append", required=True, help="Start URL (repeatable)")
+    ingest_parser.add_argument("--output", default=os.getenv('SITE_INDEX_FILE', DEFAULT_INDEX_FILE))
+    ingest_parser.add_argument("--max-pages", type=int, default=200)
+    ingest_parser.add_argument("--chunk-size", type=int, default=800, help="Approximate characters per chunk")
+    ingest_parser.add_argument("--every", type=float, help="Re-ingest every N seconds instead of once")
+    search_parser = sub.add_parser("search", help="Query the index")
+    search_parser.add_argument("query")
+    search_parser.add_argument("-k", type=int, default=5)
+    search_parser.add_argument("--index", default=os.getenv('SITE_INDEX_FILE', DEFAULT_INDEX_FILE))
+    args = parser.parse_args()
+
+    if args.command == "search":
+        for hit in SiteSearchIndex(args.index).ensure().search(args.query, args.k):
+            print(f"{hit['score']:7.3f}  {hit['url']}  {hit['title']}\n         {hit['text'][:160]}")
+        return
+
+    while True:
+        try:
+            asyncio.run(ingest(args.url, args.output, args.max_pages, args.chunk_size))
+        except Exception as e:
+            if not args.every:
+                raise
+            print(f"Ingestion failed: {e}")
+        if not args.every:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+In-memory snapshot of Hugo's portfolio projects.
+The snapshot is loaded in full from the portfolio API and then kept up to date
+by patching or evicting individual projects when the admin API reports changes.
+Patches that arrive while a full reload is in flight are re-applied on top of
+the reloaded list, since the reload may have read the API before the change.
+"""
+
+import time
+from typing import List, Dict, Any, Optional, Iterable
+
+
+def _sort_like_api(projects: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort projects the way the portfolio API does: featured first, then order, then newest start date."""
+    result = sorted(projects, key=lambda p: p.get("startDate") or "", reverse=True)
+    result.sort(key=lambda p: (not p.get("featured", False), p.get("order") or 0))
+    return result
+
+
+class ProjectSnapshot:
+    """Projects keyed by ID, with a version that changes on every modification."""
+
+    def __init__(self, ttl: float = 300.0):
+        """Initialize an empty snapshot; `ttl` is the maximum age in seconds before a full reload."""
+        self.ttl = ttl
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self.loaded_at: Optional[float] = None
+        self._ordered: Optional[List[Dict[str, Any]]] = None
+        self._listeners = []
+        # Changes made while a reload is in flight, by ID (None for evictions)
+        self._pending: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    @property
+    def is_reloading(self) -> bool:
+        return self._pending is not None
+
+    @property
+    def accepts_patches(self) -> bool:
+        """True when single-project changes matter: the snapshot is loaded or being loaded."""
+        return self.is_loaded or self.is_reloading
+
+    @property
+    def is_stale(self) -> bool:
+        """True when the snapshot was never loaded or is older than its TTL."""
+        if self.loaded_at is None:
+            return True
+        return self.ttl > 0 and (time.monotonic() - self.loaded_at) > self.ttl
+
+    def add_listener(self, listener) -> None:
+        """
+        Register an object that keeps derived data in sync with the snapshot.
+
+        Listeners implement `reset(projects)` for full loads and
+        `update(old, new)` for single-project changes, where `old` or `new`
+        is None for inserts and deletions respectively.
+        """
+        self._listeners.append(listener)
+        if self.is_loaded:
+            listener.reset(self.ordered())
+
+    def ordered(self) -> List[Dict[str, Any]]:
+        """Return all projects in API order. The list is cached per version."""
+        if self._ordered is None:
+            self._ordered = _sort_like_api(self.projects.values())
+        return self._ordered
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        return self.projects.get(project_id)
+
+    def begin_reload(self) -> None:
+        """Start recording patches; call before fetching the list passed to replace()."""
+        self._pending = {}
+
+    def abort_reload(self) -> None:
+        self._pending = None
+
+    def replace(self, projects: Iterable[Dict[str, Any]]) -> None:
+        """Replace the whole snapshot with a freshly fetched project list."""
+        self.projects = {p["id"]: p for p in projects if p.get("id")}
+        # The list may predate patches made while it was being fetched
+        for project_id, project in (self._pending or {}).items():
+            if project is None:
+                self.projects.pop(project_id, None)
+            else:
+                self.projects[project_id] = project
+        self._pending = None
+        self.loaded_at = time.monotonic()
+        self._bump()
+        ordered = self.ordered()
+        for listener in self._listeners:
+            listener.reset(ordered)
+
+    def upsert(self, project: Dict[str, Any]) -> None:
+        """Insert or replace a single project."""
+        old = self.projects.get(project["id"])
+        self.projects[project["id"]] = project
+        if self._pending is not None:
+            self._pending[project["id"]] = project
+        self._bump()
+        for listener in self._listeners:
+            listener.update(old, project)
+
+    def evict(self, project_id: str) -> bool:
+        """Remove a single project. Returns False if it was not in the snapshot."""
+        old = self.projects.pop(project_id, None)
+        if self._pending is not None:
+            self._pending[project_id] = None
+        if old is None:
+            return False
+        self._bump()
+        for listener in self._listeners:
+            listener.update(old, None)
+        return True
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next read."""
+        self.loaded_at = None
+
+    def _bump(self) -> None:
+        self.version += 1
+        self._ordered = None
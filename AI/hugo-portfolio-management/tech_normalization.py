@@ -0,0 +1,179 @@
+"""
+Technology normalization and near-duplicate clustering.
+Project technology lists are free text, so the same technology shows up as
+"UE5", "Unreal Engine 5" and "unreal engine". This module folds those variants
+into canonical technologies once per snapshot version.
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Iterable, Callable
+
+
+# Canonical name -> known aliases. Extend with TECH_ALIASES_FILE (same JSON shape).
+DEFAULT_ALIASES: Dict[str, List[str]] = {
+    "Unreal Engine": ["UE", "UE4", "UE5", "Unreal", "Unreal Engine 4", "Unreal Engine 5", "Unreal Engine 5 (UE5)"],
+    "Unity": ["Unity3D", "Unity 3D", "Unity Engine"],
+    "JavaScript": ["JS", "ECMAScript"],
+    "TypeScript": ["TS"],
+    "Node.js": ["Node", "NodeJS"],
+    "Next.js": ["NextJS"],
+    "React": ["ReactJS", "React.js"],
+    "Vue": ["VueJS", "Vue.js"],
+    "Python": ["Python3", "Py"],
+    "PostgreSQL": ["Postgres", "Postgre SQL", "psql"],
+    "Kubernetes": ["k8s"],
+    "Tailwind CSS": ["Tailwind", "TailwindCSS"],
+    "Model Context Protocol": ["MCP"],
+    "Amazon Web Services": ["AWS"],
+    "Google Cloud Platform": ["GCP", "Google Cloud"],
+    "Adobe After Effects": ["After Effects", "AE"],
+    "Adobe Photoshop": ["Photoshop"],
+    "TouchDesigner": ["Touch Designer"],
+    "OpenAI API": ["OpenAI"],
+    "LangChain": ["Lang Chain"],
+}
+
+_SEPARATORS = re.compile(r"[\s\-_/]+")
+_PUNCTUATION = re.compile(r"[^\w+#\s]")
+_TRAILING_VERSION = re.compile(r"\s+v?\d+(\.\d+)*$")
+
+
+def normalize_key(entry: str) -> str:
+    """
+    Reduce a technology entry to a comparison key.
+    Case-folds, drops trailing version numbers, strips punctuation (keeping the
+    '+' and '#' that distinguish C++ and C#) and removes whitespace.
+    """
+    key = _SEPARATORS.sub(" ", entry.casefold()).strip()
+    key = _TRAILING_VERSION.sub("", key)
+    key = _PUNCTUATION.sub("", key)
+    return key.replace(" ", "")
+
+
+def _trigrams(key: str) -> frozenset:
+    padded = f"##{key}#"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def load_aliases() -> Dict[str, List[str]]:
+    """Return the default alias table merged with the optional TECH_ALIASES_FILE."""
+    aliases = {canonical: list(variants) for canonical, variants in DEFAULT_ALIASES.items()}
+    path = os.getenv('TECH_ALIASES_FILE')
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for canonical, variants in json.load(f).items():
+                aliases.setdefault(canonical, []).extend(variants)
+    return aliases
+
+
+class TechnologyNormalizer:
+    """Clusters the snapshot's technology entries into canonical technologies."""
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None, threshold: Optional[float] = None):
+        """
+        Args:
+            aliases: Canonical name -> alias list; defaults to load_aliases()
+            threshold: Trigram Jaccard similarity at which two keys are merged
+        """
+        aliases = aliases if aliases is not None else load_aliases()
+        self.threshold = threshold if threshold is not None else float(os.getenv('TECH_SIMILARITY_THRESHOLD', '0.8'))
+        # Normalized key -> canonical name
+        self._alias_keys: Dict[str, str] = {}
+        for canonical, variants in aliases.items():
+            for name in [canonical, *variants]:
+                self._alias_keys[normalize_key(name)] = canonical
+        self._keys: Dict[str, str] = {}
+        self._built_version: Optional[int] = None
+        self.clusters: List[Dict[str, Any]] = []
+        self.canonical_of: Dict[str, str] = {}
+
+    def key(self, entry: str) -> str:
+        """Memoized normalize_key, since the same entries recur across versions."""
+        key = self._keys.get(entry)
+        if key is None:
+            key = self._keys[entry] = normalize_key(entry)
+        return key
+
+    def ensure(self, snapshot) -> "TechnologyNormalizer":
+        """Rebuild the clusters if the snapshot changed since the last build."""
+        if self._built_version != snapshot.version:
+            self.build(snapshot.ordered())
+            self._built_version = snapshot.version
+        return self
+
+    def build(self, projects: Iterable[Dict[str, Any]]) -> None:
+        # Variant -> IDs of projects listing it
+        usage: Dict[str, set] = defaultdict(set)
+        for project in projects:
+            for tech in project.get("technologies") or []:
+                usage[tech].add(project.get("id"))
+
+        # Group variants by normalized key, routing alias keys to one group per canonical name
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for variant in usage:
+            key = self.key(variant)
+            if not key:
+                continue
+            canonical = self._alias_keys.get(key)
+            groups[f"={canonical}" if canonical else key].append(variant)
+
+        parent = {group: group for group in groups}
+
+        def find(group):
+            while parent[group] != group:
+                parent[group] = parent[parent[group]]
+                group = parent[group]
+            return group
+
+        # Merge near-duplicate keys, comparing only keys that share a trigram
+        free_keys = [group for group in groups if not group.startswith("=")]
+        grams = {group: _trigrams(group) for group in free_keys}
+        postings: Dict[str, List[str]] = defaultdict(list)
+        for group in free_keys:
+            for gram in grams[group]:
+                postings[gram].append(group)
+        for group in free_keys:
+            candidates = {other for gram in grams[group] for other in postings[gram] if other > group}
+            for other in candidates:
+                a, b = grams[group], grams[other]
+                if len(a & b) / len(a | b) >= self.threshold:
+                    parent[find(other)] = find(group)
+
+        members: Dict[str, List[str]] = defaultdict(list)
+        for group, variants in groups.items():
+            members[find(group)].extend(variants)
+
+        clusters = []
+        canonical_of = {}
+        for root, variants in members.items():
+            if root.startswith("="):
+                canonical = root[1:]
+            else:
+                # Most widely used spelling wins, then the shortest
+                canonical = min(variants, key=lambda v: (-len(usage[v]), len(v), v))
+            project_ids = set().union(*(usage[v] for v in variants))
+            clusters.append({
+                "technology": canonical,
+                "count": len(project_ids),
+                "variants": sorted(variants),
+            })
+            for variant in variants:
+                canonical_of[variant] = canonical
+
+        clusters.sort(key=lambda c: (-c["count"], c["technology"].casefold()))
+        self.clusters = clusters
+        self.canonical_of = canonical_of
+
+    def canonical(self, entry: str) -> str:
+        """Canonical name for an entry of the last built snapshot (the entry itself if unknown)."""
+        return self.canonical_of.get(entry, entry)
+
+    def canonical_technologies(self, categorize: Optional[Callable[[str], str]] = None,
+                               filter_type: str = 'all') -> List[Dict[str, Any]]:
+        """Clusters, optionally restricted to one entry type as judged from the canonical name."""
+        if filter_type == 'all' or categorize is None:
+            return self.clusters
+        return [c for c in self.clusters if categorize(c["technology"]) == filter_type]
@@ -0,0 +1,41 @@
+"""
+ClientIndex finds client work under aliases anywhere in a project, while aliases that are
+everyday words ("Riot", "Worlds") only count as the whole client field.
+"""
+
+from client_matcher import AhoCorasick, ClientIndex, DEFAULT_CLIENT_ALIASES, DEFAULT_CLIENT_FIELD_ALIASES
+
+
+PROJECTS = [
+    {"id": "client-field", "client": "Riot", "title": "Broadcast graphics", "description": "Live show package"},
+    {"id": "riot-in-text", "client": "Acme", "title": "Riot of color", "description": "A riot of particles"},
+    {"id": "worlds-in-text", "client": "Acme", "title": "Virtual worlds", "description": "Worlds for VR"},
+    {"id": "alias-in-title", "client": None, "title": "VCT Masters opener", "description": "Stage visuals"},
+    {"id": "partial-word", "client": "Acme", "title": "MSIX installer", "description": "Packaging"},
+]
+
+
+def make_index():
+    index = ClientIndex(aliases=DEFAULT_CLIENT_ALIASES, field_aliases=DEFAULT_CLIENT_FIELD_ALIASES)
+    index.build(PROJECTS)
+    return index
+
+
+def test_riot_matches_only_the_client_field():
+    result = make_index().lookup("Riot")
+    assert result["client"] == "Riot Games"
+    assert sorted(p["id"] for p in result["projects"]) == ["alias-in-title", "client-field"]
+    assert result["matched_terms"]["client-field"] == ["Riot"]
+
+
+def test_field_alias_is_not_matched_in_free_text():
+    index = make_index()
+    assert index.lookup("Worlds")["client"] == "Riot Games"
+    found = {p["id"] for p in index.lookup("Riot Games")["projects"]}
+    assert "riot-in-text" not in found and "worlds-in-text" not in found
+
+
+def test_matches_are_whole_words_and_case_insensitive():
+    matcher = AhoCorasick([("msi", "Riot Games"), ("league of legends", "Riot Games")])
+    assert matcher.find("MSIX build") == []
+    assert matcher.find("at MSI, then League of Legends!") == [("Riot Games", "MSI"), ("Riot Games", "League of Legends")]
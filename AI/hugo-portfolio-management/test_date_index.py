@@ -0,0 +1,62 @@
+"""
+ActiveProjectsIndex answers overlap queries exactly like a brute-force scan over every
+project's date range, ongoing projects and bad dates included.
+"""
+
+import random
+from datetime import date
+
+from date_index import ActiveProjectsIndex, OPEN_END, parse_date, parse_period
+
+
+def random_projects(rng: random.Random, n: int):
+    first = date(2010, 1, 1).toordinal()
+    projects = []
+    for i in range(n):
+        start = first + rng.randrange(15 * 365)
+        project = {"id": str(i), "startDate": date.fromordinal(start).isoformat()}
+        roll = rng.random()
+        if roll < 0.2:
+            project["endDate"] = None
+        elif roll < 0.25:
+            # Ends before it starts: indexed as a single day
+            project["endDate"] = date.fromordinal(start - rng.randrange(1, 30)).isoformat()
+        else:
+            project["endDate"] = date.fromordinal(start + rng.randrange(0, 3 * 365)).isoformat() + "T00:00:00.000Z"
+        if rng.random() < 0.05:
+            project["startDate"] = rng.choice([None, "", "not a date"])
+        projects.append(project)
+    return projects
+
+
+def brute_force(projects, start: int, end: int):
+    found = []
+    for project in projects:
+        project_start = parse_date(project.get("startDate"))
+        if project_start is None:
+            continue
+        project_end = parse_date(project.get("endDate"))
+        project_end = OPEN_END if project_end is None else max(project_end, project_start)
+        if project_start <= end and project_end >= start:
+            found.append(project["id"])
+    return sorted(found)
+
+
+def test_matches_brute_force_overlap_scan():
+    rng = random.Random(3)
+    projects = random_projects(rng, 500)
+    index = ActiveProjectsIndex()
+    index.build(projects)
+    for _ in range(300):
+        year = rng.randrange(2008, 2028)
+        start = parse_period(str(year))
+        end = start + rng.choice([0, 1, 30, 365, 3000])
+        assert sorted(p["id"] for p in index.overlapping(start, end)) == brute_force(projects, start, end)
+
+
+def test_query_boundaries_are_inclusive():
+    index = ActiveProjectsIndex()
+    index.build([{"id": "a", "startDate": "2020-03-01", "endDate": "2020-03-31"}])
+    assert index.overlapping(parse_period("2020-03-31"), parse_period("2020-04-30")) != []
+    assert index.overlapping(parse_period("2020-02"), parse_period("2020-02", end_of_period=True)) == []
+    assert index.overlapping(parse_period("2020-04-01"), parse_period("2021")) == []
@@ -0,0 +1,68 @@
+"""
+Single-project changes applied to RelatedProjectsIndex score like the projects encoded from
+scratch, in both the dense and the sparse layout.
+"""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from similarity import RelatedProjectsIndex, tokenize, _project_text
+from snapshot import ProjectSnapshot
+
+
+def make_project(rng: random.Random, i: int):
+    return {
+        "id": str(i),
+        "title": f"Project {i}",
+        "technologies": rng.sample([f"tech{t}" for t in range(40)], 4),
+        "description": " ".join(rng.choices([f"word{w}" for w in range(200)], k=25)),
+    }
+
+
+@pytest.mark.parametrize("dense_budget", [None, 1])
+def test_changes_match_brute_force(dense_budget):
+    rng = random.Random(7)
+    snapshot = ProjectSnapshot(ttl=0)
+    index = RelatedProjectsIndex(dense_budget=dense_budget)
+    snapshot.add_listener(index)
+    snapshot.replace([make_project(rng, i) for i in range(300)])
+    asyncio.run(index.ensure(snapshot, str))
+
+    for i in range(20):
+        snapshot.upsert(make_project(rng, i))
+    for i in range(20, 30):
+        snapshot.evict(str(i))
+    for i in range(300, 310):
+        snapshot.upsert(make_project(rng, i))
+    asyncio.run(index.ensure(snapshot, str))
+    assert not index._stale
+
+    vectors = {}
+    for project in snapshot.ordered():
+        features, weights = index.space.encode(frozenset(project["technologies"]), tokenize(_project_text(project)))
+        vectors[project["id"]] = np.zeros(index.space.dims)
+        vectors[project["id"]][features] = weights
+    for project_id in ["0", "19", "150", "305"]:
+        expected = sorted((vectors[project_id] @ vector for other, vector in vectors.items() if other != project_id),
+                          reverse=True)[:5]
+        related = index.related(project_id, 5)
+        assert [r["similarity"] for r in related] == pytest.approx(expected, abs=1e-3)
+        assert not {r["id"] for r in related} & {str(i) for i in range(20, 30)}
+    assert index.related("25") is None
+
+
+def test_rebuilds_after_many_changes():
+    rng = random.Random(7)
+    snapshot = ProjectSnapshot(ttl=0)
+    index = RelatedProjectsIndex(rebuild_after=5)
+    snapshot.add_listener(index)
+    snapshot.replace([make_project(rng, i) for i in range(50)])
+    asyncio.run(index.ensure(snapshot, str))
+    for i in range(50, 60):
+        snapshot.upsert(make_project(rng, i))
+    assert index._stale
+    asyncio.run(index.ensure(snapshot, str))
+    assert not index._changed and len(index.ids) == 60
@@ -0,0 +1,90 @@
+"""
+Patches that arrive while the snapshot is being reloaded survive the reload, both on
+ProjectSnapshot itself and through PortfolioAPIClient's reload and /invalidate paths.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_client import PortfolioAPIClient
+from snapshot import ProjectSnapshot
+
+
+class RecordingListener:
+    def __init__(self):
+        self.projects = {}
+
+    def reset(self, projects):
+        self.projects = {p["id"]: p for p in projects}
+
+    def update(self, old, new):
+        if old is not None:
+            del self.projects[old["id"]]
+        if new is not None:
+            self.projects[new["id"]] = new
+
+
+def test_patches_during_reload_are_reapplied():
+    snapshot = ProjectSnapshot()
+    listener = RecordingListener()
+    snapshot.add_listener(listener)
+    stale = [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]
+    snapshot.replace(stale)
+
+    snapshot.begin_reload()
+    # The reload's list was read before these changes
+    snapshot.upsert({"id": "a", "title": "A v2"})
+    snapshot.upsert({"id": "c", "title": "C"})
+    snapshot.evict("b")
+    snapshot.replace(stale)
+
+    assert not snapshot.is_reloading
+    assert {p["id"]: p["title"] for p in snapshot.ordered()} == {"a": "A v2", "c": "C"}
+    assert listener.projects == snapshot.projects
+
+
+def test_aborted_reload_stops_recording():
+    snapshot = ProjectSnapshot()
+    snapshot.replace([{"id": "a", "title": "A"}])
+    snapshot.begin_reload()
+    snapshot.abort_reload()
+    snapshot.upsert({"id": "a", "title": "A v2"})
+    snapshot.replace([{"id": "a", "title": "A"}])
+    assert snapshot.get("a")["title"] == "A"
+
+
+def test_invalidate_during_first_load_is_not_lost():
+    project = {"id": "a", "title": "A"}
+    list_requested = asyncio.Event()
+    release_list = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/projects":
+            # Reply with the list as it was before the write below
+            stale = {"projects": [dict(project)], "totalPages": 1}
+            list_requested.set()
+            await release_list.wait()
+            return httpx.Response(200, json=stale)
+        return httpx.Response(200, json=project)
+
+    async def run():
+        client = PortfolioAPIClient(base_url="http://portfolio.test/api", transport=httpx.MockTransport(handler))
+        try:
+            load = asyncio.create_task(client.get_snapshot())
+            await list_requested.wait()
+            project["title"] = "A v2"
+            result = await client.refresh_projects(["a"])
+            release_list.set()
+            snapshot = await load
+            return result, snapshot.get("a")
+        finally:
+            await client.close()
+
+    result, loaded = asyncio.run(run())
+    assert result["patched"] == ["a"]
+    assert loaded["title"] == "A v2"
@@ -17,7 +17,7 @@ source .venv/bin/activate
 # Check if requirements are installed
 if [ ! -f ".venv/pyvenv.cfg" ]; then
     echo "📥 Installing requirements..."
-    uv pip install -r requirements.txt
+    uv pip install -r ../hugo-portfolio-management/requirements.txt
 fi
 
 # Check if .env file exists
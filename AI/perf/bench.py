@@ -0,0 +1,313 @@
+"""
+Benchmark suite for the MCP servers' hot paths.
+Runs PortfolioAPIClient methods and the FastMCP tools in-process against a mock
+portfolio API (mock_api.py) serving synthetic portfolios, and reports latency
+percentiles, upstream request counts and allocations as JSON.
+
+Usage:
+    python bench.py --server mcp-server --sizes 10,1000,10000,100000 --output run.json
+    python bench.py --latency-ms 20 --iterations 100 --output slow-upstream.json
+    python bench.py --compare before.json after.json
+
+get_related_projects queries a different (project, k) pair on every call, so it measures
+scoring rather than the index's result cache. The "index" target reports the related-projects
+index separately: a full build and a single-project update per size.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Callable
+
+from mock_api import MockPortfolioAPI
+from synthetic import generate_portfolio
+
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, method name, (args, kwargs) factory). Methods missing from the client under test are skipped.
+CLIENT_CASES = [
+    ("get_all_projects", "get_all_projects", lambda ctx: ((), {"page": 1, "limit": 10})),
+    ("get_project_by_id", "get_project_by_id", lambda ctx: ((ctx["project_id"],), {})),
+    ("get_projects_by_category", "get_projects_by_category", lambda ctx: (("ai",), {})),
+    ("get_projects_by_technology", "get_projects_by_technology", lambda ctx: (("Python",), {})),
+    ("get_featured_projects", "get_featured_projects", lambda ctx: ((), {})),
+    ("search_projects", "search_projects", lambda ctx: (("arena",), {})),
+    ("get_projects_by_status", "get_projects_by_status", lambda ctx: (("ongoing",), {})),
+    ("get_projects_by_year", "get_projects_by_year", lambda ctx: ((ctx["year"],), {})),
+    ("get_recent_projects", "get_recent_projects", lambda ctx: ((5,), {})),
+    ("get_all_technologies", "get_all_technologies", lambda ctx: ((), {})),
+    ("get_all_technologies[technology]", "get_all_technologies", lambda ctx: ((), {"filter_type": "technology"})),
+    ("get_technology_categories", "get_technology_categories", lambda ctx: ((), {})),
+    ("get_canonical_technologies", "get_canonical_technologies", lambda ctx: ((), {})),
+    ("get_all_categories", "get_all_categories", lambda ctx: ((), {})),
+    ("get_project_statistics", "get_project_statistics", lambda ctx: ((), {})),
+    ("get_expertise_summary", "get_expertise_summary", lambda ctx: ((), {})),
+    ("get_related_projects", "get_related_projects", lambda ctx: (ctx["related_query"](), {})),
+    ("get_projects_active_between", "get_projects_active_between", lambda ctx: ((str(ctx["year"]),), {})),
+    ("get_projects_by_client", "get_projects_by_client", lambda ctx: (("Riot Games",), {})),
+    ("get_portfolio_digest", "get_portfolio_digest", lambda ctx: ((), {})),
+]
+
+# (tool name, arguments factory). Tools the server does not expose are skipped.
+TOOL_CASES = [
+    ("get_all_projects", lambda ctx: {"page": 1, "limit": 10}),
+    ("get_project_by_id", lambda ctx: {"project_id": ctx["project_id"]}),
+    ("get_projects_by_category", lambda ctx: {"category": "ai"}),
+    ("get_projects_by_technology", lambda ctx: {"technology": "Python"}),
+    ("get_featured_projects", lambda ctx: {}),
+    ("search_projects", lambda ctx: {"search_term": "arena"}),
+    ("get_projects_by_status", lambda ctx: {"status": "ongoing"}),
+    ("get_projects_by_year", lambda ctx: {"year": ctx["year"]}),
+    ("get_recent_projects", lambda ctx: {"limit": 5}),
+    ("get_all_technologies", lambda ctx: {}),
+    ("get_technology_categories", lambda ctx: {}),
+    ("get_canonical_technologies", lambda ctx: {}),
+    ("get_all_categories", lambda ctx: {}),
+    ("get_project_statistics", lambda ctx: {}),
+    ("get_hugo_expertise_summary", lambda ctx: {}),
+    ("get_related_projects", lambda ctx: dict(zip(("project_id", "k"), ctx["related_query"]()))),
+    ("get_projects_active_between", lambda ctx: {"start": str(ctx["year"])}),
+    ("get_projects_by_client", lambda ctx: {"name": "Riot Games"}),
+    ("get_portfolio_digest", lambda ctx: {}),
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+# Both servers run the code in here; AI/mcp-server is it with MCP_READ_ONLY set
+SERVER_DIR = os.path.join(AI_DIR, "hugo-portfolio-management")
+
+
+def load_server(server: str):
+    """Import api_client and server, read-only for "mcp-server" as AI/mcp-server runs it."""
+    if server == "mcp-server":
+        os.environ["MCP_READ_ONLY"] = "true"
+    sys.path.insert(0, SERVER_DIR)
+    sys.path.append(AI_DIR)
+    os.chdir(SERVER_DIR)
+    import api_client
+    import server
+    return api_client, server
+
+
+async def measure(call: Callable, api: MockPortfolioAPI, iterations: int, alloc_iterations: int) -> Dict[str, Any]:
+    """Time one cold call and `iterations` warm calls, then sample allocations."""
+    api.reset_counters()
+    started = time.perf_counter()
+    await call()
+    cold_ms = (time.perf_counter() - started) * 1000
+    cold_requests = api.total_requests
+
+    api.reset_counters()
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    warm_requests = api.total_requests
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cold_ms": round(cold_ms, 3),
+        "cold_upstream_requests": cold_requests,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "max_ms": round(max(latencies), 3) if latencies else 0.0,
+        "upstream_requests_per_call": round(warm_requests / iterations, 3) if iterations else 0.0,
+        "upstream_requests_by_route": dict(api.requests),
+        "peak_alloc_kib": round(sum(peaks) / len(peaks) / 1024, 1) if peaks else 0.0,
+    }
+
+
+def distinct_queries(projects: List[Dict[str, Any]], seed: int) -> Callable[[], tuple]:
+    """Returns a function giving a new (project ID, k) pair per call, cycling once all are used."""
+    pairs = [(p["id"], k) for p in projects for k in range(1, 11)]
+    random.Random(seed).shuffle(pairs)
+    position = -1
+
+    def next_query() -> tuple:
+        nonlocal position
+        position = (position + 1) % len(pairs)
+        return pairs[position]
+
+    return next_query
+
+
+async def bench_index(client, api: MockPortfolioAPI, size: int, args) -> List[Dict[str, Any]]:
+    """Time a full build of the related-projects index and a single-project update."""
+    snapshot = await client.get_snapshot()
+    canonical = client.technologies.ensure(snapshot).canonical
+    index = await client.related_projects.ensure(snapshot, canonical)
+    projects = snapshot.ordered()
+    rng = random.Random(args.seed)
+    # Keep the updates below from scheduling a rebuild
+    index.rebuild_after = args.iterations + args.alloc_iterations + 1
+
+    async def build():
+        index.build(projects, canonical)
+
+    async def update():
+        project = rng.choice(projects)
+        index.update(project, {**project, "title": project.get("title", "") + " (edited)"})
+
+    results = []
+    for name, call, iterations in (("related_projects.build", build, args.build_iterations),
+                                   ("related_projects.update", update, args.iterations)):
+        stats = await measure(call, api, iterations, args.alloc_iterations if call is update else 0)
+        results.append({"size": size, "target": "index", "name": name, **stats})
+        print(f"  [{size}] index {name}: p50={stats['p50_ms']}ms cold={stats['cold_ms']}ms", file=sys.stderr)
+    return results
+
+
+async def bench_size(modules, size: int, args) -> List[Dict[str, Any]]:
+    api_client, server = modules
+    projects = generate_portfolio(size, seed=args.seed)
+    api = MockPortfolioAPI(projects, latency=args.latency_ms / 1000)
+    ctx = {
+        "project_id": projects[len(projects) // 2]["id"],
+        "related_query": distinct_queries(projects, args.seed),
+        "year": int(projects[0]["startDate"][:4]),
+    }
+    results = []
+
+    async def fresh_client():
+        # Every case starts from a cold client so snapshot loads show up in cold_ms
+        await api_client.close_api_client()
+        # Only the innermost transport is swapped, so the deadline, tracing and metrics layers still run
+        client = api_client.PortfolioAPIClient(base_url="http://portfolio.mock/api", transport=api.transport())
+        api_client._api_client = client
+        return client
+
+    if "client" in args.targets:
+        for name, method, make_args in CLIENT_CASES:
+            if args.only and name not in args.only:
+                continue
+            client = await fresh_client()
+            if not hasattr(client, method):
+                continue
+            bound = getattr(client, method)
+
+            async def call():
+                call_args, call_kwargs = make_args(ctx)
+                return await bound(*call_args, **call_kwargs)
+
+            stats = await measure(call, api, args.iterations, args.alloc_iterations)
+            results.append({"size": size, "target": "client", "name": name, **stats})
+            print(f"  [{size}] client {name}: p50={stats['p50_ms']}ms cold={stats['cold_ms']}ms", file=sys.stderr)
+
+    if "tool" in args.targets:
+        from fastmcp import Client
+        await fresh_client()
+        async with Client(server.mcp) as mcp_client:
+            available = {tool.name for tool in await mcp_client.list_tools()}
+            for name, make_args in TOOL_CASES:
+                if name not in available or (args.only and name not in args.only):
+                    continue
+                await fresh_client()
+                stats = await measure(lambda: mcp_client.call_tool(name, make_args(ctx), raise_on_error=False),
+                                      api, args.iterations, args.alloc_iterations)
+                results.append({"size": size, "target": "tool", "name": name, **stats})
+                print(f"  [{size}] tool {name}: p50={stats['p50_ms']}ms cold={stats['cold_ms']}ms", file=sys.stderr)
+
+    if "index" in args.targets:
+        client = await fresh_client()
+        if hasattr(client, "related_projects"):
+            results.extend(await bench_index(client, api, size, args))
+
+    await api_client.close_api_client()
+    return results
+
+
+def compare(before_path: str, after_path: str, metric: str = "p50_ms") -> None:
+    """Print the relative change of `metric` for every case present in both runs."""
+    with open(before_path) as f:
+        before = {(r["size"], r["target"], r["name"]): r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = {(r["size"], r["target"], r["name"]): r for r in json.load(f)["results"]}
+    print(f"{'size':>7} {'target':<6} {'name':<36} {'before':>10} {'after':>10} {'change':>8}")
+    for key in sorted(before.keys() & after.keys(), key=lambda k: (k[0], k[1], k[2])):
+        old, new = before[key][metric], after[key][metric]
+        change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+        print(f"{key[0]:>7} {key[1]:<6} {key[2]:<36} {old:>10.3f} {new:>10.3f} {change:>8}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark PortfolioAPIClient and MCP tools against a mock API")
+    parser.add_argument("--server", default="mcp-server", choices=["mcp-server", "hugo-portfolio-management"])
+    parser.add_argument("--sizes", default="10,1000,10000,100000", help="Comma-separated portfolio sizes")
+    parser.add_argument("--iterations", type=int, default=30, help="Warm calls per case")
+    parser.add_argument("--alloc-iterations", type=int, default=5, help="Calls per case traced for allocations")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Upstream latency added to every mock API response")
+    parser.add_argument("--build-iterations", type=int, default=3, help="Full index builds timed per size")
+    parser.add_argument("--targets", default="client,tool,index", help="Comma-separated: client, tool, index")
+    parser.add_argument("--only", default="", help="Comma-separated case names to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two result files and exit")
+    parser.add_argument("--metric", default="p50_ms", help="Metric used by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare, metric=args.metric)
+        return
+
+    args.targets = set(args.targets.split(","))
+    args.only = set(filter(None, args.only.split(",")))
+    output = os.path.abspath(args.output) if args.output else None
+    modules = load_server(args.server)
+
+    results = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        print(f"Benchmarking {size} projects...", file=sys.stderr)
+        results.extend(await bench_size(modules, size, args))
+
+    report = {
+        "meta": {
+            "server": args.server,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "latency_ms": args.latency_ms,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(text)
+        print(f"Wrote {len(results)} results to {output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,288 @@
+"""
+Load test for the chat agent's AG-UI endpoints.
+Opens many concurrent SSE streams to `/` and `/agent/` of chatbot-agent.py and
+measures time to first byte, time to first text delta, gaps between events,
+output rate after the first delta and total duration per run, plus the agent
+process's CPU time.
+
+Usage:
+    # Start a stub model and the agent, then load them (needs a reachable MCP server)
+    python chat_load.py --spawn --mcp-url http://127.0.0.1:8017/mcp --concurrency 20 --runs 200
+
+    # Load an agent that is already running (pass its PID for CPU figures)
+    python chat_load.py --url http://127.0.0.1:8025 --server-pid 12345 --concurrency 10 --runs 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+from bench import percentile
+
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_PROMPTS = [
+    "What projects have you done for Riot Games?",
+    "Give me an overview of your AI engineering work.",
+    "Which technologies do you use the most?",
+    "Tell me about your most recent project.",
+]
+
+
+def process_cpu_seconds(pid: Optional[int]) -> Optional[float]:
+    """User + system CPU time of a process from /proc (Linux only)."""
+    if not pid:
+        return None
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime are fields 14 and 15 of the full line
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+async def run_stream(client: httpx.AsyncClient, url: str, prompt: str, server_pid: Optional[int]) -> Dict[str, Any]:
+    """POST one AG-UI run and time every SSE event until the stream closes."""
+    payload = {
+        "thread_id": str(uuid.uuid4()),
+        "run_id": str(uuid.uuid4()),
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    result: Dict[str, Any] = {"url": url, "events": 0, "text_chars": 0, "text_deltas": 0, "error": None}
+    cpu_before = process_cpu_seconds(server_pid)
+    started = time.perf_counter()
+    last_event = None
+    gaps: List[float] = []
+    try:
+        async with client.stream("POST", url, json=payload, headers={"Accept": "text/event-stream"}) as response:
+            result["status"] = response.status_code
+            buffer = ""
+            async for chunk in response.aiter_text():
+                now = time.perf_counter()
+                result.setdefault("ttfb_ms", (now - started) * 1000)
+                buffer += chunk
+                while "\n\n" in buffer:
+                    raw, buffer = buffer.split("\n\n", 1)
+                    data = "".join(line[5:].strip() for line in raw.splitlines() if line.startswith("data:"))
+                    if not data:
+                        continue
+                    if last_event is not None:
+                        gaps.append((now - last_event) * 1000)
+                    last_event = now
+                    result["events"] += 1
+                    event = json.loads(data)
+                    if event.get("type") == "text_message_content":
+                        delta_chars = len(event.get("delta", ""))
+                        if "first_delta_ms" not in result:
+                            result["first_delta_ms"] = (now - started) * 1000
+                            result["first_delta_chars"] = delta_chars
+                        result["last_delta_ms"] = (now - started) * 1000
+                        result["text_chars"] += delta_chars
+                        result["text_deltas"] += 1
+                    elif event.get("type") == "run_error":
+                        result["error"] = event.get("message", "run_error")
+            if response.status_code >= 400:
+                result["error"] = f"HTTP {response.status_code}"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["duration_ms"] = (time.perf_counter() - started) * 1000
+    result["max_gap_ms"] = max(gaps) if gaps else 0.0
+    result["gaps_ms"] = gaps
+    streaming_s = (result.get("last_delta_ms", 0.0) - result.get("first_delta_ms", 0.0)) / 1000
+    if streaming_s > 0:
+        # Output after the first delta, so time to first token does not dilute the rate
+        result["chars_per_s"] = (result["text_chars"] - result["first_delta_chars"]) / streaming_s
+        result["deltas_per_s"] = (result["text_deltas"] - 1) / streaming_s
+    cpu_after = process_cpu_seconds(server_pid)
+    if cpu_before is not None and cpu_after is not None:
+        # Includes work for other runs overlapping this one when concurrency > 1
+        result["server_cpu_s"] = cpu_after - cpu_before
+    return result
+
+
+def summarize(runs: List[Dict[str, Any]], elapsed: float, cpu_total: Optional[float]) -> Dict[str, Any]:
+    def describe(values: List[float]) -> Dict[str, float]:
+        return {
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+            "max_ms": round(max(values), 3) if values else 0.0,
+        }
+
+    def describe_rate(values: List[float]) -> Dict[str, float]:
+        # The slow end matters for rates, so report the 5th percentile and minimum
+        return {
+            "p50": round(percentile(values, 50), 2),
+            "p5": round(percentile(values, 5), 2),
+            "min": round(min(values), 2) if values else 0.0,
+            "mean": round(sum(values) / len(values), 2) if values else 0.0,
+        }
+
+    by_url: Dict[str, List[Dict[str, Any]]] = {}
+    for run in runs:
+        by_url.setdefault(run["url"], []).append(run)
+
+    def block(group: List[Dict[str, Any]]) -> Dict[str, Any]:
+        ok = [r for r in group if not r["error"]]
+        return {
+            "runs": len(group),
+            "errors": len(group) - len(ok),
+            "ttfb": describe([r["ttfb_ms"] for r in ok if "ttfb_ms" in r]),
+            "first_delta": describe([r["first_delta_ms"] for r in ok if "first_delta_ms" in r]),
+            "inter_event_gap": describe([g for r in ok for g in r["gaps_ms"]]),
+            "duration": describe([r["duration_ms"] for r in ok]),
+            "events_per_run": round(sum(r["events"] for r in ok) / len(ok), 1) if ok else 0.0,
+            # Per run, after its first delta; with the stub model a delta is one token
+            "chars_per_s": describe_rate([r["chars_per_s"] for r in ok if "chars_per_s" in r]),
+            "deltas_per_s": describe_rate([r["deltas_per_s"] for r in ok if "deltas_per_s" in r]),
+            "text_chars": sum(r["text_chars"] for r in ok),
+            "text_deltas": sum(r["text_deltas"] for r in ok),
+        }
+
+    errors = [r["error"] for r in runs if r["error"]]
+    summary = {
+        "duration_s": round(elapsed, 3),
+        "runs_per_s": round(len(runs) / elapsed, 3) if elapsed else 0.0,
+        **block(runs),
+        # Output of all runs together over the whole test
+        "aggregate_chars_per_s": round(sum(r["text_chars"] for r in runs) / elapsed, 2) if elapsed else 0.0,
+        "aggregate_deltas_per_s": round(sum(r["text_deltas"] for r in runs) / elapsed, 2) if elapsed else 0.0,
+        "by_endpoint": {url: block(group) for url, group in sorted(by_url.items())},
+        "error_samples": sorted(set(errors))[:5],
+    }
+    if cpu_total is not None:
+        summary["server_cpu_s_total"] = round(cpu_total, 3)
+        summary["server_cpu_s_per_run"] = round(cpu_total / len(runs), 4) if runs else 0.0
+        summary["server_cpu_utilization"] = round(cpu_total / elapsed, 3) if elapsed else 0.0
+    return summary
+
+
+async def wait_for(url: str, timeout: float, process: Optional[subprocess.Popen] = None) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while True:
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(f"Process for {url} exited with code {process.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout}s")
+            await asyncio.sleep(0.5)
+
+
+def spawn(args) -> List[subprocess.Popen]:
+    """Start stub_llm.py and chatbot-agent.py wired to each other."""
+    stub_cmd = [sys.executable, os.path.join(PERF_DIR, "stub_llm.py"), "--port", str(args.stub_port),
+                "--ttft-ms", str(args.ttft_ms), "--tokens-per-second", str(args.tokens_per_second),
+                "--tokens", str(args.tokens)]
+    if args.script:
+        stub_cmd += ["--script", args.script]
+    stub = subprocess.Popen(stub_cmd)
+    env = dict(os.environ,
+               LMSTUDIO_BASE_URL=f"http://127.0.0.1:{args.stub_port}/v1",
+               AGENT_PORT=str(args.agent_port))
+    if args.mcp_url:
+        env["MCP_SERVER_URL"] = args.mcp_url
+    agent = subprocess.Popen([sys.executable, "chatbot-agent.py"], cwd=os.path.join(AI_DIR, "agno-agent"), env=env)
+    return [stub, agent]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent SSE load test for the chat agent")
+    parser.add_argument("--url", default="http://127.0.0.1:8025", help="Base URL of a running chat agent")
+    parser.add_argument("--paths", default="/,/agent/", help="Comma-separated endpoints, used round-robin")
+    parser.add_argument("--concurrency", type=int, default=10, help="Streams open at the same time")
+    parser.add_argument("--runs", type=int, default=50, help="Total runs")
+    parser.add_argument("--prompts", help="File with one prompt per line (defaults to a built-in set)")
+    parser.add_argument("--server-pid", type=int, help="Agent process ID for CPU measurements")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-run timeout in seconds")
+    parser.add_argument("--spawn", action="store_true", help="Start stub_llm.py and chatbot-agent.py first")
+    parser.add_argument("--mcp-url", help="MCP_SERVER_URL for the spawned agent")
+    parser.add_argument("--agent-port", type=int, default=8025)
+    parser.add_argument("--stub-port", type=int, default=1234)
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Stub model time to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0, help="Stub model token rate")
+    parser.add_argument("--tokens", type=int, default=200, help="Stub model answer length")
+    parser.add_argument("--script", help="Tool-call script file for the stub model")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    prompts = DEFAULT_PROMPTS
+    if args.prompts:
+        with open(args.prompts) as f:
+            prompts = [line.strip() for line in f if line.strip()]
+
+    processes = []
+    base_url = args.url.rstrip("/")
+    server_pid = args.server_pid
+    try:
+        if args.spawn:
+            processes = spawn(args)
+            base_url = f"http://127.0.0.1:{args.agent_port}"
+            server_pid = processes[1].pid
+            await wait_for(f"http://127.0.0.1:{args.stub_port}/v1/models", 30, processes[0])
+            await wait_for(f"{base_url}/health", 120, processes[1])
+
+        paths = [p.strip() for p in args.paths.split(",") if p.strip()]
+        semaphore = asyncio.Semaphore(args.concurrency)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+        async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+            async def one(i: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await run_stream(client, base_url + paths[i % len(paths)], prompts[i % len(prompts)], server_pid)
+
+            print(f"Running {args.runs} runs, {args.concurrency} concurrent, against {base_url}...", file=sys.stderr)
+            cpu_before = process_cpu_seconds(server_pid)
+            started = time.perf_counter()
+            runs = await asyncio.gather(*(one(i) for i in range(args.runs)))
+            elapsed = time.perf_counter() - started
+            cpu_after = process_cpu_seconds(server_pid)
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    cpu_total = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+    report = {
+        "meta": {
+            "url": base_url,
+            "paths": paths,
+            "concurrency": args.concurrency,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "stub_model": {"ttft_ms": args.ttft_ms, "tokens_per_second": args.tokens_per_second,
+                           "tokens": args.tokens} if args.spawn else None,
+        },
+        **summarize(runs, elapsed, cpu_total),
+        "runs": [{k: (round(v, 3) if isinstance(v, float) else v) for k, v in r.items() if k != "gaps_ms"} for r in runs],
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"Wrote report to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,265 @@
+"""
+Concurrent load generator for the MCP servers.
+Opens N concurrent fastmcp.Client sessions and replays a weighted mix of single
+tool calls and multi-call agent traces until the duration elapses, then reports
+throughput, latency percentiles and error rates per tool as JSON.
+
+Usage:
+    python load_test.py --url http://127.0.0.1:8017/mcp --sessions 20 --duration 60
+    python load_test.py --in-process --server mcp-server --size 5000 --sessions 50 --latency-ms 10
+    python load_test.py --url http://127.0.0.1:8017/mcp --mix mix.json --traces traces.jsonl --output run.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+from fastmcp import Client
+
+from bench import SERVER_DIR, percentile
+
+
+# Tool name -> (weight, arguments). "{project_id}" is replaced by a random known project ID.
+DEFAULT_MIX: Dict[str, Dict[str, Any]] = {
+    "get_portfolio_digest": {"weight": 3, "arguments": {}},
+    "get_project_by_id": {"weight": 4, "arguments": {"project_id": "{project_id}"}},
+    "get_all_projects": {"weight": 3, "arguments": {"page": 1, "limit": 10}},
+    "get_project_statistics": {"weight": 2, "arguments": {}},
+    "get_hugo_expertise_summary": {"weight": 2, "arguments": {}},
+    "search_projects": {"weight": 2, "arguments": {"search_term": "AI"}},
+    "get_projects_by_client": {"weight": 2, "arguments": {"name": "Riot Games"}},
+    "get_canonical_technologies": {"weight": 2, "arguments": {}},
+    "get_projects_by_technology": {"weight": 1, "arguments": {"technology": "Python"}},
+    "get_related_projects": {"weight": 1, "arguments": {"project_id": "{project_id}", "k": 5}},
+    "get_projects_active_between": {"weight": 1, "arguments": {"start": "2023"}},
+    "get_recent_projects": {"weight": 1, "arguments": {"limit": 5}},
+}
+
+# Tool call sequences observed for typical chat questions
+DEFAULT_TRACES: List[Dict[str, Any]] = [
+    {"name": "overview", "calls": [
+        {"tool": "get_portfolio_digest", "arguments": {}},
+        {"tool": "get_hugo_expertise_summary", "arguments": {}},
+    ]},
+    {"name": "client_work", "calls": [
+        {"tool": "get_projects_by_client", "arguments": {"name": "Riot Games"}},
+        {"tool": "get_project_by_id", "arguments": {"project_id": "{project_id}"}},
+        {"tool": "get_project_by_id", "arguments": {"project_id": "{project_id}"}},
+    ]},
+    {"name": "technology_question", "calls": [
+        {"tool": "get_canonical_technologies", "arguments": {"filter_type": "technology"}},
+        {"tool": "get_projects_by_technology", "arguments": {"technology": "Python"}},
+        {"tool": "get_related_projects", "arguments": {"project_id": "{project_id}", "k": 3}},
+    ]},
+    {"name": "paging_agent", "calls": [
+        {"tool": "get_all_projects", "arguments": {"page": 1, "limit": 10}},
+        {"tool": "get_all_projects", "arguments": {"page": 2, "limit": 10}},
+        {"tool": "get_all_projects", "arguments": {"page": 1, "limit": 10}},
+        {"tool": "get_project_statistics", "arguments": {}},
+    ]},
+]
+
+
+def _fill(arguments: Dict[str, Any], project_ids: List[str], rng: random.Random) -> Dict[str, Any]:
+    filled = {}
+    for key, value in arguments.items():
+        if value == "{project_id}":
+            value = rng.choice(project_ids) if project_ids else "unknown"
+        filled[key] = value
+    return filled
+
+
+class LoadStats:
+    """Per-tool and per-trace latency samples and error counts."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.error_samples: Dict[str, str] = {}
+        self.trace_latencies: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, tool: str, elapsed_ms: float, error: Optional[str]) -> None:
+        self.latencies[tool].append(elapsed_ms)
+        if error is not None:
+            self.errors[tool] += 1
+            self.error_samples.setdefault(tool, error[:200])
+
+    def summary(self, elapsed: float, sessions: int) -> Dict[str, Any]:
+        def describe(samples: List[float]) -> Dict[str, float]:
+            return {
+                "p50_ms": round(percentile(samples, 50), 3),
+                "p95_ms": round(percentile(samples, 95), 3),
+                "p99_ms": round(percentile(samples, 99), 3),
+                "mean_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            }
+
+        total = sum(len(v) for v in self.latencies.values())
+        errors = sum(self.errors.values())
+        return {
+            "sessions": sessions,
+            "duration_s": round(elapsed, 3),
+            "total_calls": total,
+            "total_errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "throughput_calls_per_s": round(total / elapsed, 2) if elapsed else 0.0,
+            "overall": describe([x for v in self.latencies.values() for x in v]),
+            "tools": {
+                tool: {
+                    "count": len(samples),
+                    "errors": self.errors.get(tool, 0),
+                    "error_rate": round(self.errors.get(tool, 0) / len(samples), 4),
+                    **describe(samples),
+                    **({"error_sample": self.error_samples[tool]} if tool in self.error_samples else {}),
+                }
+                for tool, samples in sorted(self.latencies.items())
+            },
+            "traces": {
+                name: {"count": len(samples), **describe(samples)}
+                for name, samples in sorted(self.trace_latencies.items())
+            },
+        }
+
+
+async def call_tool(client: Client, tool: str, arguments: Dict[str, Any], stats: LoadStats) -> None:
+    from metrics import is_error_payload
+
+    started = time.perf_counter()
+    error = None
+    try:
+        result = await client.call_tool(tool, arguments, raise_on_error=False)
+        if result.is_error:
+            error = str(result.content[0].text if result.content else "tool error")
+        elif is_error_payload(result.structured_content):
+            # The servers report failures as {"error": ...} payloads (wrapped in {"result": [...]}
+            # for list-returning tools) rather than MCP errors
+            error = json.dumps(result.structured_content)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    stats.record(tool, (time.perf_counter() - started) * 1000, error)
+
+
+async def run_session(target, deadline: float, mix: Dict[str, Dict[str, Any]], traces: List[Dict[str, Any]],
+                      trace_ratio: float, think: float, project_ids: List[str], stats: LoadStats, seed: int) -> None:
+    rng = random.Random(seed)
+    tools = list(mix)
+    weights = [mix[t]["weight"] for t in tools]
+    async with Client(target) as client:
+        while time.perf_counter() < deadline:
+            if traces and rng.random() < trace_ratio:
+                trace = rng.choice(traces)
+                started = time.perf_counter()
+                for step in trace["calls"]:
+                    await call_tool(client, step["tool"], _fill(step.get("arguments", {}), project_ids, rng), stats)
+                stats.trace_latencies[trace["name"]].append((time.perf_counter() - started) * 1000)
+            else:
+                tool = rng.choices(tools, weights)[0]
+                await call_tool(client, tool, _fill(mix[tool].get("arguments", {}), project_ids, rng), stats)
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+
+
+async def discover_project_ids(target) -> List[str]:
+    async with Client(target) as client:
+        result = await client.call_tool("get_all_projects", {"page": 1, "limit": 100}, raise_on_error=False)
+        data = result.structured_content or {}
+        return [p["id"] for p in data.get("projects", []) if isinstance(p, dict) and p.get("id")]
+
+
+def load_traces(path: str) -> List[Dict[str, Any]]:
+    """Traces as JSONL: one {"name": ..., "calls": [{"tool": ..., "arguments": {...}}]} per line."""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def build_in_process_target(args):
+    """Serve the chosen MCP server in-process against a mock API with a synthetic portfolio."""
+    from bench import load_server
+    from mock_api import MockPortfolioAPI
+    from synthetic import generate_portfolio
+
+    api_client, server = load_server(args.server)
+    api = MockPortfolioAPI(generate_portfolio(args.size, seed=args.seed), latency=args.latency_ms / 1000)
+    client = api_client.PortfolioAPIClient(base_url="http://portfolio.mock/api", transport=api.transport())
+    api_client._api_client = client
+    return server.mcp, api
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for the MCP servers")
+    parser.add_argument("--url", default="http://127.0.0.1:8017/mcp", help="MCP endpoint to load")
+    parser.add_argument("--in-process", action="store_true", help="Load an in-process server backed by the mock API instead of --url")
+    parser.add_argument("--server", default="mcp-server", choices=["mcp-server", "hugo-portfolio-management"])
+    parser.add_argument("--size", type=int, default=1000, help="Synthetic portfolio size for --in-process")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock API latency for --in-process")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between calls in a session")
+    parser.add_argument("--mix", help="JSON file overriding the weighted tool mix")
+    parser.add_argument("--traces", help="JSONL file of agent traces to replay instead of the built-in ones")
+    parser.add_argument("--trace-ratio", type=float, default=0.3, help="Probability that a session step replays a whole trace")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    mix = DEFAULT_MIX
+    if args.mix:
+        with open(args.mix) as f:
+            mix = json.load(f)
+    traces = load_traces(args.traces) if args.traces else DEFAULT_TRACES
+    output = os.path.abspath(args.output) if args.output else None
+
+    api = None
+    if args.in_process:
+        target, api = build_in_process_target(args)
+    else:
+        target = args.url
+        # Error payloads are classified with the servers' own metrics.is_error_payload
+        sys.path.insert(0, SERVER_DIR)
+
+    project_ids = await discover_project_ids(target)
+    if api is not None:
+        api.reset_counters()
+
+    stats = LoadStats()
+    print(f"Running {args.sessions} sessions for {args.duration}s against "
+          f"{'in-process ' + args.server if args.in_process else args.url}...", file=sys.stderr)
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        run_session(target, deadline, mix, traces, args.trace_ratio, args.think_ms / 1000,
+                    project_ids, stats, args.seed + i)
+        for i in range(args.sessions)
+    ))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "meta": {
+            "target": args.server if args.in_process else args.url,
+            "in_process": args.in_process,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "size": args.size if args.in_process else None,
+            "latency_ms": args.latency_ms if args.in_process else None,
+        },
+        **stats.summary(elapsed, args.sessions),
+    }
+    if api is not None:
+        report["upstream_requests_by_route"] = dict(api.requests)
+
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(text)
+        print(f"Wrote report to {output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
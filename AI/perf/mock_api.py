@@ -0,0 +1,191 @@
+"""
+In-process mock of the portfolio API (`/api/projects`, `/api/projects/{id}`,
+`/api/projects/recent`, plus project create/update/delete) for benchmarks.
+Mirrors the filtering, ordering and pagination of the Next.js routes in
+src/app/api/projects and src/lib/database.ts, counts requests per route and can
+add upstream latency. Plug it into an httpx client with `api.transport()`.
+"""
+
+import asyncio
+import json
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+
+
+STATUS_ORDER = {"completed": 0, "ongoing": 1, "planned": 2}
+CATEGORY_ALIASES = {"real-time_graphics": "real-time-graphics"}
+
+
+def _by_start_desc(projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(projects, key=lambda p: p.get("startDate") or "", reverse=True)
+
+
+def _default_order(projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """featured desc, order asc, startDate desc, as in getProjects()."""
+    result = _by_start_desc(projects)
+    result.sort(key=lambda p: (not p.get("featured", False), p.get("order") or 0))
+    return result
+
+
+def _matches_search(project: Dict[str, Any], query: str) -> bool:
+    """searchProjects(): case-insensitive contains on text fields, exact match on list fields."""
+    needle = query.lower()
+    for field in ("title", "description", "longDescription", "client", "role", "impact"):
+        if needle in (project.get(field) or "").lower():
+            return True
+    return query in (project.get("responsibilities") or []) or query in (project.get("technologies") or [])
+
+
+class MockPortfolioAPI:
+    """Serves a fixed list of projects with the portfolio API's query semantics."""
+
+    def __init__(self, projects: List[Dict[str, Any]], latency: float = 0.0):
+        """
+        Args:
+            projects: Projects to serve
+            latency: Seconds added to every response
+        """
+        self.projects = {p["id"]: p for p in projects}
+        self.latency = latency
+        self.requests: Counter = Counter()
+        self._ordered: Optional[List[Dict[str, Any]]] = None
+
+    def reset_counters(self) -> None:
+        self.requests.clear()
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def ordered(self) -> List[Dict[str, Any]]:
+        if self._ordered is None:
+            self._ordered = _default_order(list(self.projects.values()))
+        return self._ordered
+
+    def upsert(self, project: Dict[str, Any]) -> None:
+        self.projects[project["id"]] = project
+        self._ordered = None
+
+    def delete(self, project_id: str) -> bool:
+        self._ordered = None
+        return self.projects.pop(project_id, None) is not None
+
+    # Route handlers return (status, body)
+    def list_projects(self, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        page = int(params.get("page") or 1)
+        limit = int(params.get("limit") or 10)
+        featured = params.get("featured")
+        search = params.get("search")
+        category = params.get("category")
+
+        if featured == "true":
+            projects = [p for p in self.ordered() if p.get("featured")]
+            projects = _by_start_desc(projects)
+            projects.sort(key=lambda p: p.get("order") or 0)
+        elif search:
+            projects = _by_start_desc([p for p in self.projects.values() if _matches_search(p, search)])
+        elif category:
+            wanted = CATEGORY_ALIASES.get(category.lower(), category.lower())
+            projects = _by_start_desc([p for p in self.projects.values() if p.get("category") == wanted])
+        else:
+            projects = self.ordered()
+
+        technology = params.get("technology")
+        if technology:
+            needle = technology.lower()
+            projects = [p for p in projects if any(needle in t.lower() for t in p.get("technologies") or [])]
+        year = params.get("year")
+        if year:
+            projects = [p for p in projects if (p.get("startDate") or "")[:4] == str(int(year))]
+        status = params.get("status")
+        if status:
+            projects = [p for p in projects if p.get("status") == status]
+
+        start = (page - 1) * limit
+        return 200, {
+            "projects": projects[start:start + limit],
+            "total": len(projects),
+            "page": page,
+            "limit": limit,
+            "totalPages": -(-len(projects) // limit) if limit > 0 else 0,
+        }
+
+    def get_project(self, project_id: str) -> Tuple[int, Dict[str, Any]]:
+        project = self.projects.get(project_id)
+        if project is None:
+            return 404, {"error": "Project not found"}
+        return 200, project
+
+    def recent_projects(self, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """getRecentProjects(): status enum order, then endDate desc (nulls first), then startDate desc."""
+        limit = int(params.get("limit") or 5)
+        projects = _by_start_desc(list(self.projects.values()))
+        # PostgreSQL sorts NULLs first for DESC
+        projects.sort(key=lambda p: p.get("endDate") or "9999-12-31", reverse=True)
+        projects.sort(key=lambda p: STATUS_ORDER.get(p.get("status"), 99))
+        projects = projects[:limit]
+        return 200, {"projects": projects, "count": len(projects), "limit": limit}
+
+    def create_project(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        project = {
+            "images": [], "responsibilities": [], "technologies": [], "featured": False, "order": 0,
+            **data,
+            "id": uuid.uuid4().hex,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        self.upsert(project)
+        return 201, project
+
+    def update_project(self, project_id: str, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        project = self.projects.get(project_id)
+        if project is None:
+            return 404, {"error": "Project not found"}
+        updated = {**project, **data, "id": project_id,
+                   "updatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")}
+        self.upsert(updated)
+        return 200, updated
+
+    def delete_project(self, project_id: str) -> Tuple[int, Dict[str, Any]]:
+        if not self.delete(project_id):
+            return 404, {"error": "Project not found"}
+        return 200, {"message": "Project deleted successfully"}
+
+    def route(self, method: str, path: str, params: Dict[str, str],
+              body: Optional[Dict[str, Any]] = None) -> Tuple[str, int, Dict[str, Any]]:
+        """Dispatch a request; returns (route name, status, body)."""
+        parts = [p for p in path.split("/") if p]
+        if parts and parts[0] == "api":
+            parts = parts[1:]
+        if parts == ["projects"]:
+            if method == "GET":
+                return ("/projects",) + self.list_projects(params)
+            if method == "POST":
+                return ("POST /projects",) + self.create_project(body or {})
+        if method == "GET" and parts == ["projects", "recent"]:
+            return ("/projects/recent",) + self.recent_projects(params)
+        if len(parts) == 2 and parts[0] == "projects":
+            if method == "GET":
+                return ("/projects/{id}",) + self.get_project(parts[1])
+            if method == "PUT":
+                return ("PUT /projects/{id}",) + self.update_project(parts[1], body or {})
+            if method == "DELETE":
+                return ("DELETE /projects/{id}",) + self.delete_project(parts[1])
+        return ("unknown", 404, {"error": "Not found"})
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """httpx MockTransport handler."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        payload = json.loads(request.content) if request.content else None
+        name, status, body = self.route(request.method, request.url.path, dict(request.url.params), payload)
+        self.requests[name] += 1
+        return httpx.Response(status, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
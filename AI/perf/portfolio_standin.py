@@ -0,0 +1,143 @@
+"""
+Stand-in for the Next.js portfolio API.
+Serves `/api/projects`, `/api/projects/{id}` and `/api/projects/recent` (plus
+project create/update/delete) over HTTP with the same semantics as
+mock_api.py, so the MCP servers and the chat agent can run end-to-end on one
+machine. Latency, jitter and error rates can be injected and changed at runtime.
+
+Usage:
+    python portfolio_standin.py                          # seeded from data/projects.json
+    python portfolio_standin.py --size 10000 --seed 1    # synthetic portfolio
+    python portfolio_standin.py --latency-ms 50 --jitter-ms 20 --error-rate 0.02
+
+Point the MCP servers at it with PORTFOLIO_API_URL=http://127.0.0.1:3017/api.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from typing import Dict, Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from mock_api import MockPortfolioAPI
+from synthetic import load_portfolio
+
+
+DEFAULT_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            "data", "projects.json")
+
+
+class FaultInjection:
+    """Latency, jitter and error-rate knobs applied to every API request."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 timeout_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            latency_ms: Base delay added to every response
+            jitter_ms: Extra uniformly random delay in [0, jitter_ms]
+            error_rate: Fraction of requests answered with HTTP 500
+            timeout_rate: Fraction of requests that hang for 60 seconds before a 504
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self._rng = random.Random(seed)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "timeout_rate": self.timeout_rate,
+        }
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key in self.as_dict():
+            if key in values:
+                setattr(self, key, float(values[key]))
+
+    async def apply(self) -> int:
+        """Sleep for the configured latency; return an injected status code or 0."""
+        roll = self._rng.random()
+        if roll < self.timeout_rate:
+            await asyncio.sleep(60)
+            return 504
+        delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if roll < self.timeout_rate + self.error_rate:
+            return 500
+        return 0
+
+
+def create_app(api: MockPortfolioAPI, faults: FaultInjection) -> Starlette:
+    async def handle(request: Request):
+        body = None
+        if request.method in ("POST", "PUT"):
+            try:
+                body = await request.json()
+            except json.JSONDecodeError:
+                return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
+        injected = await faults.apply()
+        if injected:
+            api.requests["injected_errors"] += 1
+            return JSONResponse({"error": "Injected failure"}, status_code=injected)
+        try:
+            name, status, payload = api.route(request.method, request.url.path, dict(request.query_params), body)
+        except ValueError as e:
+            # Mirrors the Next.js routes, which answer bad query parameters with a 500
+            return JSONResponse({"error": f"Failed to fetch projects: {e}"}, status_code=500)
+        api.requests[name] += 1
+        return JSONResponse(payload, status_code=status)
+
+    async def config(request: Request):
+        if request.method == "POST":
+            faults.update(await request.json())
+        return JSONResponse(faults.as_dict())
+
+    async def stats(request: Request):
+        if request.method == "DELETE":
+            api.reset_counters()
+        return JSONResponse({"projects": len(api.projects), "requests": dict(api.requests)})
+
+    return Starlette(routes=[
+        Route("/__standin/config", config, methods=["GET", "POST"]),
+        Route("/__standin/stats", stats, methods=["GET", "DELETE"]),
+        Route("/api/{path:path}", handle, methods=["GET", "POST", "PUT", "DELETE"]),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in portfolio API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3017)
+    parser.add_argument("--data", help=f"Projects JSON file (default: {DEFAULT_DATA} unless --size is given)")
+    parser.add_argument("--size", type=int, help="Serve a synthetic portfolio of this many projects")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests that hang for 60s")
+    args = parser.parse_args()
+
+    data = args.data or (None if args.size else DEFAULT_DATA)
+    projects = load_portfolio(data, args.size, args.seed)
+    api = MockPortfolioAPI(projects)
+    faults = FaultInjection(args.latency_ms, args.jitter_ms, args.error_rate, args.timeout_rate, args.seed)
+    print(f"Serving {len(projects)} projects at http://{args.host}:{args.port}/api "
+          f"({json.dumps(faults.as_dict())})")
+
+    import uvicorn
+    uvicorn.run(create_app(api, faults), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
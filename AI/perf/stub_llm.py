@@ -0,0 +1,221 @@
+"""
+OpenAI-compatible stub model server.
+Stands in for LM Studio when load testing the chat agent: answers
+`/v1/chat/completions` (streaming and non-streaming) with filler text at a
+configurable time to first token and token rate, and can replay scripted tool
+calls so agent runs exercise the MCP servers the way a real model would.
+
+Usage:
+    python stub_llm.py --port 1234 --ttft-ms 400 --tokens-per-second 40 --tokens 300
+    python stub_llm.py --script tool_scripts.json
+
+Point the chat agent at it with LMSTUDIO_BASE_URL=http://127.0.0.1:1234/v1.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from typing import List, Dict, Any, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+
+FILLER = (
+    "I built this project with a small team and focused on real-time graphics, "
+    "AI tooling and reliable delivery for live events across several seasons."
+).split()
+
+# Used when no --script is given: one overview call, then an answer
+DEFAULT_SCRIPTS: List[Dict[str, Any]] = [
+    {"match": ".*", "steps": [[{"name": "get_portfolio_digest", "arguments": {}}]]},
+]
+
+
+class StubModel:
+    """Generates completions for one request according to the timing and scripts."""
+
+    def __init__(self, ttft: float, tokens_per_second: float, tokens: int, jitter: float,
+                 scripts: Optional[List[Dict[str, Any]]] = None):
+        """
+        Args:
+            ttft: Seconds before the first token (or tool call) is sent
+            tokens_per_second: Rate at which answer tokens are sent
+            tokens: Answer length in tokens
+            jitter: Relative random variation applied to ttft and per-token delays
+            scripts: [{"match": regex, "steps": [[{"name", "arguments"}], ...], "tokens": n}];
+                the first script whose regex matches the latest user message is used, and
+                step N is sent after the model has already made N rounds of tool calls
+        """
+        self.ttft = ttft
+        self.token_delay = 1.0 / tokens_per_second if tokens_per_second > 0 else 0.0
+        self.tokens = tokens
+        self.jitter = jitter
+        self.scripts = [(re.compile(s.get("match", ".*"), re.IGNORECASE | re.DOTALL), s) for s in (scripts or [])]
+        self.requests = 0
+        # Answer tokens actually sent, and streams the client closed before the end
+        self.tokens_sent = 0
+        self.streams_abandoned = 0
+
+    def _delay(self, seconds: float) -> float:
+        if self.jitter:
+            seconds *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, seconds)
+
+    def plan(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Decide whether this turn makes tool calls or answers, and with how many tokens."""
+        messages = body.get("messages") or []
+        last_user = max((i for i, m in enumerate(messages) if m.get("role") == "user"), default=-1)
+        user_text = messages[last_user].get("content") if last_user >= 0 else ""
+        if isinstance(user_text, list):
+            user_text = " ".join(part.get("text", "") for part in user_text if isinstance(part, dict))
+        rounds = sum(1 for m in messages[last_user + 1:] if m.get("role") == "assistant" and m.get("tool_calls"))
+        available = {t.get("function", {}).get("name") for t in body.get("tools") or []}
+
+        for pattern, script in self.scripts:
+            if not pattern.search(user_text or ""):
+                continue
+            steps = script.get("steps") or []
+            if rounds < len(steps):
+                # Only call tools the agent actually offered
+                calls = [c for c in steps[rounds] if c["name"] in available]
+                if calls:
+                    return {"tool_calls": calls}
+            return {"tokens": script.get("tokens", self.tokens)}
+        return {"tokens": self.tokens}
+
+    def _tool_calls(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "index": i,
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": c["name"], "arguments": json.dumps(c.get("arguments", {}))},
+            }
+            for i, c in enumerate(calls)
+        ]
+
+    def _words(self, count: int) -> List[str]:
+        return [FILLER[i % len(FILLER)] + " " for i in range(count)]
+
+    async def complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests += 1
+        plan = self.plan(body)
+        await asyncio.sleep(self._delay(self.ttft))
+        message: Dict[str, Any] = {"role": "assistant", "content": None}
+        if "tool_calls" in plan:
+            message["tool_calls"] = self._tool_calls(plan["tool_calls"])
+            finish_reason, completion_tokens = "tool_calls", 0
+        else:
+            completion_tokens = plan["tokens"]
+            await asyncio.sleep(self._delay(self.token_delay * max(0, completion_tokens - 1)))
+            message["content"] = "".join(self._words(completion_tokens)).strip()
+            finish_reason = "stop"
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": completion_tokens, "total_tokens": completion_tokens},
+        }
+
+    async def stream(self, body: Dict[str, Any]):
+        self.requests += 1
+        plan = self.plan(body)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        def chunk(delta: Optional[Dict[str, Any]], finish_reason: Optional[str] = None,
+                  usage: Optional[Dict[str, int]] = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": body.get("model", "stub"),
+                "choices": [] if delta is None else [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            if usage is not None:
+                payload["usage"] = usage
+            return f"data: {json.dumps(payload)}\n\n"
+
+        finished = False
+        sent = 0
+        try:
+            await asyncio.sleep(self._delay(self.ttft))
+            if "tool_calls" in plan:
+                yield chunk({"role": "assistant", "tool_calls": self._tool_calls(plan["tool_calls"])})
+                yield chunk({}, "tool_calls")
+            else:
+                for i, word in enumerate(self._words(plan["tokens"])):
+                    if i:
+                        await asyncio.sleep(self._delay(self.token_delay))
+                    yield chunk({"role": "assistant", "content": word} if i == 0 else {"content": word})
+                    sent += 1
+                    self.tokens_sent += 1
+                yield chunk({}, "stop")
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield chunk(None, usage={"prompt_tokens": 0, "completion_tokens": sent, "total_tokens": sent})
+            yield "data: [DONE]\n\n"
+            finished = True
+        finally:
+            if not finished:
+                self.streams_abandoned += 1
+
+
+def create_app(model: StubModel) -> Starlette:
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if body.get("stream"):
+            return StreamingResponse(model.stream(body), media_type="text/event-stream")
+        return JSONResponse(await model.complete(body))
+
+    async def models(request: Request):
+        return JSONResponse({"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]})
+
+    async def stats(request: Request):
+        return JSONResponse({
+            "requests": model.requests,
+            "tokens_sent": model.tokens_sent,
+            "streams_abandoned": model.streams_abandoned,
+        })
+
+    return Starlette(routes=[
+        Route("/v1/chat/completions", chat_completions, methods=["POST"]),
+        Route("/v1/models", models, methods=["GET"]),
+        Route("/stats", stats, methods=["GET"]),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub model server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Time to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--tokens", type=int, default=200, help="Answer length in tokens")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Relative random variation of delays (0-1)")
+    parser.add_argument("--script", help="JSON file with tool-call scripts (see StubModel)")
+    parser.add_argument("--no-tools", action="store_true", help="Never make tool calls")
+    args = parser.parse_args()
+
+    scripts = DEFAULT_SCRIPTS
+    if args.script:
+        with open(args.script) as f:
+            scripts = json.load(f)
+    elif args.no_tools:
+        scripts = []
+
+    model = StubModel(args.ttft_ms / 1000, args.tokens_per_second, args.tokens, args.jitter, scripts)
+    import uvicorn
+    uvicorn.run(create_app(model), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
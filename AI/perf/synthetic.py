@@ -0,0 +1,90 @@
+"""
+Synthetic portfolio generator.
+Produces projects shaped like the portfolio API's responses (see data/projects.json),
+including the dirty technology spellings and client aliases found in real data, so
+the MCP servers' indexes are exercised realistically at any portfolio size.
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional
+
+
+TECHNOLOGIES = [
+    "Python", "python 3", "TypeScript", "JavaScript", "React", "ReactJS", "Next.js", "NextJS",
+    "Node.js", "FastAPI", "Docker", "Kubernetes", "PostgreSQL", "Postgres", "Redis", "AWS",
+    "Unreal Engine", "UE5", "Unreal Engine 5", "Unity", "Ventuz", "TouchDesigner", "Touch Designer",
+    "Blender", "After Effects", "MCP", "LangChain", "OpenAI", "PyTorch", "TensorFlow", "C++", "C#",
+    "Real-time Graphics", "Real Time Graphics", "Projection Systems", "Live Events", "API Integration",
+    "Figma", "Tailwind CSS", "Prisma", "Go", "Rust", "GraphQL", "WebSockets", "OpenCV",
+    "Leadership", "Mentoring junior developers", "Coordinating with production teams",
+]
+
+CLIENTS = [None, None, None, "Riot Games", "Quince Imaging", "NHL", "Acme Studios", "Northwind Media",
+           "Contoso Events", "Fabrikam Labs"]
+
+# Work for a client is often titled by product or event rather than the client name
+CLIENT_TITLES = {
+    "Riot Games": ["VCT Masters Broadcast", "MSI Stage Graphics", "LCS Finals Overlay", "Valorant Champions Show"],
+    "NHL": ["Arena Stats Wall", "Playoffs Projection"],
+}
+
+CATEGORIES = ["ai", "real-time-graphics", "web", "mobile", "other"]
+WORDS = (
+    "agent pipeline broadcast graphics realtime dashboard automation server projection arena "
+    "stats visualizer workflow integration tooling engine render shader control cue show live "
+    "event data model retrieval search api client deployment monitoring overlay scoreboard "
+    "interactive installation kiosk touchscreen camera tracking pipeline editor plugin"
+).split()
+
+
+def generate_project(rng: random.Random, index: int) -> Dict[str, Any]:
+    start = date(2012, 1, 1) + timedelta(days=rng.randint(0, 14 * 365))
+    status = rng.choices(["completed", "ongoing", "planned"], weights=[7, 2, 1])[0]
+    end = None if status == "ongoing" else start + timedelta(days=rng.randint(14, 900))
+    client = rng.choice(CLIENTS)
+    if client in CLIENT_TITLES and rng.random() < 0.7:
+        title = f"{rng.choice(CLIENT_TITLES[client])} {start.year}"
+    else:
+        title = " ".join(w.capitalize() for w in rng.sample(WORDS, 3))
+    description = " ".join(rng.choices(WORDS, k=rng.randint(10, 25))).capitalize() + "."
+    created = f"{start.isoformat()}T00:00:00Z"
+    return {
+        "id": f"synthetic-{index:06d}",
+        "title": title,
+        "description": description,
+        "longDescription": " ".join(rng.choices(WORDS, k=rng.randint(40, 120))).capitalize() + ".",
+        "startDate": start.isoformat(),
+        "endDate": end.isoformat() if end else None,
+        "status": status,
+        "technologies": rng.sample(TECHNOLOGIES, rng.randint(3, 8)),
+        "category": rng.choice(CATEGORIES),
+        "client": client,
+        "role": rng.choice(["AI Engineer", "Technical Director", "Real-time Graphics Developer", "Full Stack Developer"]),
+        "responsibilities": [" ".join(rng.choices(WORDS, k=5)).capitalize() for _ in range(rng.randint(1, 4))],
+        "impact": " ".join(rng.choices(WORDS, k=12)).capitalize() + ".",
+        "images": [],
+        "videoUrl": None,
+        "githubUrl": None,
+        "liveUrl": None,
+        "featured": rng.random() < 0.1,
+        "order": rng.randint(0, 100),
+        "createdAt": created,
+        "updatedAt": created,
+    }
+
+
+def generate_portfolio(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate `size` projects; the same seed always yields the same portfolio."""
+    rng = random.Random(seed)
+    return [generate_project(rng, i) for i in range(size)]
+
+
+def load_portfolio(path: Optional[str] = None, size: Optional[int] = None, seed: int = 0) -> List[Dict[str, Any]]:
+    """Load projects from a JSON file (a list or {"projects": [...]}) or generate `size` of them."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data["projects"] if isinstance(data, dict) else data
+    return generate_portfolio(size or 10, seed)
@@ -0,0 +1,118 @@
+"""
+Rebuild a chat run's timeline from span files written by tracing.py.
+Merges the TRACE_EXPORT_FILE of every service (chat agent, MCP servers), picks
+one trace and prints its spans as an indented timeline, followed by how the
+run's time splits between model generation, MCP tool calls and the portfolio API.
+
+Usage:
+    python trace_view.py agent-spans.jsonl mcp-spans.jsonl --run-id 3f0c...
+    python trace_view.py spans/*.jsonl --latest
+    python trace_view.py spans/*.jsonl --list
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import uuid
+from collections import defaultdict
+from typing import List, Dict, Any
+
+
+def trace_id_for_run(run_id: str) -> str:
+    """Same derivation as tracing.trace_id_for_run."""
+    try:
+        return uuid.UUID(run_id).hex
+    except (ValueError, AttributeError, TypeError):
+        return hashlib.sha256(str(run_id).encode()).hexdigest()[:32]
+
+
+def load_spans(paths: List[str]) -> List[Dict[str, Any]]:
+    spans = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            spans.extend(json.loads(line) for line in f if line.strip())
+    return spans
+
+
+def print_timeline(spans: List[Dict[str, Any]]) -> None:
+    by_id = {s["span_id"]: s for s in spans}
+    children = defaultdict(list)
+    roots = []
+    for span in spans:
+        if span["parent_id"] in by_id:
+            children[span["parent_id"]].append(span)
+        else:
+            roots.append(span)
+    origin = min(s["start_time"] for s in spans)
+
+    def show(span: Dict[str, Any], depth: int) -> None:
+        offset = (span["start_time"] - origin) * 1000
+        marker = " !" if span["status"] == "error" else ""
+        detail = span["attributes"].get("url") or span["attributes"].get("error") or ""
+        print(f"{offset:10.1f}ms {span['duration_ms']:10.1f}ms  {'  ' * depth}{span['name']} "
+              f"[{span['service']}]{marker} {detail}".rstrip())
+        for child in sorted(children[span["span_id"]], key=lambda s: s["start_time"]):
+            show(child, depth + 1)
+
+    print(f"{'offset':>12} {'duration':>12}  span")
+    for root in sorted(roots, key=lambda s: s["start_time"]):
+        show(root, 0)
+
+
+def breakdown(spans: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Split agent.run time into tool calls (as seen by the agent) and the rest (model generation)."""
+    def total(predicate) -> float:
+        return sum(s["duration_ms"] for s in spans if predicate(s))
+
+    agent_run = total(lambda s: s["name"] == "agent.run")
+    tool_calls = total(lambda s: s["name"].startswith("tool_call "))
+    return {
+        "chat_run_ms": total(lambda s: s["name"] == "chat.run"),
+        "agent_run_ms": agent_run,
+        "model_ms (agent.run minus tool calls)": max(0.0, agent_run - tool_calls),
+        "tool_calls_ms (agent side)": tool_calls,
+        "mcp_tools_ms (server side)": total(lambda s: s["name"].startswith("tool ")),
+        "portfolio_api_ms": total(lambda s: s["name"].startswith("HTTP ") and "/api/" in s["attributes"].get("url", "")),
+        "stream_ms": total(lambda s: s["name"] == "stream"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show one run's trace from tracing.py span files")
+    parser.add_argument("files", nargs="+", help="Span JSONL files from every service")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--run-id", help="AG-UI run_id of the chat run")
+    group.add_argument("--trace-id")
+    group.add_argument("--latest", action="store_true", help="Most recently started chat run")
+    group.add_argument("--list", action="store_true", help="List chat runs in the files")
+    args = parser.parse_args()
+
+    spans = load_spans(args.files)
+    runs = sorted((s for s in spans if s["name"] == "chat.run"), key=lambda s: s["start_time"])
+    if args.list or not (args.run_id or args.trace_id or args.latest):
+        for run in runs:
+            print(f"{run['attributes'].get('run_id')}  {run['duration_ms']:10.1f}ms  {run['status']}")
+        return
+
+    if args.run_id:
+        trace_id = trace_id_for_run(args.run_id)
+    elif args.trace_id:
+        trace_id = args.trace_id
+    else:
+        if not runs:
+            sys.exit("No chat runs found")
+        trace_id = runs[-1]["trace_id"]
+
+    trace = [s for s in spans if s["trace_id"] == trace_id]
+    if not trace:
+        sys.exit(f"No spans for trace {trace_id}")
+    print(f"Trace {trace_id}: {len(trace)} spans")
+    print_timeline(trace)
+    print()
+    for name, value in breakdown(trace).items():
+        print(f"{name:>40}: {value:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
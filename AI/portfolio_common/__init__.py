@@ -0,0 +1,6 @@
+"""
+Modules shared by the chat agent (AI/agno-agent) and the portfolio MCP server
+(AI/hugo-portfolio-management): run deadlines, trace propagation and slow-call
+profiling. Both sides import them from here so the two ends of a deadline or a
+trace always agree on the wire format.
+"""
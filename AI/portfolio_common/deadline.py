@@ -0,0 +1,118 @@
+"""
+End-to-end deadlines shared by the chat agent and the MCP servers.
+A chat run gets a deadline when it starts. The agent sends the seconds left with
+every MCP tool call in the request's `_meta`, so pooled sessions can be shared
+by runs with different deadlines and no clock agreement between hosts is needed.
+Other callers can send an `X-Request-Deadline` header instead (absolute Unix time
+in seconds; that only works across hosts with synchronized clocks). The server
+abandons tool calls that outlive the deadline, and DeadlineTransport caps every
+upstream HTTP request to the time that is left, so one slow dependency fails
+fast instead of holding the chat run, its connection and an LLM slot open.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import httpx
+
+from .mcp_meta import request_meta
+
+
+DEADLINE_HEADER = "x-request-deadline"
+# Tool call `_meta` key holding the seconds left when the call was sent
+DEADLINE_META = "deadline_seconds"
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def parse_deadline(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (negative once expired), or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]):
+    """Make `deadline` (Unix time) the current deadline inside the block."""
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_meta(meta: Optional[dict] = None) -> Optional[dict]:
+    """Tool call `_meta` with the seconds left before the current deadline added, if there is one."""
+    left = remaining()
+    if left is None:
+        return meta
+    return {**(meta or {}), DEADLINE_META: round(left, 3)}
+
+
+def _meta_deadline(context) -> Optional[float]:
+    """Deadline (Unix time) from a tool call's `_meta`, or None without one."""
+    try:
+        return time.time() + float(request_meta(context)[DEADLINE_META])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class DeadlineTransport(httpx.AsyncBaseTransport):
+    """httpx transport that fits each request's timeouts into the current deadline."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        left = remaining()
+        if left is None:
+            return await self._transport.handle_async_request(request)
+        if left <= 0:
+            raise httpx.TimeoutException("Deadline exceeded before the request was sent", request=request)
+        timeouts = request.extensions.get("timeout", {})
+        request.extensions["timeout"] = {
+            key: left if timeouts.get(key) is None else min(timeouts[key], left)
+            for key in ("connect", "read", "write", "pool")
+        }
+        try:
+            return await asyncio.wait_for(self._transport.handle_async_request(request), timeout=left)
+        except asyncio.TimeoutError:
+            raise httpx.TimeoutException(f"Deadline exceeded after {left:.1f}s", request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def deadline_middleware():
+    """FastMCP middleware that runs each tool call under the caller's deadline (call `_meta` or `X-Request-Deadline`)."""
+    from fastmcp.exceptions import ToolError
+    from fastmcp.server.dependencies import get_http_headers
+    from fastmcp.server.middleware import Middleware
+
+    class DeadlineMiddleware(Middleware):
+        async def on_call_tool(self, context, call_next):
+            deadline = _meta_deadline(context)
+            if deadline is None:
+                deadline = parse_deadline(get_http_headers().get(DEADLINE_HEADER))
+            if deadline is None:
+                return await call_next(context)
+            with deadline_scope(deadline):
+                left = remaining()
+                if left <= 0:
+                    raise ToolError(f"Deadline exceeded before {context.message.name} started")
+                try:
+                    return await asyncio.wait_for(call_next(context), timeout=left)
+                except asyncio.TimeoutError:
+                    raise ToolError(f"Deadline exceeded: {context.message.name} cancelled after {left:.1f}s")
+
+    return DeadlineMiddleware()
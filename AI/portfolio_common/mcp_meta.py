@@ -0,0 +1,41 @@
+"""
+Per-call MCP request metadata.
+The chat agent shares pooled MCP sessions between runs, so whatever belongs to
+one run (its deadline, its trace) cannot ride on a session's HTTP headers. It
+travels in each tool call's `_meta` instead: send_call_meta makes a fastmcp
+Client add it to every call, and request_meta reads it back in server middleware.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+MetaProvider = Callable[[Optional[dict]], Optional[dict]]
+
+
+def send_call_meta(client, *providers: MetaProvider) -> None:
+    """
+    Make a connected fastmcp Client pass each tool call's `_meta` through `providers`.
+
+    Args:
+        client: fastmcp Client; wrapping it again is a no-op
+        providers: Functions returning the given meta with their keys added
+    """
+    if getattr(client, "_sends_call_meta", False):
+        return
+    call_tool = client.call_tool
+
+    async def call_tool_with_meta(name, arguments=None, *, meta=None, **kwargs):
+        for provider in providers:
+            meta = provider(meta)
+        return await call_tool(name, arguments, meta=meta, **kwargs)
+
+    client.call_tool = call_tool_with_meta
+    client._sends_call_meta = True
+
+
+def request_meta(context) -> Dict[str, Any]:
+    """The `_meta` of the request behind a FastMCP middleware context (empty without one)."""
+    request_context = getattr(context.fastmcp_context, "request_context", None)
+    meta = getattr(request_context, "meta", None) or getattr(context.message, "meta", None)
+    if meta is None:
+        return {}
+    return meta if isinstance(meta, dict) else meta.model_dump()
@@ -0,0 +1,213 @@
+"""
+Opt-in profiler for slow MCP tool calls and chat runs.
+When PROFILE_SLOW_CALLS_DIR is set, every profiled call is recorded, and calls
+slower than PROFILE_SLOW_CALLS_MS are written to that directory along with
+their arguments and context (such as the snapshot version). Faster calls are
+discarded.
+
+Two modes (PROFILE_MODE):
+- sample (default): a background thread samples the event loop thread's stack
+  every PROFILE_SAMPLE_INTERVAL_MS and writes collapsed stacks (flame graph input).
+  Overhead is low enough to leave on in production.
+- cprofile: deterministic cProfile of the call, written as a .prof file plus a
+  text summary. Only one call is profiled at a time; calls overlapping it fall
+  back to sampling.
+
+Both modes see the whole event loop thread, so concurrent calls show up in each
+other's profiles; the metadata records how many calls were in flight.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable
+
+
+def _collapse(frame) -> str:
+    """Render a frame's stack root-first as `file:function;file:function;...`."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class _Sampler:
+    """Samples one thread's stack while at least one recording is active."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self._recordings: Dict[int, Counter] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        threading.Thread(target=self._run, name="slow-call-sampler", daemon=True).start()
+
+    def add(self, samples: Counter) -> None:
+        with self._lock:
+            self._recordings[id(samples)] = samples
+        self._wake.set()
+
+    def remove(self, samples: Counter) -> None:
+        with self._lock:
+            self._recordings.pop(id(samples), None)
+
+    def _run(self) -> None:
+        while True:
+            if not self._recordings:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                stack = _collapse(frame)
+                with self._lock:
+                    for samples in self._recordings.values():
+                        samples[stack] += 1
+            del frame
+            time.sleep(self.interval)
+
+
+class SlowCallProfiler:
+    """Profiles calls and keeps the ones slower than the threshold."""
+
+    def __init__(self, directory: str, threshold_ms: float = 1000.0, mode: str = "sample",
+                 interval_ms: float = 5.0):
+        self.directory = directory
+        self.threshold_ms = threshold_ms
+        self.mode = mode
+        self.interval = interval_ms / 1000
+        self.in_flight = 0
+        self.written = 0
+        self._sampler: Optional[_Sampler] = None
+        self._cprofile_busy = False
+        os.makedirs(directory, exist_ok=True)
+
+    @asynccontextmanager
+    async def profile(self, kind: str, name: str, metadata: Optional[Dict[str, Any]] = None,
+                      context: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Profile the body of the `async with` block.
+
+        Args:
+            kind: "tool" or "chat_run"
+            name: Tool name or run label, used in the file name
+            metadata: Recorded with the profile (e.g. tool arguments)
+            context: Called after a slow call to add state such as the snapshot version
+        """
+        profiler = None
+        samples = None
+        if self.mode == "cprofile" and not self._cprofile_busy:
+            self._cprofile_busy = True
+            profiler = cProfile.Profile()
+        else:
+            if self._sampler is None:
+                self._sampler = _Sampler(threading.get_ident(), self.interval)
+            samples = Counter()
+            self._sampler.add(samples)
+
+        self.in_flight += 1
+        peak_in_flight = self.in_flight
+        started = time.perf_counter()
+        error = None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._cprofile_busy = False
+            else:
+                self._sampler.remove(samples)
+            peak_in_flight = max(peak_in_flight, self.in_flight)
+            self.in_flight -= 1
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= self.threshold_ms:
+                record = {
+                    "kind": kind,
+                    "name": name,
+                    "duration_ms": round(duration_ms, 3),
+                    "threshold_ms": self.threshold_ms,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "mode": "cprofile" if profiler is not None else "sample",
+                    "calls_in_flight": peak_in_flight,
+                    "error": error,
+                    **(metadata or {}),
+                }
+                if context is not None:
+                    try:
+                        record.update(context())
+                    except Exception as e:
+                        record["context_error"] = str(e)
+                self._write(record, profiler, samples)
+
+    def _write(self, record: Dict[str, Any], profiler: Optional[cProfile.Profile], samples: Optional[Counter]) -> None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", record["name"])[:60]
+        base = os.path.join(self.directory, f"{stamp}-{record['kind']}-{safe_name}-{uuid.uuid4().hex[:6]}")
+        if profiler is not None:
+            profiler.dump_stats(base + ".prof")
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+            record["profile"] = os.path.basename(base + ".prof")
+            record["top_functions"] = summary.getvalue()
+        else:
+            with open(base + ".collapsed", "w", encoding="utf-8") as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            record["profile"] = os.path.basename(base + ".collapsed")
+            record["samples"] = sum(samples.values())
+            record["top_stacks"] = [{"stack": s.split(";")[-8:], "samples": c} for s, c in samples.most_common(10)]
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2, default=str)
+        self.written += 1
+
+
+_profiler: Optional[SlowCallProfiler] = None
+
+
+def get_profiler() -> Optional[SlowCallProfiler]:
+    """Return the process-wide profiler, or None when PROFILE_SLOW_CALLS_DIR is unset."""
+    global _profiler
+    directory = os.getenv('PROFILE_SLOW_CALLS_DIR')
+    if not directory:
+        return None
+    if _profiler is None:
+        _profiler = SlowCallProfiler(
+            directory,
+            threshold_ms=float(os.getenv('PROFILE_SLOW_CALLS_MS', '1000')),
+            mode=os.getenv('PROFILE_MODE', 'sample'),
+            interval_ms=float(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', '5')),
+        )
+    return _profiler
+
+
+def slow_tool_call_middleware(context: Optional[Callable[[], Dict[str, Any]]] = None):
+    """FastMCP middleware profiling tool calls; `context` adds state such as the snapshot version."""
+    from fastmcp.server.middleware import Middleware
+
+    class SlowToolCallMiddleware(Middleware):
+        async def on_call_tool(self, middleware_context, call_next):
+            profiler = get_profiler()
+            if profiler is None:
+                return await call_next(middleware_context)
+            message = middleware_context.message
+            async with profiler.profile("tool", message.name, {"arguments": message.arguments}, context):
+                return await call_next(middleware_context)
+
+    return SlowToolCallMiddleware()
@@ -0,0 +1,206 @@
+"""
+Lightweight distributed tracing shared by the chat agent and the MCP servers.
+Spans carry W3C `traceparent` context across process boundaries (chat agent ->
+MCP server -> portfolio API) and are appended as JSON lines to TRACE_EXPORT_FILE.
+Tracing is off unless TRACE_EXPORT_FILE is set. Span files from every service
+can be merged and read back with AI/perf/trace_view.py.
+"""
+
+import hashlib
+import json
+import os
+import re
+import secrets
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Tuple
+
+import httpx
+
+from .mcp_meta import request_meta
+
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# Tool call `_meta` key carrying the caller's traceparent. Not plain "traceparent", which
+# fastmcp fills from OpenTelemetry when that is active.
+TRACEPARENT_META = "portfolio/traceparent"
+
+_service_name = os.getenv('TRACE_SERVICE_NAME', 'portfolio')
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def configure(service_name: str) -> None:
+    """Set the service name recorded on spans, unless TRACE_SERVICE_NAME overrides it."""
+    global _service_name
+    _service_name = os.getenv('TRACE_SERVICE_NAME', service_name)
+
+
+def enabled() -> bool:
+    return bool(os.getenv('TRACE_EXPORT_FILE'))
+
+
+class JsonlExporter:
+    """Appends finished spans to a JSONL file, one object per line."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._file = None
+
+    def export(self, record: Dict[str, Any]) -> None:
+        path = os.getenv('TRACE_EXPORT_FILE')
+        if not path:
+            return
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if path != self._path:
+                if self._file:
+                    self._file.close()
+                self._file = open(path, "a", encoding="utf-8", buffering=1)
+                self._path = path
+            self._file.write(line)
+
+
+exporter = JsonlExporter()
+
+
+def trace_id_for_run(run_id: str) -> str:
+    """Derive a stable 32-hex trace ID from a run ID, so a run's spans can be found by run_id."""
+    try:
+        return uuid.UUID(run_id).hex
+    except (ValueError, AttributeError, TypeError):
+        return hashlib.sha256(str(run_id).encode()).hexdigest()[:32]
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Return (trace ID, parent span ID) from a W3C traceparent header, or None."""
+    match = TRACEPARENT_RE.match((header or "").strip().lower())
+    return (match.group(1), match.group(2)) if match else None
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None, attributes: Dict[str, Any] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.status = "ok"
+        self.start_time = time.time()
+        self._started = time.perf_counter()
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = "error"
+        self.attributes["error"] = message
+
+    def finish(self) -> None:
+        exporter.export({
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "service": _service_name,
+            "start_time": self.start_time,
+            "duration_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        })
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, traceparent: Optional[str] = None, trace_id: Optional[str] = None, **attributes):
+    """
+    Start a span as a child of, in order of preference: the `traceparent`
+    header, the current span, or a new root in `trace_id` (random if omitted).
+    Yields None when tracing is disabled.
+    """
+    if not enabled():
+        yield None
+        return
+    remote = parse_traceparent(traceparent)
+    parent = current_span()
+    if remote:
+        span = Span(name, remote[0], remote[1], attributes)
+    elif parent is not None:
+        span = Span(name, parent.trace_id, parent.span_id, attributes)
+    else:
+        span = Span(name, trace_id or secrets.token_hex(16), None, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_error(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Async generators closed from another task run in a different context
+            pass
+        span.finish()
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records a client span per request and sends `traceparent` downstream."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if current_span() is None:
+            return await self._transport.handle_async_request(request)
+        with start_span(f"HTTP {request.method}", method=request.method, url=str(request.url)) as span:
+            request.headers["traceparent"] = span.traceparent
+            response = await self._transport.handle_async_request(request)
+            span.set_attribute("status_code", response.status_code)
+            if response.status_code >= 500:
+                span.status = "error"
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def trace_meta(meta: Optional[dict] = None) -> Optional[dict]:
+    """Tool call `_meta` with the current span's traceparent added, if there is one."""
+    span = current_span()
+    if span is None:
+        return meta
+    return {**(meta or {}), TRACEPARENT_META: span.traceparent}
+
+
+def tool_tracing_middleware():
+    """FastMCP middleware that continues the caller's trace (call `_meta` or `traceparent` header) for every tool call."""
+    from fastmcp.server.dependencies import get_http_headers
+    from fastmcp.server.middleware import Middleware
+
+    class ToolTracingMiddleware(Middleware):
+        async def on_call_tool(self, context, call_next):
+            traceparent = request_meta(context).get(TRACEPARENT_META) or get_http_headers().get("traceparent")
+            with start_span(f"tool {context.message.name}", traceparent=traceparent,
+                            tool=context.message.name, arguments=context.message.arguments) as span:
+                result = await call_next(context)
+                if span is not None:
+                    structured = getattr(result, "structured_content", None)
+                    if isinstance(structured, dict) and "error" in structured:
+                        span.set_error(str(structured["error"]))
+                return result
+
+    return ToolTracingMiddleware()
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { updateProject, deleteProject } from '@/lib/database';
+import { notifyProjectsChanged } from '@/lib/mcpInvalidation';
 
 export async function PUT(
   request: NextRequest,
@@ -16,6 +17,7 @@ export async function PUT(
       );
     }
 
+    await notifyProjectsChanged([params.id]);
     return NextResponse.json(project);
   } catch (error) {
     console.error('Error updating project:', error);
@@ -40,6 +42,7 @@ export async function DELETE(
       );
     }
 
+    await notifyProjectsChanged([params.id]);
     return NextResponse.json({ success: true });
   } catch (error) {
     console.error('Error deleting project:', error);
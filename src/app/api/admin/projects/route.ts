@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { createProject } from '@/lib/database';
+import { notifyProjectsChanged } from '@/lib/mcpInvalidation';
 
 export async function POST(request: NextRequest) {
   try {
@@ -14,6 +15,7 @@ export async function POST(request: NextRequest) {
     }
 
     const project = await createProject(projectData);
+    await notifyProjectsChanged([project.id]);
     return NextResponse.json(project);
   } catch (error) {
     console.error('Error creating project:', error);
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getProjectById, updateProject, deleteProject } from '@/lib/database';
+import { notifyProjectsChanged } from '@/lib/mcpInvalidation';
 
 export async function GET(
   request: NextRequest,
@@ -42,6 +43,7 @@ export async function PUT(
       );
     }
     
+    await notifyProjectsChanged([id]);
     return NextResponse.json(updatedProject);
   } catch (error) {
     console.error('Error updating project:', error);
@@ -67,6 +69,7 @@ export async function DELETE(
       );
     }
     
+    await notifyProjectsChanged([id]);
     return NextResponse.json({ message: 'Project deleted successfully' });
   } catch (error) {
     console.error('Error deleting project:', error);
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getProjects, getFeaturedProjects, searchProjects, createProject, getProjectsByCategory } from '@/lib/database';
+import { notifyProjectsChanged } from '@/lib/mcpInvalidation';
 
 export async function GET(request: NextRequest) {
   try {
@@ -73,6 +74,7 @@ export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
     const newProject = await createProject(body);
+    await notifyProjectsChanged([newProject.id]);
     
     return NextResponse.json(newProject, { status: 201 });
   } catch (error) {
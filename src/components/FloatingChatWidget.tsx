@@ -16,6 +16,18 @@ interface FloatingChatWidgetProps {
   className?: string;
 }
 
+// Reconnects per answer when the stream drops; the agent replays the events missed
+const MAX_RESUME_ATTEMPTS = 3;
+
+// Unguessable run IDs: a run's answer can be replayed by anyone who knows its thread and run ID.
+// randomUUID needs a secure context, which the plain-http dev host is not.
+function newRunId(): string {
+  if (typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return Array.from(crypto.getRandomValues(new Uint8Array(16)), b => b.toString(16).padStart(2, '0')).join('');
+}
+
 export default function FloatingChatWidget({ className = '' }: FloatingChatWidgetProps) {
   const [isOpen, setIsOpen] = useState(false);
   const [isMinimized, setIsMinimized] = useState(false);
@@ -130,7 +142,7 @@ export default function FloatingChatWidget({ className = '' }: FloatingChatWidge
 
       const requestData = {
         thread_id: threadId, // Use consistent thread ID for the session
-        run_id: `run_${Date.now()}`,
+        run_id: newRunId(),
         messages: conversationHistory,
         tools: []
       };
@@ -165,70 +177,128 @@ export default function FloatingChatWidget({ className = '' }: FloatingChatWidge
         return;
       }
 
-      // Send request to AG-UI server
-      const response = await fetch(aguiServerUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Accept': 'text/event-stream',
-        },
-        body: JSON.stringify(requestData),
-      });
-
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-
-      // Create assistant message for streaming
+      // Send request to AG-UI server. If the stream drops before the run finishes, the same
+      // request is sent again with Last-Event-ID and the agent resumes the run where it left off.
       const assistantMessageId = (Date.now() + 1).toString();
-      const assistantMessage: Message = {
-        id: assistantMessageId,
-        content: '',
-        role: 'assistant',
-        timestamp: new Date(),
-      };
-
-      setMessages(prev => [...prev, assistantMessage]);
+      let assistantMessageAdded = false;
+      // ID of the last event whose data was applied; resends always carry it (0 before any event)
+      let lastEventId = '0';
+      let runEnded = false;
+      let runError = '';
+      // Set once a run that could not be resumed has been started again under a new run_id
+      let restarted = false;
+
+      for (let attempt = 0; !runEnded; attempt++) {
+        if (attempt > 0) {
+          if (attempt > MAX_RESUME_ATTEMPTS) {
+            throw new Error('The connection was lost');
+          }
+          await new Promise(resolve => setTimeout(resolve, 1000 * attempt));
+        }
 
-      // Read the stream
-      const reader = response.body?.getReader();
-      if (!reader) {
-        throw new Error('No response body');
-      }
+        let response: Response;
+        try {
+          response = await fetch(aguiServerUrl, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+              'Accept': 'text/event-stream',
+              ...(attempt > 0 ? { 'Last-Event-ID': lastEventId } : {}),
+            },
+            body: JSON.stringify(requestData),
+          });
+        } catch (fetchError) {
+          console.warn('Failed to reach the AG-UI server, retrying:', fetchError);
+          continue;
+        }
 
-      const decoder = new TextDecoder();
-      let buffer = '';
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
 
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
+        if (!assistantMessageAdded) {
+          // Create assistant message for streaming
+          const assistantMessage: Message = {
+            id: assistantMessageId,
+            content: '',
+            role: 'assistant',
+            timestamp: new Date(),
+          };
+          setMessages(prev => [...prev, assistantMessage]);
+          assistantMessageAdded = true;
+        }
 
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || '';
+        // Read the stream
+        const reader = response.body?.getReader();
+        if (!reader) {
+          throw new Error('No response body');
+        }
 
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            try {
-              const eventData = JSON.parse(line.slice(6));
-              
-              if (eventData.type === 'text_message_content') {
-                // Update the assistant message with new content
-                setMessages(prev => prev.map(msg => 
-                  msg.id === assistantMessageId 
-                    ? { ...msg, content: msg.content + eventData.delta }
-                    : msg
-                ));
-              } else if (eventData.type === 'run_error') {
-                throw new Error(eventData.message);
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let pendingEventId = '';
+
+        try {
+          while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop() || '';
+
+            for (const line of lines) {
+              if (line.startsWith('id: ')) {
+                // Only committed once the event's data has been applied, so a drop in between replays it
+                pendingEventId = line.slice(4);
+              } else if (line.startsWith('data: ')) {
+                try {
+                  const eventData = JSON.parse(line.slice(6));
+
+                  if (eventData.type === 'run_error' && eventData.code === 'resume_unavailable' && !restarted) {
+                    // The events we missed are gone: drop the partial answer and run the request again
+                    restarted = true;
+                    requestData.run_id = newRunId();
+                    lastEventId = '0';
+                    pendingEventId = '';
+                    attempt = -1;
+                    setMessages(prev => prev.map(msg =>
+                      msg.id === assistantMessageId ? { ...msg, content: '' } : msg
+                    ));
+                    continue;
+                  }
+                  if (eventData.type === 'run_finished' || eventData.type === 'run_error') {
+                    runEnded = true;
+                  }
+                  if (eventData.type === 'text_message_content') {
+                    // Update the assistant message with new content
+                    setMessages(prev => prev.map(msg =>
+                      msg.id === assistantMessageId
+                        ? { ...msg, content: msg.content + eventData.delta }
+                        : msg
+                    ));
+                  } else if (eventData.type === 'run_error') {
+                    runError = eventData.message;
+                  }
+                } catch (parseError) {
+                  console.warn('Failed to parse SSE event:', parseError);
+                }
+                if (pendingEventId) {
+                  lastEventId = pendingEventId;
+                  pendingEventId = '';
+                }
               }
-            } catch (parseError) {
-              console.warn('Failed to parse SSE event:', parseError);
             }
           }
+        } catch (streamError) {
+          console.warn('Chat stream interrupted, resuming:', streamError);
         }
       }
 
+      if (runError) {
+        throw new Error(runError);
+      }
+
     } catch (error) {
       console.error('Error sending message:', error);
       const errorMessage: Message = {
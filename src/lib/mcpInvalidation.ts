@@ -0,0 +1,42 @@
+// Notifies the MCP servers that projects changed so they can patch their
+// snapshot caches instead of waiting for the TTL to expire.
+//
+// MCP_INVALIDATION_URLS is a comma-separated list of webhook URLs, e.g.
+// "http://mcp-server:8017/invalidate,http://mcp-management:8019/invalidate".
+
+const INVALIDATION_TIMEOUT_MS = 2000;
+
+export async function notifyProjectsChanged(projectIds: string[]): Promise<void> {
+  const urls = (process.env.MCP_INVALIDATION_URLS || '')
+    .split(',')
+    .map(url => url.trim())
+    .filter(Boolean);
+  const token = process.env.MCP_INVALIDATION_TOKEN;
+
+  if (urls.length === 0 || !token || projectIds.length === 0) {
+    return;
+  }
+
+  // A failed notification must never fail the admin write; the MCP servers
+  // fall back to their snapshot TTL.
+  await Promise.allSettled(
+    urls.map(async url => {
+      try {
+        const response = await fetch(url, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            Authorization: `Bearer ${token}`,
+          },
+          body: JSON.stringify({ project_ids: projectIds }),
+          signal: AbortSignal.timeout(INVALIDATION_TIMEOUT_MS),
+        });
+        if (!response.ok) {
+          console.error(`MCP invalidation to ${url} failed with status ${response.status}`);
+        }
+      } catch (error) {
+        console.error(`MCP invalidation to ${url} failed:`, error);
+      }
+    })
+  );
+}